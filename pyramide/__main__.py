@@ -0,0 +1,140 @@
+import argparse
+import contextlib
+import itertools
+import json
+import sys
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from pyramide.challenge import Challenge
+from pyramide.game import NotValidProblemError
+from pyramide.placement_table import PlacementTable
+from pyramide.puzzle_file import parse_challenges, solution_to_json
+from pyramide.solution_database import SolutionDatabase
+from pyramide.solved_game import SolvedGame
+from pyramide.solver_pool import SolverPool
+from pyramide.standard_set import get_placement_table
+
+
+def _print_line(data: dict[str, Any]) -> None:
+    print(json.dumps(data, separators=(",", ":")), flush=True)
+
+
+def _print_solutions(challenge: Challenge, solutions: Iterable[SolvedGame]) -> int:
+    solution_count = 0
+    for solution in solutions:
+        _print_line(
+            {"challenge": challenge.name, "solution": solution_to_json(solution)}
+        )
+        solution_count += 1
+    return solution_count
+
+
+def _solve(
+    challenge: Challenge,
+    table: PlacementTable,
+    pool: SolverPool | None,
+    limit: int | None,
+    count_only: bool,
+) -> None:
+    try:
+        game = challenge.game(table)
+    except NotValidProblemError:
+        solution_count = 0
+    else:
+        parallel = pool is not None
+        if count_only:
+            solution_count = game.count_solutions(parallel, pool=pool)
+        else:
+            solution_count = _print_solutions(
+                challenge, game.solve(parallel, pool=pool, limit=limit)
+            )
+    _print_line({"challenge": challenge.name, "solution_count": solution_count})
+
+
+def _look_up(
+    challenge: Challenge,
+    database: SolutionDatabase,
+    limit: int | None,
+    count_only: bool,
+) -> None:
+    if count_only:
+        solution_count = database.count(challenge)
+    else:
+        solution_count = _print_solutions(
+            challenge, itertools.islice(database.solutions(challenge), limit)
+        )
+    _print_line({"challenge": challenge.name, "solution_count": solution_count})
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Solves the challenges of puzzle files on the standard pieces and board.
+
+    Every solution is printed as a JSON line as soon as it is found, followed
+    by a line with the number of solutions of the challenge. With a solution
+    database the solutions are looked up instead of searched. A challenge that
+    does not fit the board gets an error line instead. Returns the exit
+    status, 1 if any challenge failed.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m pyramide",
+        description="Solve the challenges of puzzle files, see pyramide.puzzle_file.",
+    )
+    parser.add_argument(
+        "files", type=Path, nargs="+", help="puzzle files, - for standard input"
+    )
+    modes = parser.add_mutually_exclusive_group()
+    modes.add_argument(
+        "--limit", type=int, help="print at most this many solutions per challenge"
+    )
+    modes.add_argument(
+        "--count", action="store_true", help="only print the number of solutions"
+    )
+    sources = parser.add_mutually_exclusive_group()
+    sources.add_argument(
+        "--parallel", action="store_true", help="search every challenge on all cores"
+    )
+    sources.add_argument(
+        "--database",
+        type=Path,
+        help="look the solutions up in a database of scripts.build_solution_database",
+    )
+    arguments = parser.parse_args(argv)
+    if arguments.limit is not None and arguments.limit < 1:
+        parser.error("--limit must be positive")
+
+    challenges: list[Challenge] = []
+    for path in arguments.files:
+        text = sys.stdin.read() if str(path) == "-" else path.read_text()
+        try:
+            challenges.extend(parse_challenges(text))
+        except ValueError as error:
+            parser.error(f"{path}: {error}")
+
+    table = get_placement_table()
+    failed = False
+    with contextlib.ExitStack() as stack:
+        pool = stack.enter_context(SolverPool(table)) if arguments.parallel else None
+        database = None
+        if arguments.database is not None:
+            try:
+                database = SolutionDatabase(arguments.database, table)
+            except (OSError, ValueError) as error:
+                parser.error(str(error))
+            stack.enter_context(database)
+        for challenge in challenges:
+            try:
+                if database is None:
+                    _solve(challenge, table, pool, arguments.limit, arguments.count)
+                else:
+                    _look_up(challenge, database, arguments.limit, arguments.count)
+            except ValueError as error:
+                _print_line({"challenge": challenge.name, "error": str(error)})
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any
+
+
+class AtomicFile:
+    """A file written under another name that takes its own once closed.
+
+    The file at ``path`` is either complete or as it was before, never half
+    written, e.g.::
+
+        with AtomicFile(path) as file:
+            file.write(text)
+
+    Leaving the ``with`` block with an error discards the new file.
+    """
+
+    def __init__(self, path: Path | str, mode: str = "w") -> None:
+        """Creates the missing directories and opens the file in ``mode``."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._temporary_path = self.path.with_name(f".{self.path.name}.tmp")
+        self.file: IO[Any] = self._temporary_path.open(mode)
+
+    def __enter__(self) -> IO[Any]:
+        return self.file
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.path}>"
+
+    def close(self) -> None:
+        """Closes the file and gives it its name."""
+        self.file.close()
+        self._temporary_path.replace(self.path)
+
+    def discard(self) -> None:
+        """Closes and removes the file, leaving ``path`` as it was."""
+        self.file.close()
+        self._temporary_path.unlink(missing_ok=True)
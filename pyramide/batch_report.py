@@ -0,0 +1,59 @@
+import math
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ChallengeResult:
+    """Outcome of one challenge of a batch; ``latency`` is in seconds."""
+
+    name: str
+    solution_count: int
+    latency: float
+
+
+@dataclass
+class BatchReport:
+    """Results of a batch of challenges, in the order they were finished."""
+
+    results: list[ChallengeResult]
+    wall_time: float
+
+    @property
+    def puzzles_per_second(self) -> float:
+        if self.wall_time <= 0:
+            return math.inf if self.results else 0.0
+        return len(self.results) / self.wall_time
+
+    @property
+    def solution_count(self) -> int:
+        return sum(result.solution_count for result in self.results)
+
+    def latency_percentile(self, percent: float) -> float:
+        """
+        The latency that ``percent`` percent of the challenges did not exceed.
+
+        :raises ValueError: if there are no results or ``percent`` is not in
+            the range 0 to 100.
+        """
+        if not self.results:
+            raise ValueError("No results")
+        if not 0 <= percent <= 100:
+            raise ValueError(f"Percent {percent} not in 0..100")
+        latencies = sorted(result.latency for result in self.results)
+        # nearest rank
+        rank = max(math.ceil(percent / 100 * len(latencies)), 1)
+        return latencies[rank - 1]
+
+    def __str__(self) -> str:
+        lines = [
+            f"{len(self.results)} puzzles in {self.wall_time:.2f} s"
+            f" ({self.puzzles_per_second:.2f} puzzles/s),"
+            f" {self.solution_count} solutions"
+        ]
+        if self.results:
+            percentiles = ", ".join(
+                f"p{percent} {self.latency_percentile(percent):.3f} s"
+                for percent in (50, 90, 99, 100)
+            )
+            lines.append(f"latency {percentiles}")
+        return "\n".join(lines)
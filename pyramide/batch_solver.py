@@ -0,0 +1,88 @@
+import time
+from collections.abc import Iterable, Iterator
+from types import TracebackType
+
+from pyramide.batch_report import BatchReport, ChallengeResult
+from pyramide.challenge import Challenge
+from pyramide.game import NotValidProblemError
+from pyramide.placement_table import PlacementTable
+from pyramide.solution_stream import SolutionStream
+
+# placement table of a worker process, set by `_init_batch`
+_worker_table: PlacementTable | None = None
+
+
+def _init_batch(table: PlacementTable) -> None:
+    global _worker_table  # noqa: PLW0603
+    _worker_table = table
+
+
+def _solve_challenge(challenge: Challenge) -> Iterator[ChallengeResult]:
+    assert _worker_table is not None, "worker not initialized"
+    start = time.perf_counter()
+    try:
+        solution_count = challenge.game(_worker_table).count_solutions()
+    except NotValidProblemError:
+        solution_count = 0
+    yield ChallengeResult(challenge.name, solution_count, time.perf_counter() - start)
+
+
+class BatchSolver:
+    """Solves many challenges on one placement table, one per worker at a time.
+
+    Every worker process receives the table once and then counts the
+    solutions of whole challenges with the serial bitboard engine (see
+    `Game.count_solutions`), so all cores are busy as long as there are
+    challenges left. Used as a context manager the workers serve
+    every batch until it is closed.
+    """
+
+    def __init__(self, table: PlacementTable, max_workers: int | None = None) -> None:
+        self.table = table
+        self._stream = SolutionStream(
+            max_workers=max_workers, initializer=_init_batch, initargs=(table,)
+        )
+
+    def __enter__(self) -> "BatchSolver":
+        self._stream.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} for {self.table}>"
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        self._stream.close()
+
+    def results(self, challenges: Iterable[Challenge]) -> Iterator[ChallengeResult]:
+        """
+        Yields the result of every challenge as soon as it is solved.
+
+        :raises ValueError: if a challenge does not match the table.
+        """
+        challenges = list(challenges)
+        for challenge in challenges:
+            # fail before any work is scheduled
+            try:
+                challenge.game(self.table)
+            except NotValidProblemError:
+                pass
+        return self._stream.run(_solve_challenge, challenges)
+
+    def solve(self, challenges: Iterable[Challenge]) -> BatchReport:
+        """
+        Solves all challenges and reports counts, latencies and throughput.
+
+        :raises ValueError: if a challenge does not match the table.
+        """
+        start = time.perf_counter()
+        results = list(self.results(challenges))
+        return BatchReport(results, time.perf_counter() - start)
@@ -0,0 +1,124 @@
+from collections.abc import Iterable, Iterator
+
+from pyramide.form import Form
+from pyramide.game_board import GameBoard
+from pyramide.game_position import GamePosition
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yields the indexes of the set bits of ``mask``, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class CellIndex:
+    """Maps every position of a base board to one bit of an integer mask.
+
+    Bit ``i`` of a mask stands for ``positions[i]``; positions are ordered by
+    ``(y, x)``. The 55 positions of the game board fit into one 64-bit integer,
+    so a board, a form placement or a set of free cells is a plain ``int`` and
+    fits/remove become ``&``, ``|`` and ``^``. Neighbors are precomputed both as
+    cell indexes and as masks.
+    """
+
+    def __init__(self, board: GameBoard) -> None:
+        self.positions = tuple(
+            sorted(board.position_set, key=lambda position: (position.y, position.x))
+        )
+        self.index = {position: i for i, position in enumerate(self.positions)}
+        self.full_mask = (1 << len(self.positions)) - 1
+        self.neighbor_cells = tuple(
+            tuple(
+                self.index[neighbor]
+                for neighbor in position.neighbors
+                if neighbor in self.index
+            )
+            for position in self.positions
+        )
+        self.neighbor_masks = tuple(
+            sum(1 << cell for cell in cells) for cells in self.neighbor_cells
+        )
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __hash__(self) -> int:
+        return hash((self.positions,))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CellIndex):
+            return self.positions == other.positions
+        return False
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} with {len(self)} cells>"
+
+    def to_mask(self, positions: Iterable[GamePosition]) -> int:
+        """
+        Returns the mask with the bits of all given positions set.
+
+        :raises KeyError: if a position is not on the base board.
+        """
+        mask = 0
+        for position in positions:
+            mask |= 1 << self.index[position]
+        return mask
+
+    def to_positions(self, mask: int) -> frozenset[GamePosition]:
+        return frozenset(self.positions[cell] for cell in iter_bits(mask))
+
+    def board_to_mask(self, board: GameBoard) -> int:
+        return self.to_mask(board.position_set)
+
+    def mask_to_board(self, mask: int) -> GameBoard:
+        return GameBoard(self.to_positions(mask))
+
+    def form_masks(self, form: Form) -> list[int]:
+        """All translations of ``form`` that lie completely on the base board."""
+        piece_point = form.get_anchor()
+        masks = []
+        for anchor in self.positions:
+            offset = anchor - piece_point
+            translated_positions = [pos + offset for pos in form.position_set]
+            if all(pos in self.index for pos in translated_positions):
+                masks.append(self.to_mask(translated_positions))
+        return masks
+
+    def components(self, mask: int, seeds: int | None = None) -> Iterator[int]:
+        """
+        Split ``mask`` into its 4-connected components.
+
+        With ``seeds`` only the components containing a seed cell are flood
+        filled, e.g. the neighbors of a piece that was just placed.
+        """
+        seeds = mask if seeds is None else seeds & mask
+        while seeds:
+            frontier = seeds & -seeds
+            component = 0
+            while frontier:
+                component |= frontier
+                grow = 0
+                while frontier:
+                    low = frontier & -frontier
+                    grow |= self.neighbor_masks[low.bit_length() - 1]
+                    frontier ^= low
+                frontier = grow & mask & ~component
+            mask &= ~component
+            seeds &= ~component
+            yield component
+
+    def border_mask(self, mask: int) -> int:
+        """Cells next to ``mask`` that are not part of it."""
+        border = 0
+        for cell in iter_bits(mask):
+            border |= self.neighbor_masks[cell]
+        return border & ~mask
+
+    def has_min_connected_cells(self, mask: int, min_connected_cells: int) -> bool:
+        """Bitmask version of `GameBoard.has_min_connected_gamepositions`."""
+        return all(
+            component.bit_count() >= min_connected_cells
+            for component in self.components(mask)
+        )
@@ -0,0 +1,81 @@
+from collections.abc import Iterable, Mapping
+
+from pyramide.color import Color
+from pyramide.game import Game
+from pyramide.game_board import GameBoard
+from pyramide.game_position import GamePosition
+from pyramide.piece import Piece
+from pyramide.placement_table import PlacementTable
+
+
+class Challenge:
+    """A puzzle with some pieces already placed on the board.
+
+    ``placed`` maps the color of every pre-placed piece to its positions. The
+    pieces themselves come from the placement table the challenge is solved
+    with, so a challenge is small and cheap to send to a worker process.
+    """
+
+    def __init__(
+        self, name: str, placed: Mapping[Color, Iterable[GamePosition]]
+    ) -> None:
+        self.name = name
+        self.placed = {
+            color: frozenset(positions) for color, positions in placed.items()
+        }
+
+    def __hash__(self) -> int:
+        return hash((self.name, frozenset(self.placed.items())))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Challenge):
+            return (self.name, self.placed) == (other.name, other.placed)
+        return False
+
+    def __repr__(self) -> str:
+        colors = ", ".join(color.name for color in self.placed)
+        return f"<{self.__class__.__name__} {self.name!r} with {colors} placed>"
+
+    def placement_ids(self, table: PlacementTable) -> list[int]:
+        """
+        The placement ids of the placed pieces in ``table``.
+
+        :raises ValueError: if a placed color has no piece in the table, a
+            piece does not fit on its positions or placed pieces overlap.
+        """
+        pieces_by_color = {piece.color: piece for piece in table.pieces}
+        placement_ids = []
+        occupied = 0
+        for color, positions in self.placed.items():
+            piece = pieces_by_color.get(color)
+            if piece is None:
+                raise ValueError(f"{self}: no piece of color {color.name}")
+            try:
+                placement_id = table.placement_id(piece, positions)
+            except ValueError as error:
+                raise ValueError(f"{self}: {error}") from None
+            mask = table.masks[placement_id]
+            if occupied & mask:
+                raise ValueError(f"{self}: {color.name} overlaps another piece")
+            occupied |= mask
+            placement_ids.append(placement_id)
+        return placement_ids
+
+    def game(self, table: PlacementTable) -> Game:
+        """
+        The game of placing the other pieces of ``table`` on its board.
+
+        :raises ValueError: if a placed color has no piece in the table, a
+            piece does not fit on its positions or placed pieces overlap.
+        :raises NotValidProblemError: if the board has too small isolated
+            spaces.
+        """
+        state: dict[Piece, frozenset[GamePosition]] = {}
+        occupied = 0
+        for placement_id in self.placement_ids(table):
+            state[table.piece_of(placement_id)] = table.positions_of(placement_id)
+            occupied |= table.masks[placement_id]
+        board = GameBoard(
+            table.board.position_set - table.cell_index.to_positions(occupied)
+        )
+        return Game(list(table.pieces), board, state, table)
@@ -0,0 +1,136 @@
+import json
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from pyramide.atomic_file import AtomicFile
+
+_FORMAT_VERSION = 2
+
+
+class Checkpoint:
+    """Progress of a split bitboard search, kept in files to resume it later.
+
+    The search is split into tasks (see `SearchCore.frontier`). Once a task is
+    finished its solutions, as placement ids, are appended to the solution
+    log next to the file (``solutions_path``) before they are yielded. The
+    file holds the split and the numbers of the finished tasks; it is
+    rewritten at most every ``interval`` seconds and when the search stops.
+    A task counts as finished once its solutions are in the log, so neither
+    memory nor the file grows with the number of solutions.
+
+    A search resumed after an interruption skips the finished tasks and only
+    yields the solutions of the others. The log holds every solution found
+    so far exactly once, see `solutions`.
+    """
+
+    def __init__(self, path: Path | str, interval: float = 60.0) -> None:
+        self.path = Path(path)
+        self.solutions_path = self.path.with_name(f"{self.path.name}.solutions")
+        self.interval = interval
+        self.key: str | None = None
+        self.split_depth: int | None = None
+        self.task_count: int | None = None
+        self.finished: set[int] = set()
+        self._saved_at = time.monotonic()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} {self.path}"
+            f" with {len(self.finished)} of {self.task_count} tasks finished>"
+        )
+
+    def load(self, key: str) -> int | None:
+        """
+        Reads the file, if there is one, and returns its split depth.
+
+        Tasks logged after the file was last written count as finished too.
+
+        :raises ValueError: if the file is of another search or format.
+        """
+        if not self.path.exists():
+            return None
+        data = json.loads(self.path.read_text())
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"{self.path} has an unsupported format version")
+        if data["key"] != key:
+            raise ValueError(f"{self.path} is a checkpoint of another search")
+        self.key = key
+        self.split_depth = data["split_depth"]
+        self.task_count = data["task_count"]
+        self.finished = set(data["finished"])
+        self.finished.update(task for task, _ in self._logged_tasks())
+        return self.split_depth
+
+    def _logged_tasks(self) -> Iterator[tuple[int, list[tuple[int, ...]]]]:
+        """
+        Yields every task of the log with its solutions.
+
+        A last line left half written by an interrupted run is cut off.
+        """
+        if not self.solutions_path.exists():
+            return
+        with self.solutions_path.open("rb+") as log:
+            end = 0
+            for line in log:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated line")
+                    task, solutions = json.loads(line)
+                except ValueError:
+                    log.truncate(end)
+                    return
+                end += len(line)
+                yield task, [tuple(solution) for solution in solutions]
+
+    def begin(self, key: str, split_depth: int, task_count: int) -> None:
+        """
+        Starts or resumes the search with this split and writes the file.
+
+        :raises ValueError: if the split differs from the loaded one.
+        """
+        if self.key is not None and (
+            (self.key, self.split_depth, self.task_count)
+            != (key, split_depth, task_count)
+        ):
+            raise ValueError(f"{self.path} was split differently")
+        if self.key is None:
+            # a log without a file is left over from another search
+            self.solutions_path.unlink(missing_ok=True)
+        self.key = key
+        self.split_depth = split_depth
+        self.task_count = task_count
+        self.save()
+
+    def finish(self, task: int, solutions: list[tuple[int, ...]]) -> None:
+        """Logs all solutions of a task, saving if the interval is over."""
+        with self.solutions_path.open("a") as log:
+            log.write(json.dumps([task, solutions]) + "\n")
+        self.finished.add(task)
+        if time.monotonic() - self._saved_at >= self.interval:
+            self.save()
+
+    def solutions(self) -> Iterator[tuple[int, ...]]:
+        """
+        Yields every solution in the log as the search found it.
+
+        A solution is the placement ids of the pieces the search placed,
+        before symmetric variants are expanded.
+        """
+        for _, solutions in self._logged_tasks():
+            yield from solutions
+
+    def save(self) -> None:
+        """Writes the file; it is replaced at once, so it is never half written."""
+        with AtomicFile(self.path) as file:
+            json.dump(
+                {
+                    "version": _FORMAT_VERSION,
+                    "key": self.key,
+                    "split_depth": self.split_depth,
+                    "task_count": self.task_count,
+                    "finished": sorted(self.finished),
+                },
+                file,
+            )
+        self._saved_at = time.monotonic()
@@ -0,0 +1,80 @@
+import base64
+import binascii
+import json
+import zlib
+from dataclasses import dataclass, field
+
+_FORMAT_VERSION = 2
+
+
+@dataclass
+class Continuation:
+    """Where a budgeted search stopped, see `Game.solve_within`.
+
+    Like a `Checkpoint` the search is split into tasks. ``finished`` holds the
+    numbers of the tasks that are done. An unfinished task goes on from its
+    `SearchCore.position` in ``positions``, or from its start without one.
+    A task finds its solutions in the same order every time, so it skips the
+    first ``returned`` ones, which were returned already. ``key`` identifies
+    the search.
+    """
+
+    key: str
+    split_depth: int
+    finished: set[int] = field(default_factory=set)
+    returned: dict[int, int] = field(default_factory=dict)
+    positions: dict[int, list[tuple[int, bool]]] = field(default_factory=dict)
+
+    def finish(self, task: int) -> None:
+        """Marks a task as done."""
+        self.finished.add(task)
+        self.returned.pop(task, None)
+        self.positions.pop(task, None)
+
+    def stop(self, task: int, position: list[tuple[int, bool]], returned: int) -> None:
+        """Notes where a task stopped and how many solutions it finds again."""
+        self.positions[task] = position
+        if returned:
+            self.returned[task] = returned
+        else:
+            self.returned.pop(task, None)
+
+    def to_token(self) -> str:
+        """The continuation as a short, URL safe string."""
+        data = {
+            "version": _FORMAT_VERSION,
+            "key": self.key,
+            "split_depth": self.split_depth,
+            "finished": sorted(self.finished),
+            "returned": sorted(self.returned.items()),
+            "positions": sorted(self.positions.items()),
+        }
+        compressed = zlib.compress(json.dumps(data, separators=(",", ":")).encode())
+        return base64.urlsafe_b64encode(compressed).decode("ascii")
+
+    @classmethod
+    def from_token(cls, token: str) -> "Continuation":
+        """
+        Reads a token of `to_token`.
+
+        :raises ValueError: if the token is damaged or of another format.
+        """
+        try:
+            data = json.loads(zlib.decompress(base64.urlsafe_b64decode(token)))
+        except (binascii.Error, zlib.error, ValueError):
+            raise ValueError("Not a continuation token") from None
+        if not isinstance(data, dict) or data.get("version") != _FORMAT_VERSION:
+            raise ValueError("The continuation token has an unsupported format")
+        try:
+            return cls(
+                data["key"],
+                data["split_depth"],
+                set(data["finished"]),
+                dict(map(tuple, data["returned"])),
+                {
+                    task: [(index, applied) for index, applied in position]
+                    for task, position in data["positions"]
+                },
+            )
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("The continuation token is damaged") from None
@@ -0,0 +1,155 @@
+from collections.abc import Iterable, Iterator, Sequence
+
+
+class DancingLinks:
+    """Knuth's Algorithm X with dancing links for exact cover problems.
+
+    Primary columns have to be covered exactly once, secondary columns at most
+    once. Rows are given as lists of column numbers; primary columns come first
+    (``0 .. primary_columns - 1``), followed by the secondary ones. The links
+    live in flat integer lists instead of node objects: index 0 is the root,
+    ``1 .. columns`` are the column headers and every row node follows.
+    """
+
+    def __init__(
+        self,
+        primary_columns: int,
+        secondary_columns: int,
+        rows: Iterable[Sequence[int]],
+    ) -> None:
+        columns = primary_columns + secondary_columns
+        headers = range(columns + 1)
+        self.left = [i - 1 for i in headers]
+        self.right = [i + 1 for i in headers]
+        self.up = list(headers)
+        self.down = list(headers)
+        self.column = list(headers)
+        self.row = [-1] * (columns + 1)
+        self.size = [0] * (columns + 1)
+
+        # only primary columns are linked into the header list of the root
+        self.left[0] = primary_columns
+        self.right[primary_columns] = 0
+        for header in range(primary_columns + 1, columns + 1):
+            self.left[header] = header
+            self.right[header] = header
+
+        self.row_nodes: list[int] = []
+        for row_number, row_columns in enumerate(rows):
+            first = len(self.column)
+            self.row_nodes.append(first)
+            for offset, column in enumerate(row_columns):
+                header = column + 1
+                node = first + offset
+                self.left.append(node - 1 if offset else first + len(row_columns) - 1)
+                self.right.append(node + 1 if offset < len(row_columns) - 1 else first)
+                self.up.append(self.up[header])
+                self.down.append(header)
+                self.down[self.up[header]] = node
+                self.up[header] = node
+                self.column.append(header)
+                self.row.append(row_number)
+                self.size[header] += 1
+
+    def _cover(self, header: int) -> None:
+        left, right, up, down = self.left, self.right, self.up, self.down
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        i = down[header]
+        while i != header:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                self.size[self.column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def _uncover(self, header: int) -> None:
+        left, right, up, down = self.left, self.right, self.up, self.down
+        i = up[header]
+        while i != header:
+            j = left[i]
+            while j != i:
+                self.size[self.column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[header]] = header
+        left[right[header]] = header
+
+    def _select(self, node: int) -> None:
+        j = self.right[node]
+        while j != node:
+            self._cover(self.column[j])
+            j = self.right[j]
+
+    def _unselect(self, node: int) -> None:
+        j = self.left[node]
+        while j != node:
+            self._uncover(self.column[j])
+            j = self.left[j]
+
+    def solve(self, selected_rows: Sequence[int] = ()) -> Iterator[tuple[int, ...]]:
+        """
+        Yields the row numbers of every exact cover.
+
+        ``selected_rows`` are taken into every cover before the search starts,
+        which splits the search into independent parts.
+
+        :raises ValueError: if the selected rows overlap.
+        """
+        covered_headers: set[int] = set()
+        selected_nodes: list[int] = []
+        try:
+            for row_number in selected_rows:
+                node = self.row_nodes[row_number]
+                headers = {self.column[node]}
+                j = self.right[node]
+                while j != node:
+                    headers.add(self.column[j])
+                    j = self.right[j]
+                if not covered_headers.isdisjoint(headers):
+                    raise ValueError(f"Row {row_number} overlaps a selected row")
+                covered_headers |= headers
+                self._cover(self.column[node])
+                self._select(node)
+                selected_nodes.append(node)
+            for rows in self._search():
+                yield (*selected_rows, *rows)
+        finally:
+            for node in reversed(selected_nodes):
+                self._unselect(node)
+                self._uncover(self.column[node])
+
+    def _search(self) -> Iterator[tuple[int, ...]]:
+        right = self.right
+        if right[0] == 0:
+            yield ()
+            return
+
+        # branch on the primary column with the fewest remaining rows
+        header = right[0]
+        size = self.size
+        best = header
+        while header != 0:
+            if size[header] < size[best]:
+                best = header
+                if size[best] == 0:
+                    return
+            header = right[header]
+
+        self._cover(best)
+        try:
+            node = self.down[best]
+            while node != best:
+                self._select(node)
+                try:
+                    for rows in self._search():
+                        yield (self.row[node], *rows)
+                finally:
+                    self._unselect(node)
+                node = self.down[node]
+        finally:
+            self._uncover(best)
@@ -1,10 +1,13 @@
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from typing import ClassVar
 
 from pyramide.game_board import GameBoard
 from pyramide.game_position import GamePosition
 
 
 class Form(GameBoard):
+    _interned: ClassVar[dict[frozenset[GamePosition], "Form"]] = {}
+
     def __init__(
         self, position_set: set[GamePosition] | frozenset[GamePosition]
     ) -> None:
@@ -13,9 +16,49 @@ class Form(GameBoard):
         )
         super().__init__(normalized_position_set)
         self.assert_all_positions_connected()
+        self._init_caches()
+
+    def _init_caches(self) -> None:
+        self._hash = hash((self.position_set,))
         self._anchor: GamePosition | None = None
         self._anchors: tuple[GamePosition, ...] | None = None
 
+    def __hash__(self) -> int:
+        return self._hash
+
+    @classmethod
+    def from_trusted(cls, position_set: frozenset[GamePosition]) -> "Form":
+        """
+        Creates a form without normalizing and without checking connectivity.
+
+        Only for positions that are already normalized and connected, e.g.
+        generated from an existing form.
+        """
+        form = cls.__new__(cls)
+        GameBoard.__init__(form, position_set)
+        form._init_caches()  # noqa: SLF001
+        return form
+
+    @classmethod
+    def canonical(cls, positions: Iterable[GamePosition]) -> "Form":
+        """
+        Returns the one shared form of this shape.
+
+        The positions are normalized but not checked for connectivity, so they
+        have to come from a transformation of a valid form.
+        """
+        position_list = list(positions)
+        min_x = min(p.x for p in position_list)
+        min_y = min(p.y for p in position_list)
+        normalized_position_set = frozenset(
+            GamePosition(p.x - min_x, p.y - min_y) for p in position_list
+        )
+        form = cls._interned.get(normalized_position_set)
+        if form is None:
+            form = cls.from_trusted(normalized_position_set)
+            cls._interned[normalized_position_set] = form
+        return form
+
     def get_anchors(self) -> tuple[GamePosition, ...]:
         # get top left or all points
         if self._anchors is None:
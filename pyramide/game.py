@@ -1,12 +1,82 @@
-from collections.abc import Iterator
-from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import itertools
+import os
+import threading
+from collections.abc import AsyncIterator, Iterator
 
 from tqdm import tqdm
 
+from pyramide.cell_index import iter_bits
+from pyramide.checkpoint import Checkpoint
+from pyramide.continuation import Continuation
+from pyramide.dancing_links import DancingLinks
 from pyramide.game_board import GameBoard
 from pyramide.game_position import GamePosition
 from pyramide.piece import Piece
+from pyramide.placement_table import PlacementTable
+from pyramide.search_core import SearchCore
+from pyramide.search_setup import SearchSetup
+from pyramide.search_stats import SearchStats
+from pyramide.solution_stream import SolutionStream
+from pyramide.solve_budget import (
+    COMPLETE,
+    MAX_NODES,
+    MAX_SECONDS,
+    MAX_SOLUTIONS,
+    SolveBudget,
+    SolveResult,
+)
 from pyramide.solved_game import SolvedGame
+from pyramide.solver_pool import SolverPool, TaskResult
+from pyramide.symmetry import BoardSymmetry
+from pyramide.transposition_table import TranspositionTable
+
+# tasks per worker when splitting the bitboard search adaptively
+_TASKS_PER_WORKER = 8
+
+# solutions waiting for the event loop of `Game.solve_async`
+_ASYNC_QUEUE_SIZE = 64
+# seconds between two checks whether `Game.solve_async` is still consumed
+_ASYNC_POLL_INTERVAL = 0.1
+
+# kinds of messages to `Game.solve_async`
+_SOLUTION = 0
+_END = 1
+_ERROR = 2
+
+
+def _put_solutions(
+    found: Iterator["SolvedGame"],
+    loop: asyncio.AbstractEventLoop,
+    queue: asyncio.Queue,
+    cancel: threading.Event,
+) -> None:
+    """Passes the solutions of a search thread to the queue of an event loop."""
+
+    def put(message: tuple[int, object]) -> bool:
+        future = asyncio.run_coroutine_threadsafe(queue.put(message), loop)
+        while True:
+            try:
+                future.result(_ASYNC_POLL_INTERVAL)
+            except TimeoutError:
+                if cancel.is_set():
+                    future.cancel()
+                    return False
+            else:
+                return True
+
+    try:
+        for solution in found:
+            if not put((_SOLUTION, solution)):
+                return
+        put((_END, None))
+    except Exception as error:
+        put((_ERROR, error))
+    finally:
+        found.close()
 
 
 class NotValidProblemError(Exception):
@@ -19,10 +89,32 @@ class Game:
         pieces: list[Piece],
         board: GameBoard,
         state: dict[Piece, frozenset[GamePosition]],
+        placement_table: PlacementTable | None = None,
+        transposition_table: TranspositionTable | None = None,
     ) -> None:
+        """
+        Sets up the problem of placing all pieces not in ``state`` on ``board``.
+
+        ``placement_table`` is used by the bitboard and dlx engines. Pass a shared
+        table of the base board to reuse it across games; by default a table of
+        ``pieces`` on ``board`` is built once and cached. The bitboard engine
+        skips dead sub-problems remembered in ``transposition_table``.
+
+        :raises NotValidProblemError: if the board has too small isolated spaces.
+        :raises ValueError: if ``placement_table`` does not cover the problem.
+        """
         self.pieces = pieces
         self.board = board
         self.state = state
+        if placement_table is not None and not placement_table.covers(
+            self._unplaced_pieces(), board
+        ):
+            raise ValueError(f"{placement_table} does not cover the game")
+        self._placement_table = placement_table
+        self.transposition_table = transposition_table
+        self._restriction: tuple[int, frozenset[int]] | None = None
+        self._cancel: threading.Event | None = None
+        self.stats = SearchStats()
         if not self._is_valid_problem():
             raise NotValidProblemError()
 
@@ -39,27 +131,426 @@ class Game:
 
     def _is_valid_problem(self) -> bool:
         """Heuristic for isolated spaces."""
-        min_isolated_space = min(len(p) for p in self.pieces)
-        return self.board.has_min_connected_gamepositions(min_isolated_space)
+        return self.board.has_min_connected_gamepositions(self.min_isolated_space)
+
+    @property
+    def placement_table(self) -> PlacementTable:
+        if self._placement_table is None:
+            self._placement_table = PlacementTable.get(self.pieces, self.board)
+        return self._placement_table
+
+    @property
+    def min_isolated_space(self) -> int:
+        return min(len(p) for p in self.pieces)
 
     def sort_pieces(self) -> None:
         self.pieces = sorted(self.pieces, key=lambda piece: len(piece), reverse=True)
 
     def process_position(
         self, args: tuple[Piece, GameBoard, frozenset[GamePosition]]
-    ) -> frozenset[SolvedGame]:
+    ) -> Iterator[SolvedGame]:
         piece, possible_new_position, placed_piece_position = args
         try:
             new_game = Game(
                 self.pieces,
                 possible_new_position,
                 self.get_new_state({piece: placed_piece_position}),
+                self._placement_table,
             )
         except NotValidProblemError:
-            return frozenset()
-        return frozenset(new_game.solve())
+            return
+        yield from new_game.solve(engine="object")
+
+    def solve(  # noqa: PLR0913
+        self,
+        parallel: bool = False,
+        engine: str = "bitboard",
+        *,
+        break_symmetry: bool = False,
+        expand_symmetry: bool = True,
+        split_depth: int | None = None,
+        pool: SolverPool | None = None,
+        checkpoint: Checkpoint | None = None,
+        cancel: threading.Event | None = None,
+        limit: int | None = None,
+    ) -> Iterator[SolvedGame]:
+        """
+        Yields every way to place the remaining pieces on the board.
+
+        engine "bitboard" searches on integer masks of a `CellIndex` with one
+        mutable `SearchCore`, engine "object" builds a new `Game` per placement
+        and engine "dlx" solves the exact cover problem with dancing links. All
+        yield the same `SolvedGame`s.
+
+        With ``break_symmetry`` the bitboard engine only searches one of the
+        solutions that are rotations or mirrors of each other on a symmetric
+        board. They are expanded back to all variants unless
+        ``expand_symmetry`` is False, then one solution per variant group is
+        yielded.
+
+        In parallel the bitboard engine splits the search into the states
+        ``split_depth`` placements deep (by default deep enough for several
+        tasks per core) and hands them to the workers one by one as they get
+        free. ``stats.worker_busy_time`` shows the load of every worker. The
+        workers of ``pool`` are reused, otherwise new ones are started.
+
+        With a ``checkpoint`` the bitboard engine logs the solutions of every
+        finished task and, when started again with the same checkpoint, skips
+        the finished tasks: only the solutions of the others are yielded. The
+        log holds the solutions of all finished tasks, see `Checkpoint`.
+
+        Once ``cancel`` is set, e.g. from another thread, the bitboard engine
+        stops searching within a few steps, in the workers as well, and no
+        more solutions are yielded.
+
+        With a ``limit`` at most that many solutions are yielded and the search
+        stops right after the last one, in the workers as well: ``limit=1``
+        finds any solution, ``limit=2`` is enough to tell whether the solution
+        is unique (see `has_unique_solution`). To only count the solutions use
+        `count_solutions`.
+
+        :raises ValueError: if the engine is unknown or cannot break symmetry,
+            split the search, use a pool, a checkpoint or be cancelled, if
+            ``pool`` has another placement table or ``checkpoint`` belongs to
+            another search.
+        """
+        if engine != "bitboard":
+            for used, action in (
+                (break_symmetry, "break symmetry"),
+                (split_depth is not None, "split the search"),
+                (checkpoint is not None, "use a checkpoint"),
+                (pool is not None, "use a solver pool"),
+                (cancel is not None, "be cancelled"),
+            ):
+                if used:
+                    raise ValueError(f"Engine {engine!r} cannot {action}")
+        if pool is not None and pool.table is not self.placement_table:
+            raise ValueError(f"{pool} works on another placement table")
+        self._cancel = cancel
+        if engine == "object":
+            found = self._solve_object(parallel)
+        elif engine == "bitboard":
+            found = (
+                self._solved_game_from_placements(placement_ids)
+                for placement_ids in self._bitboard_placements(
+                    parallel,
+                    break_symmetry,
+                    expand_symmetry,
+                    split_depth,
+                    pool,
+                    checkpoint,
+                )
+            )
+        elif engine == "dlx":
+            found = self._solve_dlx(parallel)
+        else:
+            raise ValueError(f"Unknown engine {engine!r}")
+        try:
+            yield from itertools.islice(found, limit)
+        finally:
+            found.close()
+
+    def count_solutions(
+        self,
+        parallel: bool = False,
+        engine: str = "bitboard",
+        *,
+        break_symmetry: bool = False,
+        split_depth: int | None = None,
+        pool: SolverPool | None = None,
+    ) -> int:
+        """
+        Counts the solutions without building a `SolvedGame` for each.
+
+        The bitboard engine counts without enumerating, see `SearchCore.count`:
+        the count of every sub-problem is kept in the game's transposition
+        table if it stores counts, otherwise in a new `TranspositionTable`
+        storing counts, with the game table's ``max_entries`` and counters, so
+        sub-problems reached by several placement orders are counted once.
+        The table's ``max_entries`` bounds the memory. In parallel only the
+        table's settings go with the tasks: every worker counts all its tasks
+        with one table of its own, kept between them, and sends back the
+        counts and the table's counters. The arguments are the ones of `solve`.
+
+        :raises ValueError: like `solve`.
+        """
+        if engine != "bitboard":
+            return sum(
+                1
+                for _ in self.solve(
+                    parallel,
+                    engine,
+                    break_symmetry=break_symmetry,
+                    split_depth=split_depth,
+                    pool=pool,
+                )
+            )
+        if pool is not None and pool.table is not self.placement_table:
+            raise ValueError(f"{pool} works on another placement table")
+        self._cancel = None
+        if break_symmetry:
+            placements = self._bitboard_placements(
+                parallel, break_symmetry, True, split_depth, pool, None
+            )
+            return sum(1 for _ in placements)
+        self._restriction = None
+        setup = self.search_setup()
+        table = setup.transposition_table
+        if table is None:
+            setup = dataclasses.replace(
+                setup, transposition_table=TranspositionTable(store_counts=True)
+            )
+        elif not table.store_counts:
+            # a table of dead sub-problems only would count the others again
+            setup = dataclasses.replace(
+                setup,
+                transposition_table=TranspositionTable(
+                    table.max_entries, store_counts=True
+                ),
+            )
+        core = setup.search_core(self.placement_table)
+        core.stats = self.stats
+        if not parallel or not core.unplaced:
+            count = core.count()
+            if table is not None and core.transposition_table is not table:
+                table.add_counters(core.transposition_table)
+            return count
+        _, tasks = self._bitboard_tasks(core, split_depth)
+        return self._pool_count(setup, tasks, pool)
+
+    def has_unique_solution(
+        self,
+        parallel: bool = False,
+        engine: str = "bitboard",
+        *,
+        pool: SolverPool | None = None,
+    ) -> bool:
+        """
+        Whether there is exactly one solution; stops at the second one.
+
+        :raises ValueError: like `solve`.
+        """
+        return sum(1 for _ in self.solve(parallel, engine, pool=pool, limit=2)) == 1
+
+    def solve_within(
+        self,
+        budget: SolveBudget,
+        continuation: str | None = None,
+        parallel: bool = False,
+        *,
+        split_depth: int | None = None,
+        pool: SolverPool | None = None,
+    ) -> SolveResult:
+        """
+        Solves with the bitboard engine until done or a limit of ``budget``.
+
+        Returns the solutions found so far, whether they are all and, if not,
+        a continuation token. Passing the token back as ``continuation``
+        resumes the search with the solutions not returned yet. The search is
+        split into tasks like for `solve` in parallel and the nodes of the
+        split do not count. In parallel the node limit holds for all workers
+        together and every worker reports where its task stopped, so a
+        resumed task goes on from there, however large it is.
+
+        :raises ValueError: if ``pool`` has another placement table or
+            ``continuation`` is not a token of this search.
+        """
+        if pool is not None and pool.table is not self.placement_table:
+            raise ValueError(f"{pool} works on another placement table")
+        self._restriction = None
+        self._cancel = threading.Event()
+        timer = None
+        if budget.max_seconds is not None:
+            timer = threading.Timer(budget.max_seconds, self._cancel.set)
+            timer.daemon = True
+            timer.start()
+        try:
+            key = self._checkpoint_key()
+            if continuation is None:
+                state = None
+            else:
+                state = Continuation.from_token(continuation)
+                if state.key != key:
+                    raise ValueError("The continuation token is of another search")
+                split_depth = state.split_depth
+            core = self.search_core()
+            depth, tasks = self._bitboard_tasks(core, split_depth)
+            if state is None:
+                state = Continuation(key, depth)
+            solutions: list[SolvedGame] = []
+            if parallel:
+                status = self._pool_solutions_within(
+                    tasks, state, budget, pool, solutions
+                )
+            else:
+                cancel = self._cancel
+                max_nodes = budget.max_nodes
+                start_nodes = self.stats.nodes
+                core.interrupt = lambda: (
+                    cancel.is_set()
+                    or (
+                        max_nodes is not None
+                        and self.stats.nodes - start_nodes >= max_nodes
+                    )
+                )
+                status = self._solutions_within(
+                    core, tasks, state, budget.max_solutions, solutions
+                )
+        finally:
+            if timer is not None:
+                timer.cancel()
+            self._cancel = None
+        if status == COMPLETE:
+            return SolveResult(solutions, status, None)
+        return SolveResult(solutions, status, state.to_token())
+
+    def _interrupted_status(self) -> str:
+        assert self._cancel is not None
+        return MAX_SECONDS if self._cancel.is_set() else MAX_NODES
+
+    def _solutions_within(
+        self,
+        core: SearchCore,
+        tasks: list[tuple[int, ...]],
+        state: Continuation,
+        max_solutions: int | None,
+        solutions: list[SolvedGame],
+    ) -> str:
+        """Searches the unfinished tasks one after the other, see `solve_within`."""
+        for number, task in enumerate(tasks):
+            if number in state.finished:
+                continue
+            skipped = state.returned.get(number, 0)
+            with contextlib.closing(
+                core.solutions_below(task, state.positions.get(number))
+            ) as found:
+                for placement_ids in found:
+                    if skipped:
+                        skipped -= 1
+                        continue
+                    solutions.append(self._solved_game_from_placements(placement_ids))
+                    if len(solutions) == max_solutions:
+                        break
+                else:
+                    if not core.interrupted:
+                        state.finish(number)
+                        continue
+                position = core.position
+            if position:
+                state.stop(number, position, skipped)
+            else:
+                state.finish(number)
+            return self._interrupted_status() if core.interrupted else MAX_SOLUTIONS
+        return COMPLETE
 
-    def solve(self, parallel: bool = False) -> Iterator[SolvedGame]:
+    def _pool_solutions_within(
+        self,
+        tasks: list[tuple[int, ...]],
+        state: Continuation,
+        budget: SolveBudget,
+        pool: SolverPool | None,
+        solutions: list[SolvedGame],
+    ) -> str:
+        """Searches the unfinished tasks in the workers, see `solve_within`."""
+        if pool is None:
+            pool = SolverPool(self.placement_table)
+        task_numbers = {task: number for number, task in enumerate(tasks)}
+        remaining = [
+            task for number, task in enumerate(tasks) if number not in state.finished
+        ]
+        # solutions returned before that each task finds again first
+        skipped = dict(state.returned)
+
+        def on_done(result: TaskResult | None) -> None:
+            self._merge_task_result(result)
+            if result is None:
+                return
+            number = task_numbers[result[0]]
+            position = result[3]
+            if position is None:
+                state.finish(number)
+            elif position:
+                # all solutions of the task up to its position were taken
+                state.stop(number, position, skipped.get(number, 0))
+
+        found = pool.solutions(
+            self.search_setup(),
+            remaining,
+            on_done,
+            self._cancel,
+            budget.max_nodes,
+            {tasks[number]: position for number, position in state.positions.items()},
+        )
+        with contextlib.closing(found):
+            for placement_ids in found:
+                # every solution starts with the placements of its task
+                number = task_numbers[placement_ids[: state.split_depth]]
+                if skipped.get(number):
+                    skipped[number] -= 1
+                    continue
+                solutions.append(self._solved_game_from_placements(placement_ids))
+                # the task goes on from the same position, so it finds this
+                # solution again
+                state.returned[number] = state.returned.get(number, 0) + 1
+                if len(solutions) == budget.max_solutions:
+                    return MAX_SOLUTIONS
+        if len(state.finished) == len(tasks):
+            return COMPLETE
+        return self._interrupted_status()
+
+    async def solve_async(  # noqa: PLR0913
+        self,
+        parallel: bool = True,
+        *,
+        timeout: float | None = None,
+        break_symmetry: bool = False,
+        expand_symmetry: bool = True,
+        split_depth: int | None = None,
+        pool: SolverPool | None = None,
+    ) -> AsyncIterator[SolvedGame]:
+        """
+        Yields the solutions of the bitboard engine into the running event loop.
+
+        The search runs in a thread, by default with worker processes, so the
+        event loop keeps serving other tasks. Cancelling the consuming task,
+        closing the generator or running out of ``timeout`` seconds stops the
+        search, in the workers as well, before the generator is done. To stop
+        it right when leaving an ``async for`` early, iterate inside
+        ``contextlib.aclosing``. The other arguments are the ones of `solve`.
+
+        :raises TimeoutError: if the search takes longer than ``timeout``.
+        :raises ValueError: like `solve`.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        queue: asyncio.Queue[tuple[int, object]] = asyncio.Queue(_ASYNC_QUEUE_SIZE)
+        cancel = threading.Event()
+        found = self.solve(
+            parallel,
+            break_symmetry=break_symmetry,
+            expand_symmetry=expand_symmetry,
+            split_depth=split_depth,
+            pool=pool,
+            cancel=cancel,
+        )
+        search = threading.Thread(
+            target=_put_solutions, args=(found, loop, queue, cancel), daemon=True
+        )
+        search.start()
+        try:
+            while True:
+                async with asyncio.timeout_at(deadline):
+                    kind, value = await queue.get()
+                if kind == _END:
+                    return
+                if kind == _ERROR:
+                    raise value  # type: ignore[misc]
+                yield value  # type: ignore[misc]
+        finally:
+            cancel.set()
+            await asyncio.to_thread(search.join)
+
+    def _solve_object(self, parallel: bool) -> Iterator[SolvedGame]:
         for piece in self.pieces:
             if self.has_already_position(piece):
                 continue
@@ -72,20 +563,344 @@ class Game:
             )
             if parallel:
                 prepared_tasks = tuple(tasks)
-                with ProcessPoolExecutor() as executor:
-                    solved_tasks = tuple(
-                        tqdm(
-                            executor.map(self.process_position, prepared_tasks),
-                            total=len(prepared_tasks),
-                            desc=piece.color.value,
-                            unit="positions",
-                        )
+                with tqdm(
+                    total=len(prepared_tasks), desc=piece.color.value, unit="positions"
+                ) as progress:
+                    yield from SolutionStream().run(
+                        self.process_position,
+                        prepared_tasks,
+                        lambda _: progress.update(),
                     )
             else:
-                solved_tasks = map(self.process_position, tasks)
-            for solved_game_set in solved_tasks:
-                yield from solved_game_set
+                for task in tasks:
+                    yield from self.process_position(task)
             return
 
         assert self.is_valid_state(), self.state
         yield SolvedGame(frozenset(self.state.items()))
+
+    def _unplaced_pieces(self) -> list[Piece]:
+        return [piece for piece in self.pieces if not self.has_already_position(piece)]
+
+    def fitting_placement_ids(self) -> list[list[int]]:
+        """Placement ids of every unplaced piece that fit on the current board."""
+        free = self.placement_table.cell_index.board_to_mask(self.board)
+        return [
+            self.placement_table.fitting_placement_ids(piece, free)
+            for piece in self._unplaced_pieces()
+        ]
+
+    def _solved_game_from_placements(
+        self, placement_ids: tuple[int, ...]
+    ) -> SolvedGame:
+        change = {
+            self.placement_table.piece_of(placement_id): (
+                self.placement_table.positions_of(placement_id)
+            )
+            for placement_id in placement_ids
+        }
+        return SolvedGame(frozenset(self.get_new_state(change).items()))
+
+    def search_setup(self) -> SearchSetup:
+        """The bitboard search for the unplaced pieces on the board."""
+        table = self.placement_table
+        unplaced = 0
+        for piece in self._unplaced_pieces():
+            unplaced |= 1 << table.piece_index[piece]
+        return SearchSetup(
+            table.cell_index.board_to_mask(self.board),
+            unplaced,
+            self.min_isolated_space,
+            self._restriction,
+            self.transposition_table,
+        )
+
+    def search_core(self) -> SearchCore:
+        """A new bitboard search for the unplaced pieces on the board."""
+        core = self.search_setup().search_core(self.placement_table)
+        core.stats = self.stats
+        if self._cancel is not None:
+            core.interrupt = self._cancel.is_set
+        return core
+
+    def _break_symmetry(self, symmetry: BoardSymmetry, free: int) -> frozenset[int]:
+        """
+        Restricts one piece to the smallest placement of each symmetry orbit.
+
+        Every solution can be rotated or mirrored so that this piece lies on
+        such a placement, so no group of symmetric solutions gets lost. The
+        piece with the most fitting placements is restricted; its remaining
+        placements are returned.
+        """
+        table = self.placement_table
+        piece = max(
+            self._unplaced_pieces(),
+            key=lambda p: len(table.fitting_placement_ids(p, free)),
+        )
+        canonical = frozenset(
+            symmetry.canonical_placement_ids(table.fitting_placement_ids(piece, free))
+        )
+        self._restriction = (table.piece_index[piece], canonical)
+        return canonical
+
+    def _bitboard_placements(  # noqa: PLR0913, PLR0917
+        self,
+        parallel: bool,
+        break_symmetry: bool,
+        expand_symmetry: bool,
+        split_depth: int | None,
+        pool: SolverPool | None,
+        checkpoint: Checkpoint | None,
+    ) -> Iterator[tuple[int, ...]]:
+        self._restriction = None
+        core = self.search_core()
+        symmetry = None
+        if break_symmetry and core.unplaced:
+            symmetry = BoardSymmetry(self.placement_table, core.free, core.unplaced)
+        if symmetry is None or len(symmetry) == 1:
+            yield from self._bitboard_solutions(parallel, split_depth, pool, checkpoint)
+            return
+
+        canonical = self._break_symmetry(symmetry, core.free)
+        for placement_ids in self._bitboard_solutions(
+            parallel, split_depth, pool, checkpoint
+        ):
+            # a group of symmetric solutions can be found more than once if
+            # the restricted piece is symmetric itself, only the smallest
+            # found one is passed on
+            orbit = symmetry.orbit(placement_ids)
+            found = [image for image in orbit if not canonical.isdisjoint(image)]
+            if min(found) != tuple(sorted(placement_ids)):
+                continue
+            yield from orbit if expand_symmetry else [min(found)]
+
+    def _bitboard_tasks(
+        self, core: SearchCore, split_depth: int | None
+    ) -> tuple[int, list[tuple[int, ...]]]:
+        """
+        Splits the search into the states ``split_depth`` placements deep.
+
+        Without ``split_depth`` the tree is split one level deeper at a time
+        until there are enough tasks to keep every worker busy until the end.
+        Returns the depth and the tasks.
+        """
+        if split_depth is not None:
+            return split_depth, list(core.frontier(split_depth))
+        min_tasks = _TASKS_PER_WORKER * (os.cpu_count() or 1)
+        depth = 1
+        tasks = list(core.frontier(depth))
+        while len(tasks) < min_tasks and depth < core.unplaced.bit_count():
+            depth += 1
+            tasks = list(core.frontier(depth))
+        return depth, tasks
+
+    def _bitboard_solutions(
+        self,
+        parallel: bool,
+        split_depth: int | None = None,
+        pool: SolverPool | None = None,
+        checkpoint: Checkpoint | None = None,
+    ) -> Iterator[tuple[int, ...]]:
+        core = self.search_core()
+        if checkpoint is not None:
+            yield from self._checkpointed_solutions(
+                core, parallel, split_depth, pool, checkpoint
+            )
+        elif not parallel or not core.unplaced:
+            yield from core.solutions()
+        else:
+            _, tasks = self._bitboard_tasks(core, split_depth)
+            yield from self._pool_solutions(tasks, pool)
+
+    def _merge_task_result(self, result: TaskResult | None) -> None:
+        """Adds the stats and transposition table of a worker's task."""
+        if result is None:
+            return
+        _, stats, transposition_table, _ = result
+        self.stats += stats
+        if self.transposition_table is not None and transposition_table is not None:
+            self.transposition_table.add_counters(transposition_table)
+
+    def _pool_solutions(
+        self,
+        tasks: list[tuple[int, ...]],
+        pool: SolverPool | None,
+        finished_tasks: list[tuple[int, ...]] | None = None,
+    ) -> Iterator[tuple[int, ...]]:
+        """Yields the solutions of the tasks found by the workers of ``pool``."""
+        if pool is None:
+            pool = SolverPool(self.placement_table)
+        with tqdm(total=len(tasks), unit="tasks") as progress:
+
+            def on_done(result: TaskResult | None) -> None:
+                progress.update()
+                self._merge_task_result(result)
+                if (
+                    result is not None
+                    and result[3] is None
+                    and finished_tasks is not None
+                ):
+                    finished_tasks.append(result[0])
+
+            yield from pool.solutions(self.search_setup(), tasks, on_done, self._cancel)
+
+    def _pool_count(
+        self,
+        setup: SearchSetup,
+        tasks: list[tuple[int, ...]],
+        pool: SolverPool | None,
+    ) -> int:
+        """The number of solutions of the tasks counted by the workers."""
+        if pool is None:
+            pool = SolverPool(self.placement_table)
+        with tqdm(total=len(tasks), unit="tasks") as progress:
+
+            def on_done(result: TaskResult | None) -> None:
+                progress.update()
+                self._merge_task_result(result)
+
+            return sum(pool.counts(setup, tasks, on_done, self._cancel))
+
+    def _checkpoint_key(self) -> str:
+        """A fingerprint of everything the placement ids of a search depend on."""
+        setup = self.search_setup()
+        restriction = setup.restriction
+        data = (
+            self.placement_table.key(),
+            sorted(
+                (piece.color.name, sorted((p.x, p.y) for p in positions))
+                for piece, positions in self.state.items()
+            ),
+            setup.free,
+            setup.unplaced,
+            setup.min_isolated_space,
+            None if restriction is None else (restriction[0], sorted(restriction[1])),
+        )
+        return hashlib.sha256(repr(data).encode()).hexdigest()[:16]
+
+    def _checkpointed_solutions(
+        self,
+        core: SearchCore,
+        parallel: bool,
+        split_depth: int | None,
+        pool: SolverPool | None,
+        checkpoint: Checkpoint,
+    ) -> Iterator[tuple[int, ...]]:
+        """
+        Yields the solutions of the tasks not finished in earlier runs.
+
+        Solutions are passed on once their task is finished and logged, so
+        they are neither lost nor repeated when the search is resumed.
+        """
+        key = self._checkpoint_key()
+        stored_split_depth = checkpoint.load(key)
+        if stored_split_depth is not None:
+            split_depth = stored_split_depth
+        depth, tasks = self._bitboard_tasks(core, split_depth)
+        checkpoint.begin(key, depth, len(tasks))
+        task_numbers = {task: number for number, task in enumerate(tasks)}
+        remaining = [
+            task
+            for number, task in enumerate(tasks)
+            if number not in checkpoint.finished
+        ]
+        try:
+            if not parallel:
+                for task in remaining:
+                    solutions = list(core.solutions_below(task))
+                    if core.interrupted:
+                        return
+                    checkpoint.finish(task_numbers[task], solutions)
+                    yield from solutions
+                return
+
+            found: dict[tuple[int, ...], list[tuple[int, ...]]] = {}
+            finished_tasks: list[tuple[int, ...]] = []
+            for solution in self._pool_solutions(remaining, pool, finished_tasks):
+                # every solution starts with the placements of its task
+                found.setdefault(solution[:depth], []).append(solution)
+                while finished_tasks:
+                    task = finished_tasks.pop()
+                    solutions = found.pop(task, [])
+                    checkpoint.finish(task_numbers[task], solutions)
+                    yield from solutions
+            for task in finished_tasks:
+                solutions = found.pop(task, [])
+                checkpoint.finish(task_numbers[task], solutions)
+                yield from solutions
+        finally:
+            checkpoint.save()
+
+    def _dlx_problem(self) -> tuple[DancingLinks, list[int]]:
+        """
+        Builds the exact cover matrix with one row per fitting placement.
+
+        Every unplaced piece is a primary column. The free cells are primary
+        columns too if the pieces fill the board exactly, otherwise secondary
+        columns that may stay empty.
+        """
+        piece_placements = self.fitting_placement_ids()
+        cell_index = self.placement_table.cell_index
+        free = cell_index.board_to_mask(self.board)
+        cell_columns: dict[int, int] = {}
+        column = len(piece_placements)
+        for cell in iter_bits(free):
+            cell_columns[cell] = column
+            column += 1
+
+        masks = self.placement_table.masks
+        placement_ids: list[int] = []
+        rows: list[list[int]] = []
+        for piece_column, placements in enumerate(piece_placements):
+            for placement_id in placements:
+                mask = masks[placement_id]
+                rows.append(
+                    [piece_column, *(cell_columns[cell] for cell in iter_bits(mask))]
+                )
+                placement_ids.append(placement_id)
+
+        exact = sum(len(p) for p in self._unplaced_pieces()) == free.bit_count()
+        primary_columns = column if exact else len(piece_placements)
+        dlx = DancingLinks(primary_columns, column - primary_columns, rows)
+        return dlx, placement_ids
+
+    def _dlx_solutions(
+        self, dlx: DancingLinks, placement_ids: list[int], selected_rows: list[int]
+    ) -> Iterator[tuple[int, ...]]:
+        cell_index = self.placement_table.cell_index
+        masks = self.placement_table.masks
+        free = cell_index.board_to_mask(self.board)
+        for rows in dlx.solve(selected_rows):
+            solution = tuple(placement_ids[row] for row in rows)
+            remaining = free
+            for placement_id in solution:
+                remaining ^= masks[placement_id]
+            # same heuristic as the other engines for boards with spare cells
+            if cell_index.has_min_connected_cells(remaining, self.min_isolated_space):
+                yield solution
+
+    def process_dlx_position(self, row: int) -> Iterator[tuple[int, ...]]:
+        dlx, placement_ids = self._dlx_problem()
+        yield from self._dlx_solutions(dlx, placement_ids, [row])
+
+    def _solve_dlx(self, parallel: bool) -> Iterator[SolvedGame]:
+        piece_placements = self.fitting_placement_ids()
+        if not parallel or not piece_placements:
+            dlx, placement_ids = self._dlx_problem()
+            for solution in self._dlx_solutions(dlx, placement_ids, []):
+                yield self._solved_game_from_placements(solution)
+            return
+
+        # the rows of the first piece come first in the matrix
+        first_piece_rows = range(len(piece_placements[0]))
+        with tqdm(
+            total=len(first_piece_rows),
+            desc=self._unplaced_pieces()[0].color.value,
+            unit="positions",
+        ) as progress:
+            for solution in SolutionStream().run(
+                self.process_dlx_position,
+                first_piece_rows,
+                lambda _: progress.update(),
+            ):
+                yield self._solved_game_from_placements(solution)
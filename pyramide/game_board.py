@@ -46,13 +46,9 @@ class GameBoard:
         return "\n".join(rows)
 
     def get_neighbors(self, position: GamePosition) -> set[GamePosition]:
-        neighbors = set()
-        # Check 4-directional neighbors
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            neighbor = GamePosition(position.x + dx, position.y + dy)
-            if neighbor in self.position_set:
-                neighbors.add(neighbor)
-        return neighbors
+        return {
+            neighbor for neighbor in position.neighbors if neighbor in self.position_set
+        }
 
     def assert_all_positions_connected(self) -> None:
         if not self.position_set:
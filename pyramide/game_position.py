@@ -1,15 +1,53 @@
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
+from typing import ClassVar
 
 
-@dataclass(frozen=True)
 class GamePosition:
-    """(0, 0) is top left."""
+    """(0, 0) is top left.
+
+    Positions are interned: ``GamePosition(x, y)`` always returns the same
+    object for the same coordinates, so positions are cheap to hash and
+    compare and a board of many solutions shares them.
+    """
+
+    __slots__ = ("_hash", "_neighbors", "x", "y")
+    _interned: ClassVar[dict[tuple[int, int], "GamePosition"]] = {}
 
     x: int
     y: int
 
+    def __new__(cls, x: int, y: int) -> "GamePosition":
+        position = cls._interned.get((x, y))
+        if position is None:
+            position = object.__new__(cls)
+            object.__setattr__(position, "x", x)
+            object.__setattr__(position, "y", y)
+            object.__setattr__(position, "_hash", hash((x, y)))
+            object.__setattr__(position, "_neighbors", None)
+            cls._interned[x, y] = position
+        return position
+
+    def __reduce__(self) -> tuple[type["GamePosition"], tuple[int, int]]:
+        return self.__class__, (self.x, self.y)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
     def __hash__(self) -> int:
-        return hash((self.x, self.y))
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, GamePosition):
+            return self.x == other.x and self.y == other.y
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(x={self.x}, y={self.y})"
 
     def __sub__(self, other: object) -> "GamePosition":
         if not isinstance(other, GamePosition):
@@ -20,3 +58,17 @@ class GamePosition:
         if not isinstance(other, GamePosition):
             raise TypeError()
         return GamePosition(self.x + other.x, self.y + other.y)
+
+    @property
+    def neighbors(self) -> tuple["GamePosition", ...]:
+        """The four positions left, right, above and below."""
+        if self._neighbors is None:
+            x, y = self.x, self.y
+            neighbors = (
+                GamePosition(x - 1, y),
+                GamePosition(x + 1, y),
+                GamePosition(x, y - 1),
+                GamePosition(x, y + 1),
+            )
+            object.__setattr__(self, "_neighbors", neighbors)
+        return self._neighbors
@@ -10,6 +10,7 @@ class Piece:
     def __init__(self, color: Color, form: Form) -> None:
         self.color = color
         self.form = form
+        self._transformations: frozenset[Form] | None = None
 
     def __copy__(self) -> "Piece":
         return Piece(self.color, Form(self.form.position_set))
@@ -45,17 +46,19 @@ class Piece:
         if angle == 90:
             return Piece(
                 self.color,
-                Form({GamePosition(-p.y, p.x) for p in self.form.position_set}),
+                Form.canonical(GamePosition(-p.y, p.x) for p in self.form.position_set),
             )
         if angle == 180:
             return Piece(
                 self.color,
-                Form({GamePosition(-p.x, -p.y) for p in self.form.position_set}),
+                Form.canonical(
+                    GamePosition(-p.x, -p.y) for p in self.form.position_set
+                ),
             )
         if angle == 270:
             return Piece(
                 self.color,
-                Form({GamePosition(p.y, -p.x) for p in self.form.position_set}),
+                Form.canonical(GamePosition(p.y, -p.x) for p in self.form.position_set),
             )
         raise ValueError("Angle must be 0, 90, 180, or 270")
 
@@ -73,23 +76,26 @@ class Piece:
         if axis == "x":
             return Piece(
                 self.color,
-                Form({GamePosition(p.x, -p.y) for p in self.form.position_set}),
+                Form.canonical(GamePosition(p.x, -p.y) for p in self.form.position_set),
             )
         if axis == "y":
             return Piece(
                 self.color,
-                Form({GamePosition(-p.x, p.y) for p in self.form.position_set}),
+                Form.canonical(GamePosition(-p.x, p.y) for p in self.form.position_set),
             )
         raise ValueError("Axis must be 'horizontal' or 'vertical'")
 
-    def all_transformations(self) -> set[Form]:
-        transformations = set()
-        for angle in [0, 90, 180, 270]:
-            rotated = self.rotate(angle)
-            transformations.add(rotated.form)
-            transformations.add(rotated.mirror("x").form)
-            transformations.add(rotated.mirror("y").form)
-        return transformations
+    def all_transformations(self) -> frozenset[Form]:
+        """Distinct orientations of the form, computed once per piece."""
+        if self._transformations is None:
+            transformations = set()
+            for angle in [0, 90, 180, 270]:
+                rotated = self.rotate(angle)
+                transformations.add(rotated.form)
+                transformations.add(rotated.mirror("x").form)
+                transformations.add(rotated.mirror("y").form)
+            self._transformations = frozenset(transformations)
+        return self._transformations
 
     def delete_from_board(
         self, board: GameBoard
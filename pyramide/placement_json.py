@@ -0,0 +1,44 @@
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from pyramide.game_position import GamePosition
+from pyramide.piece import Piece
+from pyramide.placement_table import PlacementTable
+
+# Positions are written as sorted lists of [x, y] cells and a placed piece as
+# {"color": <color name>, "cells": <positions>}. Work units and puzzle files
+# share this form.
+
+
+def positions_to_json(positions: Iterable[GamePosition]) -> list[list[int]]:
+    """The cells of ``positions`` as sorted ``[x, y]`` pairs."""
+    return sorted([p.x, p.y] for p in positions)
+
+
+def positions_from_json(cells: Iterable[Sequence[int]]) -> frozenset[GamePosition]:
+    """Reads the cells of `positions_to_json`."""
+    return frozenset(GamePosition(x, y) for x, y in cells)
+
+
+def placement_to_json(
+    piece: Piece, positions: Iterable[GamePosition]
+) -> dict[str, Any]:
+    """The color of ``piece`` and its cells."""
+    return {"color": piece.color.name, "cells": positions_to_json(positions)}
+
+
+def placed_pieces_to_json(
+    placed: Iterable[tuple[Piece, Iterable[GamePosition]]],
+) -> list[dict[str, Any]]:
+    """Every placed piece with its cells, by color."""
+    placements = [placement_to_json(piece, positions) for piece, positions in placed]
+    return sorted(placements, key=lambda placement: placement["color"])
+
+
+def placements_to_json(
+    table: PlacementTable, placement_ids: Iterable[int]
+) -> list[dict[str, Any]]:
+    """The pieces and cells of placement ids of ``table``, by color."""
+    return placed_pieces_to_json(
+        (table.piece_of(i), table.positions_of(i)) for i in placement_ids
+    )
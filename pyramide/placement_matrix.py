@@ -0,0 +1,92 @@
+from collections.abc import Iterable
+
+from pyramide.cell_index import CellIndex
+from pyramide.piece import Piece
+
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:  # numpy is optional
+    np = None
+
+
+class PlacementMatrix:
+    """Every legal placement of every piece as a row of a boolean matrix.
+
+    NumPy version of the placement generation of `PlacementTable`. The base
+    board is a boolean grid and all orientations of all pieces are padded to
+    one kernel size, so the legal translations of every orientation come out of
+    one correlation of the grid with the stacked kernels. Column ``i`` of
+    ``matrix`` is cell ``i`` of the `CellIndex`; rows are grouped by piece and
+    sorted by mask, in the order of the placement ids of `PlacementTable`.
+    """
+
+    def __init__(self, pieces: Iterable[Piece], cell_index: CellIndex) -> None:
+        """
+        Computes the placements of ``pieces`` on the board of ``cell_index``.
+
+        :raises ImportError: if numpy is not installed.
+        """
+        if np is None:
+            raise ImportError("PlacementMatrix needs numpy")
+        forms = [
+            (piece_index, form)
+            for piece_index, piece in enumerate(pieces)
+            for form in piece.all_transformations()
+        ]
+        cell_count = len(cell_index)
+        if not forms or not cell_count:
+            self.matrix = np.zeros((0, cell_count), dtype=bool)
+            self.piece_indexes = np.zeros(0, dtype=np.intp)
+            self.masks: tuple[int, ...] = ()
+            return
+
+        kernel_height = max(p.y for _, form in forms for p in form.position_set) + 1
+        kernel_width = max(p.x for _, form in forms for p in form.position_set) + 1
+        kernels = np.zeros((len(forms), kernel_height, kernel_width), dtype=bool)
+        for n, (_, form) in enumerate(forms):
+            for position in form.position_set:
+                kernels[n, position.y, position.x] = True
+
+        # cell index of every grid point, -1 off the board; the padding lets
+        # every kernel slide over every grid point
+        xs = np.array([p.x for p in cell_index.positions])
+        ys = np.array([p.y for p in cell_index.positions])
+        min_x, min_y = xs.min(), ys.min()
+        cell_ids = np.full(
+            (
+                ys.max() - min_y + kernel_height,
+                xs.max() - min_x + kernel_width,
+            ),
+            -1,
+            dtype=np.intp,
+        )
+        cell_ids[ys - min_y, xs - min_x] = np.arange(cell_count)
+        id_windows = sliding_window_view(cell_ids, (kernel_height, kernel_width))
+
+        # number of kernel cells off the board for every translation
+        off_board = np.tensordot(
+            kernels.astype(np.float32),
+            (id_windows < 0).astype(np.float32),
+            axes=([1, 2], [2, 3]),
+        )
+        form_numbers, window_ys, window_xs = np.nonzero(off_board == 0)
+
+        selected = kernels[form_numbers]
+        rows = np.nonzero(selected)[0]
+        matrix = np.zeros((len(form_numbers), cell_count), dtype=bool)
+        matrix[rows, id_windows[window_ys, window_xs][selected]] = True
+
+        packed = np.packbits(matrix, axis=1, bitorder="little")
+        masks = [int.from_bytes(row.tobytes(), "little") for row in packed]
+        piece_indexes = [forms[n][0] for n in form_numbers.tolist()]
+        order = sorted(range(len(masks)), key=lambda i: (piece_indexes[i], masks[i]))
+        self.matrix = matrix[order]
+        self.piece_indexes = np.array(piece_indexes, dtype=np.intp)[order]
+        self.masks = tuple(masks[i] for i in order)
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} with {len(self)} placements>"
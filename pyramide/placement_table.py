@@ -0,0 +1,139 @@
+import hashlib
+from collections.abc import Iterable
+from functools import lru_cache
+
+from pyramide.cell_index import CellIndex, iter_bits
+from pyramide.game_board import GameBoard
+from pyramide.game_position import GamePosition
+from pyramide.piece import Piece
+from pyramide.placement_matrix import PlacementMatrix
+
+
+class PlacementTable:
+    """Every legal placement of every piece on a base board.
+
+    A placement is one orientation of a piece translated onto the board. It is
+    identified by its index (the placement id) and stored as a mask of the
+    table's `CellIndex`. Boards of challenges are subsets of the base board, so
+    one table serves all of them: the solver only keeps the placements whose
+    mask lies inside the cells that are still free.
+    """
+
+    def __init__(
+        self, pieces: Iterable[Piece], board: GameBoard, use_numpy: bool = False
+    ) -> None:
+        """
+        Generates the placements, with ``use_numpy`` as a `PlacementMatrix`.
+
+        :raises ImportError: if ``use_numpy`` is set and numpy is not installed.
+        """
+        self.pieces = tuple(pieces)
+        self.board = board
+        self.cell_index = CellIndex(board)
+
+        if use_numpy:
+            placement_matrix = PlacementMatrix(self.pieces, self.cell_index)
+            masks = list(placement_matrix.masks)
+            piece_indexes = placement_matrix.piece_indexes.tolist()
+        else:
+            masks = []
+            piece_indexes = []
+            for piece_index, piece in enumerate(self.pieces):
+                piece_masks = sorted(
+                    {
+                        mask
+                        for form in piece.all_transformations()
+                        for mask in self.cell_index.form_masks(form)
+                    }
+                )
+                masks.extend(piece_masks)
+                piece_indexes.extend([piece_index] * len(piece_masks))
+        self.masks = tuple(masks)
+        self.piece_indexes = tuple(piece_indexes)
+        placement_ids: list[list[int]] = [[] for _ in self.pieces]
+        for placement_id, piece_index in enumerate(piece_indexes):
+            placement_ids[piece_index].append(placement_id)
+        self.placement_ids: dict[Piece, tuple[int, ...]] = {
+            piece: tuple(ids)
+            for piece, ids in zip(self.pieces, placement_ids, strict=True)
+        }
+        self.piece_index = {piece: i for i, piece in enumerate(self.pieces)}
+        self.border_masks = tuple(map(self.cell_index.border_mask, self.masks))
+
+        # inverted index: placement ids covering each cell of the cell index
+        cell_placement_ids: list[list[int]] = [[] for _ in self.cell_index.positions]
+        for placement_id, mask in enumerate(self.masks):
+            for cell in iter_bits(mask):
+                cell_placement_ids[cell].append(placement_id)
+        self.cell_placement_ids = tuple(map(tuple, cell_placement_ids))
+        self._positions: list[frozenset[GamePosition] | None] = [None] * len(masks)
+
+    @classmethod
+    def get(cls, pieces: Iterable[Piece], board: GameBoard) -> "PlacementTable":
+        """Returns the shared table for these pieces and this board."""
+        return _get_placement_table(tuple(pieces), board)
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} with {len(self)} placements"
+            f" of {len(self.pieces)} pieces>"
+        )
+
+    def key(self) -> str:
+        """A fingerprint of the pieces and the board, which fix the placement ids."""
+        data = (
+            [
+                (piece.color.name, sorted((p.x, p.y) for p in piece.form.position_set))
+                for piece in self.pieces
+            ],
+            sorted((p.x, p.y) for p in self.board.position_set),
+        )
+        return hashlib.sha256(repr(data).encode()).hexdigest()[:16]
+
+    def covers(self, pieces: Iterable[Piece], board: GameBoard) -> bool:
+        return all(piece in self.placement_ids for piece in pieces) and (
+            board.position_set.issubset(self.board.position_set)
+        )
+
+    def piece_of(self, placement_id: int) -> Piece:
+        return self.pieces[self.piece_indexes[placement_id]]
+
+    def positions_of(self, placement_id: int) -> frozenset[GamePosition]:
+        """The positions of a placement, shared by every solution using it."""
+        positions = self._positions[placement_id]
+        if positions is None:
+            positions = self.cell_index.to_positions(self.masks[placement_id])
+            self._positions[placement_id] = positions
+        return positions
+
+    def placement_id(self, piece: Piece, positions: Iterable[GamePosition]) -> int:
+        """
+        The id of the placement of ``piece`` on exactly these positions.
+
+        :raises ValueError: if the piece cannot be placed on the positions.
+        """
+        try:
+            mask = self.cell_index.to_mask(positions)
+        except KeyError:
+            raise ValueError(f"{piece.color.name} is placed off the board") from None
+        for placement_id in self.placement_ids[piece]:
+            if self.masks[placement_id] == mask:
+                return placement_id
+        raise ValueError(f"{piece.color.name} does not fit its positions")
+
+    def fitting_placement_ids(self, piece: Piece, free: int) -> list[int]:
+        """Ids of all placements of ``piece`` inside the ``free`` cells."""
+        masks = self.masks
+        return [
+            placement_id
+            for placement_id in self.placement_ids[piece]
+            if masks[placement_id] & free == masks[placement_id]
+        ]
+
+
+@lru_cache(maxsize=16)
+def _get_placement_table(pieces: tuple[Piece, ...], board: GameBoard) -> PlacementTable:
+    return PlacementTable(pieces, board)
@@ -0,0 +1,140 @@
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from pyramide.challenge import Challenge
+from pyramide.color import Color
+from pyramide.game_position import GamePosition
+from pyramide.placement_json import (
+    placed_pieces_to_json,
+    positions_from_json,
+    positions_to_json,
+)
+from pyramide.solved_game import SolvedGame
+
+# A puzzle file lists challenges, as JSON or as drawn boards. The JSON form is
+# one challenge or a list of them, the cells of every placed piece by color:
+#
+#     [{"name": "game2", "placed": {"white": [[7, 1], [8, 0], [8, 1]]}}]
+#
+# The text form starts every challenge with a line "challenge <name>", then
+# names the letters used for the placed pieces, one "<letter> = <color>" line
+# each, and draws the board like `GameBoard.__str__`, top row first. The
+# bottom row is y = 0 and the first column x = 0. A letter marks a cell of
+# that piece, any other character, a space too, a free cell or no cell, so
+# rows must not be indented. Rows of "-" are skipped:
+#
+#     challenge game2
+#     W = white
+#     O = orange
+#     ---------
+#     .........
+#     ...
+#     ......OOO
+#     ......OWW
+#     ........W
+#     ---------
+
+CHALLENGE_KEYWORD = "challenge"
+
+
+def _color(name: str) -> Color:
+    try:
+        return Color[name]
+    except KeyError:
+        raise ValueError(f"Unknown color {name!r}") from None
+
+
+def challenge_to_json(challenge: Challenge) -> dict[str, Any]:
+    """The name and the placed pieces of ``challenge``."""
+    return {
+        "name": challenge.name,
+        "placed": {
+            color.name: positions_to_json(positions)
+            for color, positions in challenge.placed.items()
+        },
+    }
+
+
+def challenge_from_json(data: dict[str, Any]) -> Challenge:
+    """
+    Reads a challenge of `challenge_to_json`.
+
+    :raises ValueError: if a field is missing or a color is unknown.
+    """
+    try:
+        return Challenge(
+            data["name"],
+            {
+                _color(color): positions_from_json(cells)
+                for color, cells in data["placed"].items()
+            },
+        )
+    except (KeyError, TypeError, AttributeError):
+        raise ValueError(f"Not a challenge: {data!r}") from None
+
+
+def _drawn_challenge(
+    name: str, legend: dict[str, Color], rows: Sequence[str]
+) -> Challenge:
+    placed: dict[Color, set[GamePosition]] = {color: set() for color in legend.values()}
+    for y, row in enumerate(reversed(rows)):
+        for x, cell in enumerate(row):
+            if cell in legend:
+                placed[legend[cell]].add(GamePosition(x, y))
+            elif cell.isalpha():
+                raise ValueError(f"{name}: the letter {cell!r} names no color")
+    for color, positions in placed.items():
+        if not positions:
+            raise ValueError(f"{name}: {color.name} is not drawn")
+    return Challenge(name, placed)
+
+
+def _challenges_from_text(text: str) -> list[Challenge]:
+    challenges: list[Challenge] = []
+    name: str | None = None
+    legend: dict[str, Color] = {}
+    rows: list[str] = []
+    for number, raw_line in enumerate(text.splitlines(), 1):
+        line = raw_line.strip()
+        if not line or set(line) == {"-"}:
+            continue
+        keyword, _, rest = line.partition(" ")
+        if keyword == CHALLENGE_KEYWORD:
+            if name is not None:
+                challenges.append(_drawn_challenge(name, legend, rows))
+            name, legend, rows = rest.strip(), {}, []
+            if not name:
+                raise ValueError(f"Line {number}: the challenge has no name")
+        elif name is None:
+            raise ValueError(f"Line {number}: expected '{CHALLENGE_KEYWORD} <name>'")
+        elif "=" in line:
+            letter, _, color = (part.strip() for part in line.partition("="))
+            if len(letter) != 1 or not letter.isalpha():
+                raise ValueError(f"Line {number}: {letter!r} is not a letter")
+            legend[letter] = _color(color)
+        else:
+            # leading spaces are free cells or no cells, they shift x
+            rows.append(raw_line.rstrip())
+    if name is not None:
+        challenges.append(_drawn_challenge(name, legend, rows))
+    return challenges
+
+
+def parse_challenges(text: str) -> list[Challenge]:
+    """
+    Reads the challenges of a puzzle file, JSON or drawn boards.
+
+    :raises ValueError: if the file is malformed or names an unknown color.
+    """
+    if not text.lstrip().startswith(("{", "[")):
+        return _challenges_from_text(text)
+    data = json.loads(text)
+    if isinstance(data, dict):
+        data = [data]
+    return [challenge_from_json(challenge) for challenge in data]
+
+
+def solution_to_json(solution: SolvedGame) -> list[dict[str, Any]]:
+    """The color and the cells of every piece of ``solution``, by color."""
+    return placed_pieces_to_json(solution.gameboard)
@@ -0,0 +1,70 @@
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from functools import lru_cache
+
+from pyramide.cell_index import iter_bits
+
+
+class RegionPruner:
+    """Rejects boards whose isolated regions cannot be filled by the pieces left.
+
+    Only sound if the pieces have to fill the free cells exactly: then every
+    region has to be the sum of the sizes of some remaining pieces, and all
+    regions together have to be a partition of the remaining pieces.
+    """
+
+    def __init__(self, piece_sizes: Sequence[int]) -> None:
+        """``piece_sizes`` are indexed like the bits of the piece masks."""
+        self.piece_sizes = tuple(piece_sizes)
+        self._subset_sums: dict[int, int] = {}
+
+    def subset_sums(self, pieces: int) -> int:
+        """Bitset with bit ``s`` set if some of the ``pieces`` have ``s`` cells."""
+        sums = self._subset_sums.get(pieces)
+        if sums is None:
+            sums = 1
+            for piece_index in iter_bits(pieces):
+                sums |= sums << self.piece_sizes[piece_index]
+            self._subset_sums[pieces] = sums
+        return sums
+
+    def can_fill(self, region_sizes: Sequence[int], pieces: int) -> bool:
+        sums = self.subset_sums(pieces)
+        if not all(sums >> size & 1 for size in region_sizes):
+            return False
+        if len(region_sizes) < 2:
+            return True
+        size_counts = Counter(self.piece_sizes[i] for i in iter_bits(pieces))
+        return _can_partition(
+            tuple(sorted(size_counts.items())), tuple(sorted(region_sizes))
+        )
+
+
+@lru_cache(maxsize=1 << 16)
+def _can_partition(
+    size_counts: tuple[tuple[int, int], ...], region_sizes: tuple[int, ...]
+) -> bool:
+    if not region_sizes:
+        return True
+    first, rest = region_sizes[0], region_sizes[1:]
+    return any(
+        _can_partition(remaining, rest) for remaining in _fill(size_counts, first)
+    )
+
+
+def _fill(
+    size_counts: tuple[tuple[int, int], ...], region_size: int
+) -> Iterator[tuple[tuple[int, int], ...]]:
+    """Yields the piece sizes left over after filling one region exactly."""
+    if region_size == 0:
+        yield size_counts
+        return
+    if not size_counts:
+        return
+    (size, count), rest = size_counts[0], size_counts[1:]
+    for used in range(min(count, region_size // size), -1, -1):
+        for remaining in _fill(rest, region_size - used * size):
+            if used < count:
+                yield ((size, count - used), *remaining)
+            else:
+                yield remaining
@@ -0,0 +1,385 @@
+from collections.abc import Callable, Iterable, Iterator, Sequence
+
+from pyramide.cell_index import iter_bits
+from pyramide.placement_table import PlacementTable
+from pyramide.region_pruner import RegionPruner
+from pyramide.search_stats import SearchStats
+from pyramide.transposition_table import TranspositionTable
+
+# search steps between two calls of `SearchCore.interrupt`
+_INTERRUPT_INTERVAL = 1024
+
+
+class SearchCore:
+    """Depth-first search on one mutable bitboard state.
+
+    The state is the mask of free cells, their connected regions and the mask of
+    unplaced pieces (piece indexes of the placement table). `apply` places a
+    piece and pushes what is needed to take it back onto a stack, `undo` pops
+    it again, so a search allocates next to nothing per node.
+    """
+
+    def __init__(
+        self,
+        table: PlacementTable,
+        free: int,
+        unplaced: int,
+        min_isolated_space: int,
+        transposition_table: TranspositionTable | None = None,
+    ) -> None:
+        """
+        Sets up the search for placing the ``unplaced`` pieces on ``free``.
+
+        Regions smaller than ``min_isolated_space`` are dead ends. If the
+        pieces fill the free cells exactly, regions have to be fillable by the
+        pieces left as well.
+        """
+        self.table = table
+        self.free = free
+        self.unplaced = unplaced
+        self.min_isolated_space = min_isolated_space
+        self.stats = SearchStats()
+        self.transposition_table = transposition_table
+        self.exact = (
+            sum(len(table.pieces[i]) for i in iter_bits(unplaced)) == free.bit_count()
+        )
+        self.regions = list(table.cell_index.components(free))
+        self.region_pruner = RegionPruner([len(piece) for piece in table.pieces])
+        self.placed: list[int] = []
+        self.interrupt: Callable[[], bool] | None = None
+        self.interrupted = False
+        self._steps = 0
+        self._frames: list[list] = []
+        self._undo_stack: list[tuple[int, int, int]] = []
+
+        self._cell_candidates = table.cell_placement_ids
+        self._piece_candidates = tuple(table.placement_ids[p] for p in table.pieces)
+        self._restricted = 0
+        self._restricted_key = 0
+
+    def restrict(self, piece_index: int, placement_ids: Iterable[int]) -> None:
+        """Only allows the given placements for the piece ``piece_index``."""
+        table = self.table
+        excluded = frozenset(table.placement_ids[table.pieces[piece_index]])
+        excluded = excluded.difference(placement_ids)
+        self._cell_candidates = tuple(
+            tuple(i for i in candidates if i not in excluded)
+            for candidates in table.cell_placement_ids
+        )
+        self._piece_candidates = tuple(
+            tuple(i for i in candidates if i not in excluded)
+            for candidates in self._piece_candidates
+        )
+        # sub-problems with the restricted piece differ from unrestricted ones
+        self._restricted = 1 << piece_index
+        self._restricted_key = 1 << len(table.pieces)
+
+    def apply(self, placement_id: int) -> bool:
+        """
+        Places a piece unless that leaves a dead end.
+
+        Returns whether the placement was applied; only then it has to be
+        taken back with `undo`.
+        """
+        table = self.table
+        stats = self.stats
+        stats.nodes += 1
+        mask = table.masks[placement_id]
+        regions = self.regions
+
+        # only the region under the placed piece can split, and every part of
+        # it touches the piece, so flood fill from the cells next to the piece
+        split = 0
+        while not regions[split] & mask:
+            split += 1
+        region = regions[split]
+        parts = list(
+            table.cell_index.components(region ^ mask, table.border_masks[placement_id])
+        )
+        for part in parts:
+            if part.bit_count() < self.min_isolated_space:
+                stats.pruned_min_region += 1
+                return False
+
+        unplaced = self.unplaced ^ 1 << table.piece_indexes[placement_id]
+        regions[split] = regions[-1]
+        regions[-1] = region
+        regions.pop()
+        regions.extend(parts)
+        if self.exact and not self.region_pruner.can_fill(
+            [r.bit_count() for r in regions], unplaced
+        ):
+            stats.pruned_subset_sum += 1
+            del regions[len(regions) - len(parts) :]
+            self._restore_region(split, region)
+            return False
+
+        self.free ^= mask
+        self.unplaced = unplaced
+        self.placed.append(placement_id)
+        self._undo_stack.append((split, region, len(parts)))
+        return True
+
+    def _restore_region(self, split: int, region: int) -> None:
+        regions = self.regions
+        if split < len(regions):
+            regions.append(regions[split])
+            regions[split] = region
+        else:
+            regions.append(region)
+
+    def undo(self) -> None:
+        """Takes back the last applied placement."""
+        placement_id = self.placed.pop()
+        split, region, part_count = self._undo_stack.pop()
+        if part_count:
+            del self.regions[-part_count:]
+        self._restore_region(split, region)
+        self.free ^= self.table.masks[placement_id]
+        self.unplaced ^= 1 << self.table.piece_indexes[placement_id]
+
+    def branch(self) -> list[int]:
+        """
+        Returns the placements to branch on, as few as possible.
+
+        If the pieces fill the board exactly, every free cell has to be covered,
+        so the cell covered by the fewest fitting placements is chosen.
+        Otherwise every piece has to be placed, so the piece with the fewest
+        fitting placements is chosen. An empty list means a dead end.
+        """
+        masks = self.table.masks
+        piece_indexes = self.table.piece_indexes
+        free = self.free
+        unplaced = self.unplaced
+        if self.exact:
+            candidate_lists = (self._cell_candidates[cell] for cell in iter_bits(free))
+        else:
+            candidate_lists = (
+                self._piece_candidates[piece_index]
+                for piece_index in iter_bits(unplaced)
+            )
+        best: list[int] | None = None
+        for candidates in candidate_lists:
+            placement_ids = [
+                placement_id
+                for placement_id in candidates
+                if unplaced >> piece_indexes[placement_id] & 1
+                and masks[placement_id] & free == masks[placement_id]
+            ]
+            if best is None or len(placement_ids) < len(best):
+                best = placement_ids
+                if len(best) <= 1:
+                    break
+        return best or []
+
+    def frontier(self, depth: int) -> Iterator[tuple[int, ...]]:
+        """
+        Yields the placements of every state ``depth`` levels further down.
+
+        Every completion of the current state extends exactly one yielded
+        tuple, so the tuples split the search into independent tasks. Dead
+        ends on the way are left out, solutions found earlier are yielded as
+        they are. Like `solutions` the tuples include the placements applied
+        before.
+        """
+        if depth == 0 or not self.unplaced:
+            yield tuple(self.placed)
+            return
+        for placement_id in self.branch():
+            if self.apply(placement_id):
+                try:
+                    yield from self.frontier(depth - 1)
+                finally:
+                    self.undo()
+
+    def solutions_below(
+        self,
+        placement_ids: Iterable[int],
+        position: Sequence[tuple[int, bool]] | None = None,
+    ) -> Iterator[tuple[int, ...]]:
+        """
+        Yields the solutions of the current state with ``placement_ids`` added.
+
+        Nothing is yielded if they lead to a dead end. The state is back where
+        it started afterwards. ``position`` is passed on to `solutions`.
+        """
+        applied = 0
+        try:
+            for placement_id in placement_ids:
+                if not self.apply(placement_id):
+                    return
+                applied += 1
+            yield from self.solutions(position)
+        finally:
+            for _ in range(applied):
+                self.undo()
+
+    def count(self) -> int:
+        """
+        Counts the completions of the current state without yielding them.
+
+        Sub-problems with a count in the transposition table are not searched
+        again and the counts of searched ones are stored, so with a table that
+        stores counts every sub-problem shared by several placement orders is
+        counted once. Like `solutions` the count stops early once `interrupt`
+        returns True; it is incomplete then and none of it is stored.
+        """
+        if not self.unplaced:
+            return 1
+        key = self._transposition_key()
+        transposition_table = self.transposition_table
+        if transposition_table is not None:
+            known = transposition_table.get(self.free, key)
+            if known is not None:
+                self.stats.pruned_transposition += 1
+                return known
+        self._steps += 1
+        if self._steps % _INTERRUPT_INTERVAL == 0 and self._interrupt_now():
+            return 0
+        solution_count = 0
+        for placement_id in self.branch():
+            if not self.apply(placement_id):
+                continue
+            try:
+                solution_count += self.count()
+            finally:
+                self.undo()
+            if self.interrupted:
+                return solution_count
+        if transposition_table is not None:
+            transposition_table.store(self.free, key, solution_count)
+        return solution_count
+
+    def count_below(self, placement_ids: Iterable[int]) -> int:
+        """Counts the solutions of the current state with ``placement_ids`` added."""
+        applied = 0
+        try:
+            for placement_id in placement_ids:
+                if not self.apply(placement_id):
+                    return 0
+                applied += 1
+            return self.count()
+        finally:
+            for _ in range(applied):
+                self.undo()
+
+    def _transposition_key(self) -> int:
+        if self.unplaced & self._restricted:
+            return self.unplaced | self._restricted_key
+        return self.unplaced
+
+    def _open_frame(self) -> list | None:
+        """A frame to search the current state from, None for a dead end."""
+        key = self._transposition_key()
+        transposition_table = self.transposition_table
+        if (
+            transposition_table is not None
+            and transposition_table.get(self.free, key) == 0
+        ):
+            self.stats.pruned_transposition += 1
+            return None
+        # candidates, next candidate, transposition key, solutions, child applied
+        return [self.branch(), 0, key, 0, False]
+
+    def _resume_frames(self, position: Sequence[tuple[int, bool]]) -> list[list]:
+        """
+        Rebuilds the frames and state of `position`.
+
+        :raises ValueError: if the position does not fit the search.
+        """
+        frames = []
+        for index, applied in position:
+            # the counts of resumed frames miss what was found before, so they
+            # are not stored
+            frame = [self.branch(), index, None, 0, False]
+            frames.append(frame)
+            if applied:
+                if not 0 < index <= len(frame[0]) or not self.apply(
+                    frame[0][index - 1]
+                ):
+                    raise ValueError("The position does not fit the search")
+                frame[4] = True
+        return frames
+
+    @property
+    def position(self) -> list[tuple[int, bool]]:
+        """
+        Where the last `solutions` is or stopped; empty once it is done.
+
+        It is a short list of ints and bools, one pair per level.
+        """
+        return [(frame[1], frame[4]) for frame in self._frames]
+
+    def _close_frame(self, frames: list[list]) -> None:
+        frame = frames.pop()
+        if self.transposition_table is not None and frame[2] is not None:
+            self.transposition_table.store(self.free, frame[2], frame[3])
+        if frames:
+            frames[-1][3] += frame[3]
+
+    def _interrupt_now(self) -> bool:
+        if self.interrupt is not None and self.interrupt():
+            self.interrupted = True
+        return self.interrupted
+
+    def solutions(  # noqa: C901, PLR0912
+        self, position: Sequence[tuple[int, bool]] | None = None
+    ) -> Iterator[tuple[int, ...]]:
+        """
+        Yields the placement ids of every completion of the current state.
+
+        The placements applied before are part of every yielded solution. The
+        state is back where it started when the generator is done or closed.
+        If `interrupt` is set, it is called every few steps and the search stops
+        early once it returns True; `interrupted` tells that it did. Passing
+        the `position` taken after a yielded solution or an interruption as
+        ``position`` goes on right there, from the same state.
+
+        :raises ValueError: if ``position`` does not fit the search.
+        """
+        if self.interrupted:
+            return
+        frames: list[list] = []
+        self._frames = frames
+        if not self.unplaced:
+            yield tuple(self.placed)
+            return
+        base_depth = len(self.placed)
+        # counted across calls, so many short searches are interrupted as well
+        steps = self._steps
+        try:
+            if position:
+                frames.extend(self._resume_frames(position))
+            else:
+                root = self._open_frame()
+                if root is None:
+                    return
+                frames.append(root)
+            while frames:
+                steps += 1
+                if steps % _INTERRUPT_INTERVAL == 0 and self._interrupt_now():
+                    # the open frames are incomplete and stored nowhere
+                    return
+                frame = frames[-1]
+                if frame[4]:
+                    self.undo()
+                    frame[4] = False
+                candidates, index = frame[0], frame[1]
+                while index < len(candidates) and not self.apply(candidates[index]):
+                    index += 1
+                if index == len(candidates):
+                    self._close_frame(frames)
+                    continue
+                frame[1] = index + 1
+                frame[4] = True
+                if not self.unplaced:
+                    frame[3] += 1
+                    yield tuple(self.placed)
+                    continue
+                child = self._open_frame()
+                if child is not None:
+                    frames.append(child)
+        finally:
+            self._steps = steps
+            while len(self.placed) > base_depth:
+                self.undo()
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+
+from pyramide.placement_table import PlacementTable
+from pyramide.search_core import SearchCore
+from pyramide.transposition_table import TranspositionTable
+
+
+@dataclass(frozen=True)
+class SearchSetup:
+    """Everything but the placement table needed to start a bitboard search.
+
+    Small enough to be sent along with every task to a worker that already
+    holds the placement table. ``restriction`` is a piece index and the only
+    placement ids allowed for it, see `SearchCore.restrict`.
+    """
+
+    free: int
+    unplaced: int
+    min_isolated_space: int
+    restriction: tuple[int, frozenset[int]] | None = None
+    transposition_table: TranspositionTable | None = None
+
+    def search_core(self, table: PlacementTable) -> SearchCore:
+        core = SearchCore(
+            table,
+            self.free,
+            self.unplaced,
+            self.min_isolated_space,
+            self.transposition_table,
+        )
+        if self.restriction is not None:
+            core.restrict(*self.restriction)
+        return core
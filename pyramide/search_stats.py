@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field, fields
+
+
+@dataclass
+class SearchStats:
+    """Counters of a search, filled by the bitboard engine.
+
+    ``worker_busy_time`` maps the process id of every worker of a parallel
+    search to the seconds it spent searching.
+    """
+
+    nodes: int = 0
+    pruned_min_region: int = 0
+    pruned_subset_sum: int = 0
+    pruned_transposition: int = 0
+    worker_busy_time: dict[int, float] = field(default_factory=dict)
+
+    def __iadd__(self, other: "SearchStats") -> "SearchStats":
+        for counter in fields(self):
+            value = getattr(other, counter.name)
+            if isinstance(value, dict):
+                merged = getattr(self, counter.name)
+                for key, amount in value.items():
+                    merged[key] = merged.get(key, 0) + amount
+            else:
+                setattr(self, counter.name, getattr(self, counter.name) + value)
+        return self
@@ -0,0 +1,218 @@
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+
+from pyramide.atomic_file import AtomicFile
+from pyramide.challenge import Challenge
+from pyramide.game import Game
+from pyramide.placement_table import PlacementTable
+from pyramide.solution_file import SolutionFile, SolutionWriter
+from pyramide.solved_game import SolvedGame
+from pyramide.solver_pool import SolverPool
+
+# A solution database is a directory with every solution of the empty base
+# board in a solution file and an index file. The index file starts with a
+# header: magic bytes, format version, the key of the placement table, the
+# number of placements and of solutions. Then follow the offsets of the
+# posting lists, one more than there are placements, and the posting lists:
+# the indexes of the solutions using each placement, in increasing order.
+# All numbers are little endian, offsets 8 bytes and indexes 4 bytes wide.
+
+SOLUTIONS_NAME = "solutions.bin"
+INDEX_NAME = "index.bin"
+INDEX_MAGIC = b"PYRI"
+INDEX_FORMAT_VERSION = 1
+_INDEX_HEADER = struct.Struct("<4sB16sII")
+
+
+def _little_endian(numbers: array) -> array:
+    if sys.byteorder == "big":
+        numbers.byteswap()
+    return numbers
+
+
+def _write_index(solutions: SolutionFile, path: Path) -> None:
+    table = solutions.table
+    postings = [array("I") for _ in range(len(table))]
+    for index in range(len(solutions)):
+        for placement_id in solutions.placement_ids(index):
+            postings[placement_id].append(index)
+    offsets = array("Q", [0])
+    for posting in postings:
+        offsets.append(offsets[-1] + len(posting) * posting.itemsize)
+    start = _INDEX_HEADER.size + len(offsets) * offsets.itemsize
+    offsets = array("Q", (start + offset for offset in offsets))
+    with AtomicFile(path, "wb") as file:
+        file.write(
+            _INDEX_HEADER.pack(
+                INDEX_MAGIC,
+                INDEX_FORMAT_VERSION,
+                table.key().encode("ascii"),
+                len(table),
+                len(solutions),
+            )
+        )
+        _little_endian(offsets).tofile(file)
+        for posting in postings:
+            _little_endian(posting).tofile(file)
+
+
+class SolutionDatabase:
+    """Every solution of the empty board, to answer challenges without search.
+
+    A challenge's solutions are the solutions of the empty board that use
+    all of its placed pieces. The index lists the solutions using each
+    placement, so they are found by intersecting the bitsets of the placed
+    pieces' placements. The database is built once, which enumerates every
+    solution, e.g.::
+
+        database = SolutionDatabase.build(directory, get_placement_table())
+        solutions = database.solutions(challenge)
+    """
+
+    def __init__(self, directory: Path | str, table: PlacementTable) -> None:
+        """
+        Maps the files of a database built with `build`.
+
+        :raises ValueError: if a file is damaged, of another format or of
+            another placement table.
+        """
+        self.directory = Path(directory)
+        self.table = table
+        self._solutions = SolutionFile(self.directory / SOLUTIONS_NAME, table)
+        path = self.directory / INDEX_NAME
+        with path.open("rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header(path)
+        except ValueError:
+            self.close()
+            raise
+
+    def _read_header(self, path: Path) -> None:
+        if len(self._map) < _INDEX_HEADER.size:
+            raise ValueError(f"{path} is not a solution index")
+        magic, version, key, placement_count, solution_count = (
+            _INDEX_HEADER.unpack_from(self._map)
+        )
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"{path} is not a solution index")
+        if version != INDEX_FORMAT_VERSION:
+            raise ValueError(f"{path} has an unsupported format version")
+        if key.decode("ascii") != self.table.key():
+            raise ValueError(f"{path} was written for another placement table")
+        if (placement_count, solution_count) != (len(self.table), len(self)):
+            raise ValueError(f"{path} does not index {self._solutions.path}")
+        end = _INDEX_HEADER.size + 8 * (placement_count + 1)
+        self._offsets = _little_endian(array("Q", self._map[_INDEX_HEADER.size : end]))
+        if self._offsets[-1] != len(self._map):
+            raise ValueError(f"{path} is truncated")
+
+    @classmethod
+    def build(
+        cls,
+        directory: Path | str,
+        table: PlacementTable,
+        parallel: bool = False,
+        pool: SolverPool | None = None,
+    ) -> "SolutionDatabase":
+        """
+        Writes the database of the empty board of ``table`` to ``directory``.
+
+        Every solution with all pieces of the table is searched like
+        `Game.solve` with ``break_symmetry``, ``parallel`` and ``pool``.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        game = Game(list(table.pieces), table.board, {}, table)
+        with SolutionWriter(directory / SOLUTIONS_NAME, table) as writer:
+            writer.write_all(game.solve(parallel, break_symmetry=True, pool=pool))
+        with SolutionFile(directory / SOLUTIONS_NAME, table) as solutions:
+            _write_index(solutions, directory / INDEX_NAME)
+        return cls(directory, table)
+
+    def __enter__(self) -> "SolutionDatabase":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} {self.directory} with {len(self)} solutions>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._solutions)
+
+    def bitset(self, placement_id: int) -> int:
+        """The solutions using a placement, bit ``i`` for the solution ``i``."""
+        posting = _little_endian(
+            array(
+                "I",
+                self._map[
+                    self._offsets[placement_id] : self._offsets[placement_id + 1]
+                ],
+            )
+        )
+        bits = bytearray((len(self) + 7) // 8)
+        for index in posting:
+            bits[index >> 3] |= 1 << (index & 7)
+        return int.from_bytes(bits, "little")
+
+    def _matching(self, challenge: Challenge) -> int | None:
+        matching = None
+        for placement_id in challenge.placement_ids(self.table):
+            bitset = self.bitset(placement_id)
+            matching = bitset if matching is None else matching & bitset
+        return matching
+
+    def solution_indexes(self, challenge: Challenge) -> list[int]:
+        """
+        The indexes of the solutions of ``challenge``, in increasing order.
+
+        :raises ValueError: if a placed color has no piece in the table, a
+            piece does not fit on its positions or placed pieces overlap.
+        """
+        matching = self._matching(challenge)
+        if matching is None:
+            return list(range(len(self)))
+        digits = bin(matching)[:1:-1]
+        indexes = []
+        index = digits.find("1")
+        while index != -1:
+            indexes.append(index)
+            index = digits.find("1", index + 1)
+        return indexes
+
+    def count(self, challenge: Challenge) -> int:
+        """
+        The number of solutions of ``challenge``.
+
+        :raises ValueError: like `solution_indexes`.
+        """
+        matching = self._matching(challenge)
+        return len(self) if matching is None else matching.bit_count()
+
+    def solutions(self, challenge: Challenge) -> Iterator[SolvedGame]:
+        """
+        The solutions of ``challenge``, decoded one by one.
+
+        :raises ValueError: like `solution_indexes`.
+        """
+        solutions = self._solutions
+        return (solutions[index] for index in self.solution_indexes(challenge))
+
+    def close(self) -> None:
+        """Unmaps the files."""
+        self._solutions.close()
+        self._map.close()
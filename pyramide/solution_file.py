@@ -0,0 +1,220 @@
+import mmap
+import struct
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+
+from pyramide.atomic_file import AtomicFile
+from pyramide.placement_table import PlacementTable
+from pyramide.solved_game import SolvedGame
+
+# A solution file starts with a header: magic bytes, format version, bytes
+# per placement id, placements per solution and the key of the placement
+# table. Then every solution follows as a fixed-width record of its placement
+# ids in increasing order, little endian.
+
+MAGIC = b"PYRS"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sBBH16s")
+_ID_FORMATS = {1: "B", 2: "H", 4: "I"}
+
+
+def _id_size(table: PlacementTable) -> int:
+    return next(size for size in _ID_FORMATS if len(table) < 1 << (8 * size))
+
+
+def _record_struct(id_size: int, pieces_per_solution: int) -> struct.Struct:
+    return struct.Struct(f"<{pieces_per_solution}{_ID_FORMATS[id_size]}")
+
+
+class SolutionWriter:
+    """Writes solutions to a solution file one by one, as they are found.
+
+    A solution takes a few bytes per piece instead of a `SolvedGame`, e.g.::
+
+        with SolutionWriter(path, game.placement_table) as writer:
+            writer.write_all(game.solve())
+
+    The file is written under another name and only gets its own when the
+    writer is closed without an error, so it is either complete or absent.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        table: PlacementTable,
+        pieces_per_solution: int | None = None,
+    ) -> None:
+        """By default a solution places every piece of ``table``."""
+        self.path = Path(path)
+        self.table = table
+        self.pieces_per_solution = (
+            len(table.pieces) if pieces_per_solution is None else pieces_per_solution
+        )
+        self.count = 0
+        id_size = _id_size(table)
+        self._record = _record_struct(id_size, self.pieces_per_solution)
+        self._placement_ids = {
+            (table.piece_indexes[placement_id], mask): placement_id
+            for placement_id, mask in enumerate(table.masks)
+        }
+        self._output = AtomicFile(self.path, "wb")
+        self._file = self._output.file
+        self._file.write(
+            _HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                id_size,
+                self.pieces_per_solution,
+                table.key().encode("ascii"),
+            )
+        )
+
+    def __enter__(self) -> "SolutionWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._output.discard()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.path} with {self.count} solutions>"
+
+    def write_placements(self, placement_ids: Iterable[int]) -> None:
+        """
+        Writes the solution placing these placement ids of the table.
+
+        :raises struct.error: if the number of placements is wrong.
+        """
+        self._file.write(self._record.pack(*sorted(placement_ids)))
+        self.count += 1
+
+    def write(self, solution: SolvedGame) -> None:
+        """
+        Writes a solution of a game on the table.
+
+        :raises KeyError: if a piece is placed where the table has no
+            placement for it.
+        """
+        table = self.table
+        self.write_placements(
+            self._placement_ids[
+                table.piece_index[piece], table.cell_index.to_mask(positions)
+            ]
+            for piece, positions in solution.gameboard
+        )
+
+    def write_all(self, solutions: Iterable[SolvedGame]) -> int:
+        """Writes all solutions, e.g. of `Game.solve`, and returns how many."""
+        count = self.count
+        for solution in solutions:
+            self.write(solution)
+        return self.count - count
+
+    def close(self) -> None:
+        """Completes the file."""
+        self._output.close()
+
+
+class SolutionFile:
+    """The solutions of a solution file, read from a memory map.
+
+    Solutions are decoded only when accessed, by index like a sequence::
+
+        with SolutionFile(path, table) as solutions:
+            print(len(solutions), solutions[-1])
+
+    The table must be the one the file was written with.
+    """
+
+    def __init__(self, path: Path | str, table: PlacementTable) -> None:
+        """
+        Maps the file and reads its header.
+
+        :raises ValueError: if the file is damaged, of another format or of
+            another placement table.
+        """
+        self.path = Path(path)
+        self.table = table
+        with self.path.open("rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header()
+        except ValueError:
+            self._map.close()
+            raise
+
+    def _read_header(self) -> None:
+        if len(self._map) < _HEADER.size:
+            raise ValueError(f"{self.path} is not a solution file")
+        magic, version, id_size, pieces_per_solution, key = _HEADER.unpack_from(
+            self._map
+        )
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a solution file")
+        if version != FORMAT_VERSION or id_size not in _ID_FORMATS:
+            raise ValueError(f"{self.path} has an unsupported format version")
+        if key.decode("ascii") != self.table.key():
+            raise ValueError(f"{self.path} was written for another placement table")
+        self.pieces_per_solution = pieces_per_solution
+        self._record = _record_struct(id_size, pieces_per_solution)
+        records, rest = divmod(len(self._map) - _HEADER.size, self._record.size)
+        if rest:
+            raise ValueError(f"{self.path} is truncated")
+        self._count = records
+
+    def __enter__(self) -> "SolutionFile":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.path} with {len(self)} solutions>"
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> SolvedGame:
+        """:raises IndexError: if there is no solution at ``index``."""
+        table = self.table
+        return SolvedGame(
+            frozenset(
+                (table.piece_of(placement_id), table.positions_of(placement_id))
+                for placement_id in self.placement_ids(index)
+            )
+        )
+
+    def __iter__(self) -> Iterator[SolvedGame]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def placement_ids(self, index: int) -> tuple[int, ...]:
+        """
+        The placement ids of the solution at ``index``, without decoding it.
+
+        :raises IndexError: if there is no solution at ``index``.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("solution index out of range")
+        return self._record.unpack_from(
+            self._map, _HEADER.size + index * self._record.size
+        )
+
+    def close(self) -> None:
+        """Unmaps the file."""
+        self._map.close()
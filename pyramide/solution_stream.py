@@ -0,0 +1,207 @@
+import multiprocessing
+import threading
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.queues import Queue
+from multiprocessing.synchronize import Event
+from queue import Empty
+from types import TracebackType
+from typing import Any
+
+# kinds of messages from the workers
+_ITEM = 0
+_DONE = 1
+_ERROR = 2
+
+# seconds to wait for a message before checking the workers are still alive
+_POLL_INTERVAL = 0.1
+
+# queue and stop event of a worker process, set by `_init_worker`
+_worker_queue: Queue | None = None
+_worker_stop: Event | None = None
+
+
+def _init_worker(
+    queue: Queue,
+    stop: Event,
+    initializer: Callable[..., object] | None,
+    initargs: Sequence[object],
+) -> None:
+    global _worker_queue, _worker_stop  # noqa: PLW0603
+    _worker_queue = queue
+    _worker_stop = stop
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def stop_requested() -> bool:
+    """Whether the run of the task in this worker process is being stopped.
+
+    Long tasks can poll it to stop between two items as well.
+    """
+    return _worker_stop is not None and _worker_stop.is_set()
+
+
+def _run_task(function: Callable[[Any], Generator], task: object, run: int) -> None:
+    queue, stop = _worker_queue, _worker_stop
+    assert queue is not None and stop is not None, "worker not initialized"
+    items = function(task)
+    try:
+        while not stop.is_set():
+            queue.put((run, _ITEM, next(items)))
+        items.close()
+        queue.put((run, _DONE, None))
+    except StopIteration as stop_iteration:
+        queue.put((run, _DONE, stop_iteration.value))
+    except Exception as error:
+        queue.put((run, _ERROR, error))
+
+
+class SolutionStream:
+    """Runs generator tasks in worker processes and yields what they yield.
+
+    Workers put every item into one bounded queue as soon as it is found, so
+    the first solutions arrive while the tasks are still running and a full
+    enumeration is never held in memory. A full queue blocks the workers until
+    the consumer catches up. Items arrive unordered. If the consumer stops
+    early, running tasks stop at their next item and pending ones are
+    cancelled.
+
+    Used as a context manager the worker processes are started once, run
+    ``initializer(*initargs)`` once and serve every `run` until the stream is
+    closed. Otherwise every `run` starts and stops its own workers.
+    """
+
+    def __init__(
+        self,
+        max_queued: int = 1024,
+        max_workers: int | None = None,
+        initializer: Callable[..., object] | None = None,
+        initargs: Sequence[object] = (),
+    ) -> None:
+        self.max_queued = max_queued
+        self.max_workers = max_workers
+        self.initializer = initializer
+        self.initargs = tuple(initargs)
+        self._executor: ProcessPoolExecutor | None = None
+        self._queue: Queue | None = None
+        self._stop: Event | None = None
+        self._runs = 0
+        self._running = False
+
+    def __enter__(self) -> "SolutionStream":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Starts the worker processes unless they are running already."""
+        if self._executor is not None:
+            return
+        context = multiprocessing.get_context()
+        self._queue = context.Queue(self.max_queued)
+        self._stop = context.Event()
+        self._executor = ProcessPoolExecutor(
+            self.max_workers,
+            context,
+            _init_worker,
+            (self._queue, self._stop, self.initializer, self.initargs),
+        )
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        if self._executor is None:
+            return
+        self._executor.shutdown()
+        self._executor = None
+        self._queue = None
+        self._stop = None
+
+    def run(
+        self,
+        function: Callable[[Any], Generator],
+        tasks: Iterable[object],
+        on_done: Callable[[Any], None] | None = None,
+        cancel: threading.Event | None = None,
+    ) -> Iterator[Any]:
+        """
+        Yields the items of ``function(task)`` for every task.
+
+        ``function`` has to be picklable, e.g. a module level function or a
+        bound method of a picklable object. ``on_done`` gets the return value
+        of every finished task. Once ``cancel`` is set, e.g. from another
+        thread, the tasks are stopped and the run ends without an error.
+
+        :raises RuntimeError: if another run of this stream is not done yet.
+        :raises Exception: the first exception raised by a task.
+        """
+        if self._running:
+            raise RuntimeError("The stream is busy with another run")
+        if self._executor is None:
+            with self:
+                yield from self._run(function, tasks, on_done, cancel)
+        else:
+            yield from self._run(function, tasks, on_done, cancel)
+
+    def _run(
+        self,
+        function: Callable[[Any], Generator],
+        tasks: Iterable[object],
+        on_done: Callable[[Any], None] | None,
+        cancel: threading.Event | None,
+    ) -> Iterator[Any]:
+        executor, queue, stop = self._executor, self._queue, self._stop
+        assert executor is not None and queue is not None and stop is not None
+        # messages of an earlier, stopped run can still be in the queue
+        self._runs += 1
+        run = self._runs
+        self._running = True
+        stop.clear()
+        futures = [executor.submit(_run_task, function, task, run) for task in tasks]
+        pending = len(futures)
+        try:
+            while pending and not (cancel is not None and cancel.is_set()):
+                try:
+                    message_run, kind, value = queue.get(timeout=_POLL_INTERVAL)
+                except Empty:
+                    self._check_workers(futures)
+                    continue
+                if message_run != run:
+                    continue
+                if kind == _ITEM:
+                    yield value
+                elif kind == _DONE:
+                    pending -= 1
+                    if on_done is not None:
+                        on_done(value)
+                else:
+                    raise value
+        finally:
+            if pending:
+                self._stop_run(futures)
+            self._running = False
+
+    def _stop_run(self, futures: list[Future]) -> None:
+        assert self._queue is not None and self._stop is not None
+        self._stop.set()
+        for future in futures:
+            future.cancel()
+        # running tasks may wait for room in the queue
+        while not all(future.done() for future in futures):
+            try:
+                self._queue.get(timeout=_POLL_INTERVAL)
+            except Empty:
+                pass
+
+    @staticmethod
+    def _check_workers(futures: list[Future]) -> None:
+        for future in futures:
+            if future.done() and future.exception() is not None:
+                raise future.exception()  # type: ignore[misc]
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+
+from pyramide.solved_game import SolvedGame
+
+# statuses of a `SolveResult`
+COMPLETE = "complete"
+MAX_NODES = "max_nodes"
+MAX_SECONDS = "max_seconds"
+MAX_SOLUTIONS = "max_solutions"
+
+
+@dataclass(frozen=True)
+class SolveBudget:
+    """Limits of one budgeted solve; None means unlimited.
+
+    ``max_nodes`` counts placements tried, like `SearchStats.nodes`. Node and
+    time limits are checked every few steps of the search, so a solve can run
+    slightly over them.
+    """
+
+    max_nodes: int | None = None
+    max_seconds: float | None = None
+    max_solutions: int | None = None
+
+    def __post_init__(self) -> None:
+        """:raises ValueError: if a limit is not positive."""
+        for name in (MAX_NODES, MAX_SECONDS, MAX_SOLUTIONS):
+            limit = getattr(self, name)
+            if limit is not None and limit <= 0:
+                raise ValueError(f"{name} must be positive")
+
+
+@dataclass(frozen=True)
+class SolveResult:
+    """The solutions found within a budget and why the solve stopped.
+
+    ``status`` is `COMPLETE` if every solution was found, otherwise the name
+    of the exhausted limit. ``continuation`` is None for a complete solve,
+    otherwise an opaque token to resume the search where it stopped.
+    """
+
+    solutions: list[SolvedGame]
+    status: str
+    continuation: str | None
+
+    @property
+    def complete(self) -> bool:
+        return self.status == COMPLETE
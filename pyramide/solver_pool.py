@@ -0,0 +1,245 @@
+import dataclasses
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping
+from multiprocessing.sharedctypes import Synchronized
+from types import TracebackType
+
+from pyramide.placement_table import PlacementTable
+from pyramide.search_core import SearchCore
+from pyramide.search_setup import SearchSetup
+from pyramide.search_stats import SearchStats
+from pyramide.solution_stream import SolutionStream, stop_requested
+from pyramide.transposition_table import TranspositionTable
+
+# search position of `SearchCore.position`
+Position = list[tuple[int, bool]]
+
+# placement ids, stats and transposition table counters of a task and, if it
+# was stopped early, where its search stopped
+TaskResult = tuple[
+    tuple[int, ...], SearchStats, TranspositionTable | None, Position | None
+]
+
+# search setup, placement ids to search below, node limit of the run and
+# position to go on from
+_Task = tuple[SearchSetup, tuple[int, ...], int | None, Position | None]
+
+# placement table and node count of the run of a worker process, set by
+# `_init_solver`
+_worker_table: PlacementTable | None = None
+_worker_nodes: Synchronized | None = None
+# transposition table of a worker process, kept from task to task as long as
+# the searches are alike, see `_worker_transposition_table`
+_worker_transpositions: TranspositionTable | None = None
+_worker_transpositions_key: tuple | None = None
+
+
+def _init_solver(table: PlacementTable, nodes: Synchronized) -> None:
+    global _worker_table, _worker_nodes, _worker_transpositions  # noqa: PLW0603
+    _worker_table = table
+    _worker_nodes = nodes
+    _worker_transpositions = None
+
+
+def _worker_transposition_table(setup: SearchSetup) -> TranspositionTable:
+    """
+    The worker's own table for a task, with the settings of the setup's one.
+
+    The table only arrives with its settings, see `TranspositionTable`. The
+    worker keeps its table for all following tasks of searches with the same
+    settings, so a sub-problem is searched once per worker, not once per task.
+    Its counters start from zero for every task.
+    """
+    global _worker_transpositions, _worker_transpositions_key  # noqa: PLW0603
+    settings = setup.transposition_table
+    assert settings is not None
+    key = (
+        settings.max_entries,
+        settings.store_counts,
+        setup.min_isolated_space,
+        setup.restriction,
+    )
+    if _worker_transpositions is None or key != _worker_transpositions_key:
+        _worker_transpositions = TranspositionTable(
+            settings.max_entries, settings.store_counts
+        )
+        _worker_transpositions_key = key
+    _worker_transpositions.reset_counters()
+    return _worker_transpositions
+
+
+class _NodeBudget:
+    """Interrupt of a task's search, adding its nodes to those of the run."""
+
+    def __init__(self, core: SearchCore, max_nodes: int | None) -> None:
+        self.core = core
+        self.max_nodes = max_nodes
+        self._reported = 0
+
+    def __call__(self) -> bool:
+        nodes = self.report()
+        return stop_requested() or (
+            self.max_nodes is not None and nodes >= self.max_nodes
+        )
+
+    def report(self) -> int:
+        """Adds the new nodes of the task and returns the nodes of the run."""
+        assert _worker_nodes is not None, "worker not initialized"
+        nodes = self.core.stats.nodes
+        with _worker_nodes.get_lock():
+            _worker_nodes.value += nodes - self._reported
+            run_nodes = _worker_nodes.value
+        self._reported = nodes
+        return run_nodes
+
+
+def _task_core(task: _Task) -> tuple[SearchCore, tuple[int, ...], _NodeBudget]:
+    assert _worker_table is not None, "worker not initialized"
+    setup, placement_ids, max_nodes, _ = task
+    if setup.transposition_table is not None:
+        setup = dataclasses.replace(
+            setup, transposition_table=_worker_transposition_table(setup)
+        )
+    core = setup.search_core(_worker_table)
+    budget = _NodeBudget(core, max_nodes)
+    core.interrupt = budget
+    return core, placement_ids, budget
+
+
+def _task_result(
+    core: SearchCore, placement_ids: tuple[int, ...], start: float
+) -> TaskResult:
+    core.stats.worker_busy_time[os.getpid()] = time.perf_counter() - start
+    counters = None
+    if core.transposition_table is not None:
+        # the worker's table lives on, only the counters of the task are sent
+        counters = TranspositionTable(
+            core.transposition_table.max_entries,
+            core.transposition_table.store_counts,
+        )
+        counters.add_counters(core.transposition_table)
+    position = core.position if core.interrupted else None
+    return placement_ids, core.stats, counters, position
+
+
+def _search(task: _Task) -> Generator[tuple[int, ...], None, TaskResult | None]:
+    start = time.perf_counter()
+    core, placement_ids, budget = _task_core(task)
+    if budget():
+        return None
+    yield from core.solutions_below(placement_ids, task[3])
+    budget.report()
+    return _task_result(core, placement_ids, start)
+
+
+def _count(task: _Task) -> Generator[int, None, TaskResult | None]:
+    start = time.perf_counter()
+    core, placement_ids, budget = _task_core(task)
+    if budget():
+        return None
+    yield core.count_below(placement_ids)
+    budget.report()
+    return _task_result(core, placement_ids, start)
+
+
+class SolverPool:
+    """Worker processes for the bitboard engine that outlive a single solve.
+
+    Every worker receives the placement table once when it starts. A task is
+    a small `SearchSetup` plus the placement ids to search below, so neither
+    the table nor a `Game` is pickled per task, and one pool serves every
+    game on the same table, e.g. many challenges solved back to back::
+
+        with SolverPool(table) as pool:
+            for game in games:
+                solutions = list(game.solve(parallel=True, pool=pool))
+
+    Without the ``with`` block every solve starts and stops its own workers.
+    """
+
+    def __init__(
+        self,
+        table: PlacementTable,
+        max_workers: int | None = None,
+        max_queued: int = 1024,
+    ) -> None:
+        self.table = table
+        self._nodes = multiprocessing.get_context().Value("q", 0)
+        self._stream = SolutionStream(
+            max_queued, max_workers, _init_solver, (table, self._nodes)
+        )
+
+    def __enter__(self) -> "SolverPool":
+        self._stream.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} for {self.table}>"
+
+    @property
+    def nodes(self) -> int:
+        """The nodes searched by the workers in the last run."""
+        return self._nodes.value
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        self._stream.close()
+
+    def solutions(  # noqa: PLR0913, PLR0917
+        self,
+        setup: SearchSetup,
+        tasks: Iterable[tuple[int, ...]],
+        on_done: Callable[[TaskResult | None], None] | None = None,
+        cancel: threading.Event | None = None,
+        max_nodes: int | None = None,
+        positions: Mapping[tuple[int, ...], Position] | None = None,
+    ) -> Iterator[tuple[int, ...]]:
+        """
+        Yields the solutions below the placement ids of every task, unordered.
+
+        ``on_done`` gets the placement ids, the stats and the transposition
+        table of every task and, if it was stopped early, its
+        `SearchCore.position` (None for a task stopped before it started).
+        It is called after all solutions of the task were yielded. Setting
+        ``cancel`` stops the searches in the workers within a few steps, and
+        so does reaching ``max_nodes`` `nodes` in all workers together. A
+        task with a position in ``positions`` goes on from there.
+        """
+        self._nodes.value = 0
+        if positions is None:
+            positions = {}
+        return self._stream.run(
+            _search,
+            ((setup, task, max_nodes, positions.get(task)) for task in tasks),
+            on_done,
+            cancel,
+        )
+
+    def counts(
+        self,
+        setup: SearchSetup,
+        tasks: Iterable[tuple[int, ...]],
+        on_done: Callable[[TaskResult | None], None] | None = None,
+        cancel: threading.Event | None = None,
+    ) -> Iterator[int]:
+        """
+        Yields the number of solutions below every task, like `solutions`.
+
+        The workers count the solutions themselves, see `SearchCore.count`,
+        and only send the counts.
+        """
+        self._nodes.value = 0
+        return self._stream.run(
+            _count, ((setup, task, None, None) for task in tasks), on_done, cancel
+        )
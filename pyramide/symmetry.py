@@ -0,0 +1,93 @@
+from collections.abc import Iterable
+
+from pyramide.cell_index import iter_bits
+from pyramide.game_position import GamePosition
+from pyramide.placement_table import PlacementTable
+
+# (a, b, c, d) maps (x, y) to (a * x + b * y, c * x + d * y)
+_TRANSFORMATIONS = (
+    (1, 0, 0, 1),
+    (0, -1, 1, 0),
+    (-1, 0, 0, -1),
+    (0, 1, -1, 0),
+    (1, 0, 0, -1),
+    (-1, 0, 0, 1),
+    (0, 1, 1, 0),
+    (0, -1, -1, 0),
+)
+
+
+class BoardSymmetry:
+    """The rotations and mirrors that map the free cells of a board onto itself.
+
+    Pieces may be placed in every orientation, so every symmetry of the free
+    cells maps a placement of a piece to another placement of the same piece
+    and a solution to another solution. The symmetries are kept as maps of the
+    fitting placement ids of the unplaced pieces; the identity comes first.
+    """
+
+    def __init__(self, table: PlacementTable, free: int, unplaced: int) -> None:
+        cell_index = table.cell_index
+        positions = [cell_index.positions[cell] for cell in iter_bits(free)]
+        min_x = min((p.x for p in positions), default=0)
+        min_y = min((p.y for p in positions), default=0)
+
+        cell_maps: list[dict[int, int]] = []
+        for a, b, c, d in _TRANSFORMATIONS:
+            mapped = [
+                GamePosition(a * p.x + b * p.y, c * p.x + d * p.y) for p in positions
+            ]
+            shift_x = min_x - min((p.x for p in mapped), default=0)
+            shift_y = min_y - min((p.y for p in mapped), default=0)
+            cell_map = {}
+            for position, image in zip(positions, mapped, strict=True):
+                cell = cell_index.index.get(
+                    GamePosition(image.x + shift_x, image.y + shift_y)
+                )
+                if cell is None or not free >> cell & 1:
+                    break
+                cell_map[cell_index.index[position]] = cell
+            else:
+                cell_maps.append(cell_map)
+
+        fitting = {
+            (table.piece_indexes[placement_id], table.masks[placement_id]): placement_id
+            for piece_index in iter_bits(unplaced)
+            for placement_id in table.fitting_placement_ids(
+                table.pieces[piece_index], free
+            )
+        }
+        self.placement_maps: list[dict[int, int]] = []
+        for cell_map in cell_maps:
+            placement_map = {}
+            for (piece_index, mask), placement_id in fitting.items():
+                image = 0
+                for cell in iter_bits(mask):
+                    image |= 1 << cell_map[cell]
+                placement_map[placement_id] = fitting[piece_index, image]
+            self.placement_maps.append(placement_map)
+
+    def __len__(self) -> int:
+        return len(self.placement_maps)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} with {len(self)} symmetries>"
+
+    def canonical_placement_ids(self, placement_ids: Iterable[int]) -> list[int]:
+        """The placements that are the smallest id of their orbit."""
+        return [
+            placement_id
+            for placement_id in placement_ids
+            if all(
+                placement_map[placement_id] >= placement_id
+                for placement_map in self.placement_maps
+            )
+        ]
+
+    def orbit(self, solution: Iterable[int]) -> list[tuple[int, ...]]:
+        """All distinct images of a solution, each as sorted placement ids."""
+        images = {
+            tuple(sorted(placement_map[placement_id] for placement_id in solution))
+            for placement_map in self.placement_maps
+        }
+        return sorted(images)
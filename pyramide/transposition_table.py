@@ -0,0 +1,72 @@
+from collections import OrderedDict
+from typing import Any
+
+
+class TranspositionTable:
+    """Remembers the solution counts of sub-problems seen during a search.
+
+    A sub-problem is identified by its free cells and its unplaced pieces, both
+    as masks. Different placement orders often lead to the same sub-problem, so
+    a known dead one (zero solutions) is skipped instead of searched again. With
+    ``store_counts`` the counts of solvable sub-problems are kept as well.
+
+    At most ``max_entries`` entries are kept; the least recently used one is
+    evicted first. When pickled (e.g. with the `SearchSetup` of a task) only
+    the settings and counters are kept. A `SolverPool` worker searches all its
+    tasks with one table of its own of these settings, so sub-problems seen
+    in one task of a worker are not searched again in the next.
+    """
+
+    def __init__(self, max_entries: int = 1 << 18, store_counts: bool = False) -> None:
+        """:raises ValueError: if ``max_entries`` is not positive."""
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.store_counts = store_counts
+        self._entries: OrderedDict[tuple[int, int], int] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} with {len(self)} entries,"
+            f" {self.hits} hits, {self.misses} misses>"
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_entries"] = OrderedDict()
+        return state
+
+    def get(self, free: int, unplaced: int) -> int | None:
+        """Returns the known solution count of the sub-problem or None."""
+        key = (free, unplaced)
+        solution_count = self._entries.get(key)
+        if solution_count is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return solution_count
+
+    def store(self, free: int, unplaced: int, solution_count: int) -> None:
+        if solution_count and not self.store_counts:
+            return
+        key = (free, unplaced)
+        self._entries[key] = solution_count
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def reset_counters(self) -> None:
+        self.hits = self.misses = self.evictions = 0
+
+    def add_counters(self, other: "TranspositionTable") -> None:
+        self.hits += other.hits
+        self.misses += other.misses
+        self.evictions += other.evictions
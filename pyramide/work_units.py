@@ -0,0 +1,249 @@
+import argparse
+import hashlib
+import json
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from pyramide.atomic_file import AtomicFile
+from pyramide.color import Color
+from pyramide.form import Form
+from pyramide.game import Game
+from pyramide.game_board import GameBoard
+from pyramide.piece import Piece
+from pyramide.placement_json import (
+    placement_to_json,
+    placements_to_json,
+    positions_from_json,
+    positions_to_json,
+)
+from pyramide.placement_table import PlacementTable
+
+# A work unit is one independent part of the search of a problem: the problem
+# itself plus the placements above the part, all as JSON, so it can be solved
+# on any machine. Exporting writes one file per unit and a manifest listing
+# them, solving writes one result file per unit and merging checks that every
+# unit of the manifest has exactly one complete result.
+
+FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+
+def problem_to_json(game: Game) -> dict[str, Any]:
+    """The pieces, base board, free board and placed pieces of ``game``."""
+    return {
+        "pieces": [
+            placement_to_json(piece, piece.form.position_set) for piece in game.pieces
+        ],
+        "board": positions_to_json(game.placement_table.board.position_set),
+        "free": positions_to_json(game.board.position_set),
+        "state": sorted(
+            (
+                placement_to_json(piece, positions)
+                for piece, positions in game.state.items()
+            ),
+            key=lambda placement: placement["color"],
+        ),
+    }
+
+
+def problem_from_json(problem: dict[str, Any]) -> Game:
+    """
+    Rebuilds the game of `problem_to_json`.
+
+    :raises KeyError: if a color is unknown or a field is missing.
+    :raises NotValidProblemError: if the board has too small isolated spaces.
+    """
+    pieces = [
+        Piece(Color[piece["color"]], Form(set(positions_from_json(piece["cells"]))))
+        for piece in problem["pieces"]
+    ]
+    pieces_by_color = {piece.color: piece for piece in pieces}
+    table = PlacementTable.get(pieces, GameBoard(positions_from_json(problem["board"])))
+    state = {
+        pieces_by_color[Color[placement["color"]]]: positions_from_json(
+            placement["cells"]
+        )
+        for placement in problem["state"]
+    }
+    return Game(pieces, GameBoard(positions_from_json(problem["free"])), state, table)
+
+
+def problem_id(problem: dict[str, Any]) -> str:
+    """A fingerprint of a problem, to tell results of different problems apart."""
+    canonical = json.dumps(problem, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    with AtomicFile(path) as file:
+        file.write(json.dumps(data))
+
+
+def _read_json(path: Path) -> dict[str, Any]:
+    data = json.loads(Path(path).read_text())
+    if data.get("version") != FORMAT_VERSION:
+        raise ValueError(f"{path} has an unsupported format version")
+    return data
+
+
+def export_work_units(game: Game, depth: int, directory: Path) -> Path:
+    """
+    Writes the states ``depth`` placements deep as work unit files.
+
+    Returns the path of the manifest, which lists every unit file.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    problem = problem_to_json(game)
+    fingerprint = problem_id(problem)
+    table = game.placement_table
+    unit_names = []
+    for number, placement_ids in enumerate(game.search_core().frontier(depth)):
+        unit_name = f"unit-{number:06d}.json"
+        _write_json(
+            directory / unit_name,
+            {
+                "version": FORMAT_VERSION,
+                "problem_id": fingerprint,
+                "problem": problem,
+                "unit": number,
+                "prefix": placements_to_json(table, placement_ids),
+            },
+        )
+        unit_names.append(unit_name)
+    manifest_path = directory / MANIFEST_NAME
+    _write_json(
+        manifest_path,
+        {
+            "version": FORMAT_VERSION,
+            "problem_id": fingerprint,
+            "problem": problem,
+            "depth": depth,
+            "units": unit_names,
+        },
+    )
+    return manifest_path
+
+
+def solve_work_unit(unit_path: Path, result_path: Path) -> int:
+    """
+    Solves one work unit and writes its solutions to ``result_path``.
+
+    Returns the number of solutions.
+
+    :raises ValueError: if the unit has another format version or does not
+        fit its problem.
+    """
+    unit = _read_json(unit_path)
+    game = problem_from_json(unit["problem"])
+    table = game.placement_table
+    pieces_by_color = {piece.color: piece for piece in table.pieces}
+    core = game.search_core()
+    for placement in unit["prefix"]:
+        piece = pieces_by_color[Color[placement["color"]]]
+        placement_id = table.placement_id(
+            piece, positions_from_json(placement["cells"])
+        )
+        if not core.apply(placement_id):
+            raise ValueError(f"{unit_path} does not fit its problem")
+    solutions = [
+        placements_to_json(table, placement_ids) for placement_ids in core.solutions()
+    ]
+    _write_json(
+        Path(result_path),
+        {
+            "version": FORMAT_VERSION,
+            "problem_id": unit["problem_id"],
+            "unit": unit["unit"],
+            "solution_count": len(solutions),
+            "solutions": solutions,
+        },
+    )
+    return len(solutions)
+
+
+def merge_work_results(
+    manifest_path: Path, result_paths: Iterable[Path], output_path: Path
+) -> int:
+    """
+    Combines the results of all units into one file of solutions.
+
+    Every line of the output is one solution, given as the placements of all
+    pieces including the ones placed in the problem. Returns the number of
+    solutions.
+
+    :raises ValueError: if a result belongs to another problem or is
+        incomplete, a unit has no result or more than one, or a solution is
+        found twice.
+    """
+    manifest = _read_json(manifest_path)
+    unit_count = len(manifest["units"])
+    results: dict[int, dict[str, Any]] = {}
+    for result_path in result_paths:
+        result = _read_json(result_path)
+        if result["problem_id"] != manifest["problem_id"]:
+            raise ValueError(f"{result_path} belongs to another problem")
+        unit = result["unit"]
+        if not 0 <= unit < unit_count:
+            raise ValueError(f"{result_path} has an unknown unit {unit}")
+        if unit in results:
+            raise ValueError(f"Unit {unit} has more than one result")
+        if result["solution_count"] != len(result["solutions"]):
+            raise ValueError(f"{result_path} is incomplete")
+        results[unit] = result
+    missing = sorted(set(range(unit_count)) - results.keys())
+    if missing:
+        raise ValueError(f"Units without result: {missing}")
+
+    state = manifest["problem"]["state"]
+    seen: set[str] = set()
+    with AtomicFile(output_path) as output:
+        for unit in range(unit_count):
+            for solution in results[unit]["solutions"]:
+                line = json.dumps(sorted([*state, *solution], key=lambda p: p["color"]))
+                if line in seen:
+                    raise ValueError(f"Unit {unit} repeats a solution")
+                seen.add(line)
+                output.write(line + "\n")
+    return len(seen)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m pyramide.work_units",
+        description="Split a search into work units, solve them and merge them.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    export_parser = commands.add_parser(
+        "export", help="write the work units of a problem file"
+    )
+    export_parser.add_argument("problem", type=Path)
+    export_parser.add_argument("directory", type=Path)
+    export_parser.add_argument("--depth", type=int, default=2)
+    solve_parser = commands.add_parser("solve", help="solve one work unit")
+    solve_parser.add_argument("unit", type=Path)
+    solve_parser.add_argument("result", type=Path)
+    merge_parser = commands.add_parser("merge", help="merge the results")
+    merge_parser.add_argument("manifest", type=Path)
+    merge_parser.add_argument("results", type=Path, nargs="+")
+    merge_parser.add_argument("--output", type=Path, required=True)
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == "export":
+        game = problem_from_json(json.loads(arguments.problem.read_text()))
+        manifest_path = export_work_units(game, arguments.depth, arguments.directory)
+        unit_count = len(json.loads(manifest_path.read_text())["units"])
+        print(f"{unit_count} work units, manifest {manifest_path}")
+    elif arguments.command == "solve":
+        solution_count = solve_work_unit(arguments.unit, arguments.result)
+        print(f"{solution_count} solutions in {arguments.unit}")
+    else:
+        solution_count = merge_work_results(
+            arguments.manifest, arguments.results, arguments.output
+        )
+        print(f"{solution_count} solutions of all units in {arguments.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import time
+from collections.abc import Callable
+
+from pyramide.game_board import GameBoard
+from pyramide.game_position import GamePosition
+from pyramide.placement_matrix import np
+from pyramide.placement_table import PlacementTable
+from scripts.iq_pyramide_helpers import get_gameboard, get_pieces
+
+
+def best_time(function: Callable[[], object], repeat: int = 3) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def delete_from_board(pieces: list, board: GameBoard) -> int:
+    # the placement generation of the object engine
+    return sum(
+        1
+        for piece in pieces
+        for form in piece.all_transformations()
+        for _ in form.delete_from_board(board)
+    )
+
+
+if __name__ == "__main__":
+    pieces = get_pieces()
+    boards = [("game board", get_gameboard())]
+    boards.extend(
+        (
+            f"{size}x{size} grid",
+            GameBoard({GamePosition(x, y) for x in range(size) for y in range(size)}),
+        )
+        for size in (10, 20, 40)
+    )
+
+    print(
+        f"{'board':>12} {'cells':>6} {'placements':>10} {'loop':>8} "
+        f"{'table':>8} {'numpy':>8}"
+    )
+    for name, board in boards:
+        table = PlacementTable(pieces, board)
+        loop_time = best_time(lambda b=board: delete_from_board(pieces, b))
+        table_time = best_time(lambda b=board: PlacementTable(pieces, b))
+        if np is None:
+            numpy_time = float("nan")
+        else:
+            assert PlacementTable(pieces, board, use_numpy=True).masks == table.masks
+            numpy_time = best_time(
+                lambda b=board: PlacementTable(pieces, b, use_numpy=True)
+            )
+        print(
+            f"{name:>12} {len(board):>6} {len(table):>10} {loop_time:>8.4f} "
+            f"{table_time:>8.4f} {numpy_time:>8.4f}"
+        )
+    if np is None:
+        print("numpy is not installed, no numpy timings")
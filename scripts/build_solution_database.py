@@ -0,0 +1,26 @@
+import argparse
+import time
+from pathlib import Path
+
+from pyramide.solution_database import SolutionDatabase
+from pyramide.solver_pool import SolverPool
+from scripts.iq_pyramide_helpers import get_placement_table
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Solve the empty board once and index every solution."
+    )
+    parser.add_argument("directory", type=Path)
+    arguments = parser.parse_args()
+
+    start = time.perf_counter()
+    table = get_placement_table()
+    with SolverPool(table) as pool:
+        database = SolutionDatabase.build(
+            arguments.directory, table, parallel=True, pool=pool
+        )
+    with database:
+        print(
+            f"{len(database)} solutions in {arguments.directory}"
+            f" after {time.perf_counter() - start:.0f} s"
+        )
@@ -0,0 +1,30 @@
+import argparse
+from pathlib import Path
+
+from pyramide.game import Game
+from pyramide.work_units import export_work_units
+from scripts.iq_pyramide_helpers import (
+    get_challenges,
+    get_gameboard,
+    get_pieces,
+    get_placement_table,
+)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Write the work units of a challenge or of the empty board."
+    )
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument(
+        "--challenge", help="name of a challenge, the empty board by default"
+    )
+    arguments = parser.parse_args()
+
+    if arguments.challenge is None:
+        game = Game(get_pieces(), get_gameboard(), {}, get_placement_table())
+    else:
+        challenges = {challenge.name: challenge for challenge in get_challenges()}
+        game = challenges[arguments.challenge].game(get_placement_table())
+    manifest_path = export_work_units(game, arguments.depth, arguments.directory)
+    print(f"Manifest {manifest_path}")
@@ -5,7 +5,11 @@ from pyramide.game_board import GameBoard
 from pyramide.game_board_gui import GameBoardGUI
 from pyramide.game_position import GamePosition
 from pyramide.piece import Piece
-from scripts.iq_pyramide_helpers import get_gameboard, get_pieces
+from scripts.iq_pyramide_helpers import (
+    get_gameboard,
+    get_pieces,
+    get_placement_table,
+)
 
 if __name__ == "__main__":
     pieces = get_pieces()
@@ -58,9 +62,9 @@ if __name__ == "__main__":
     assert len(new) == (len(gameboard) - 10)
     gameboard_new = GameBoard(new)
 
-    game = Game(pieces, gameboard_new, {})
+    game = Game(pieces, gameboard_new, {}, get_placement_table())
     game.sort_pieces()
-    valid_gameboards = game.solve(parallel=True)
+    valid_gameboards = game.solve(parallel=True, engine="bitboard")
 
     unique_valid_gameboards = set()
 
@@ -0,0 +1,35 @@
+import argparse
+from pathlib import Path
+
+from pyramide.batch_solver import BatchSolver
+from pyramide.puzzle_file import parse_challenges
+from scripts.iq_pyramide_helpers import get_challenges, get_placement_table
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Count the solutions of many challenges on all cores."
+    )
+    parser.add_argument(
+        "files",
+        type=Path,
+        nargs="*",
+        help="puzzle files, see pyramide.puzzle_file; the examples by default",
+    )
+    arguments = parser.parse_args()
+
+    if arguments.files:
+        challenges = [
+            challenge
+            for path in arguments.files
+            for challenge in parse_challenges(path.read_text())
+        ]
+    else:
+        challenges = get_challenges()
+    with BatchSolver(get_placement_table()) as batch_solver:
+        report = batch_solver.solve(challenges)
+    for result in report.results:
+        print(
+            f"{result.name}: {result.solution_count} solutions"
+            f" in {result.latency:.3f} s"
+        )
+    print(report)
@@ -0,0 +1,31 @@
+from pyramide.color import Color
+from pyramide.form import Form
+from pyramide.game_board import GameBoard
+from pyramide.game_position import GamePosition
+from pyramide.piece import Piece
+
+
+def grid(width: int = 4, height: int = 4) -> GameBoard:
+    """A board of ``width`` times ``height`` cells, (0, 0) at the bottom left."""
+    return GameBoard({GamePosition(x, y) for x in range(width) for y in range(height)})
+
+
+def l_pieces() -> list[Piece]:
+    """A red and a blue L, a yellow square and a green bar, to fill a `grid`."""
+    l_form = Form(
+        {
+            GamePosition(0, 0),
+            GamePosition(1, 0),
+            GamePosition(2, 0),
+            GamePosition(2, 1),
+        }
+    )
+    return [
+        Piece(Color.red, l_form),
+        Piece(Color.blue, l_form),
+        Piece(
+            Color.yellow,
+            Form({GamePosition(x, y) for x in range(2) for y in range(2)}),
+        ),
+        Piece(Color.green, Form({GamePosition(x, 0) for x in range(4)})),
+    ]
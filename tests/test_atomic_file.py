@@ -0,0 +1,37 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from pyramide.atomic_file import AtomicFile
+
+
+class TestAtomicFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.path = self.directory / "out" / "file.txt"
+
+    def test_replaces_file_when_closed(self) -> None:
+        with AtomicFile(self.path) as file:
+            file.write("new")
+            self.assertFalse(self.path.exists())
+        self.assertEqual(self.path.read_text(), "new")
+        self.assertEqual(list(self.path.parent.iterdir()), [self.path])
+
+    def test_error_keeps_old_file(self) -> None:
+        self.path.parent.mkdir()
+        self.path.write_text("old")
+        with self.assertRaises(RuntimeError), AtomicFile(self.path) as file:
+            file.write("new")
+            raise RuntimeError
+        self.assertEqual(self.path.read_text(), "old")
+        self.assertEqual(list(self.path.parent.iterdir()), [self.path])
+
+    def test_binary(self) -> None:
+        output = AtomicFile(self.path, "wb")
+        output.file.write(b"\x00\x01")
+        output.close()
+        self.assertEqual(self.path.read_bytes(), b"\x00\x01")
+
+
+if __name__ == "__main__":
+    unittest.main()
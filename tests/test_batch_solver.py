@@ -0,0 +1,57 @@
+import unittest
+
+from pyramide.batch_report import BatchReport, ChallengeResult
+from pyramide.batch_solver import BatchSolver
+from pyramide.challenge import Challenge
+from pyramide.color import Color
+from pyramide.game_position import GamePosition
+from scripts.iq_pyramide_helpers import get_challenges, get_placement_table
+
+
+class TestBatchReport(unittest.TestCase):
+    def setUp(self) -> None:
+        self.report = BatchReport(
+            [ChallengeResult(str(i), i, i / 10) for i in range(1, 11)], 2.0
+        )
+
+    def test_throughput(self) -> None:
+        self.assertEqual(self.report.puzzles_per_second, 5.0)
+        self.assertEqual(self.report.solution_count, 55)
+
+    def test_latency_percentile(self) -> None:
+        self.assertEqual(self.report.latency_percentile(50), 0.5)
+        self.assertEqual(self.report.latency_percentile(90), 0.9)
+        self.assertEqual(self.report.latency_percentile(100), 1.0)
+        self.assertEqual(self.report.latency_percentile(0), 0.1)
+        with self.assertRaises(ValueError):
+            self.report.latency_percentile(101)
+        with self.assertRaises(ValueError):
+            BatchReport([], 0.0).latency_percentile(50)
+
+    def test_str(self) -> None:
+        self.assertIn("5.00 puzzles/s", str(self.report))
+        self.assertIn("p90 0.900 s", str(self.report))
+
+
+class TestBatchSolver(unittest.TestCase):
+    def test_solve(self) -> None:
+        challenges = get_challenges()[1:]
+        with BatchSolver(get_placement_table(), max_workers=2) as batch_solver:
+            report = batch_solver.solve(challenges)
+            counts = {result.name: result.solution_count for result in report.results}
+            self.assertEqual(counts, {"game2": 11, "game3": 26})
+            self.assertGreater(report.puzzles_per_second, 0)
+            # the workers are reused
+            report = batch_solver.solve(challenges[:1])
+            self.assertEqual(report.solution_count, 11)
+
+    def test_invalid_challenge(self) -> None:
+        challenge = Challenge(
+            "x", {Color.white: {GamePosition(8, 0), GamePosition(8, 1)}}
+        )
+        with self.assertRaises(ValueError):
+            BatchSolver(get_placement_table()).solve([challenge])
+
+
+if __name__ == "__main__":
+    unittest.main()
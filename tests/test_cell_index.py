@@ -0,0 +1,86 @@
+import unittest
+
+from pyramide.cell_index import CellIndex
+from pyramide.form import Form
+from pyramide.game_board import GameBoard
+from pyramide.game_position import GamePosition
+
+
+class TestCellIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board = GameBoard(
+            {GamePosition(x, y) for x in range(3) for y in range(3)}
+        )  # 3x3 grid
+        self.cell_index = CellIndex(self.board)
+
+    def test_full_mask(self) -> None:
+        self.assertEqual(len(self.cell_index), 9)
+        self.assertEqual(self.cell_index.full_mask.bit_count(), 9)
+
+    def test_round_trip(self) -> None:
+        positions = frozenset({GamePosition(0, 0), GamePosition(2, 1)})
+        mask = self.cell_index.to_mask(positions)
+        self.assertEqual(mask.bit_count(), 2)
+        self.assertEqual(self.cell_index.to_positions(mask), positions)
+        self.assertEqual(
+            self.cell_index.mask_to_board(self.cell_index.board_to_mask(self.board)),
+            self.board,
+        )
+
+    def test_position_not_on_board(self) -> None:
+        with self.assertRaises(KeyError):
+            self.cell_index.to_mask({GamePosition(5, 5)})
+
+    def test_neighbor_tables(self) -> None:
+        center = self.cell_index.index[GamePosition(1, 1)]
+        corner = self.cell_index.index[GamePosition(0, 0)]
+        self.assertEqual(len(self.cell_index.neighbor_cells[center]), 4)
+        self.assertEqual(
+            {
+                self.cell_index.positions[c]
+                for c in self.cell_index.neighbor_cells[corner]
+            },
+            {GamePosition(1, 0), GamePosition(0, 1)},
+        )
+        self.assertEqual(
+            self.cell_index.neighbor_masks[corner],
+            self.cell_index.to_mask({GamePosition(1, 0), GamePosition(0, 1)}),
+        )
+
+    def test_form_masks(self) -> None:
+        form = Form({GamePosition(0, 0), GamePosition(1, 0), GamePosition(1, 1)})
+        masks = self.cell_index.form_masks(form)
+        self.assertEqual(len(masks), 4)
+        for mask in masks:
+            self.assertEqual(mask.bit_count(), 3)
+
+    def test_components(self) -> None:
+        mask = self.cell_index.to_mask(
+            {GamePosition(0, 0), GamePosition(1, 0), GamePosition(2, 2)}
+        )
+        components = sorted(
+            len(self.cell_index.to_positions(c))
+            for c in self.cell_index.components(mask)
+        )
+        self.assertEqual(components, [1, 2])
+        self.assertTrue(self.cell_index.has_min_connected_cells(mask, 1))
+        self.assertFalse(self.cell_index.has_min_connected_cells(mask, 2))
+
+    def test_components_from_seeds(self) -> None:
+        mask = self.cell_index.to_mask(
+            {GamePosition(0, 0), GamePosition(1, 0), GamePosition(2, 2)}
+        )
+        seeds = self.cell_index.to_mask({GamePosition(2, 2), GamePosition(1, 1)})
+        components = list(self.cell_index.components(mask, seeds))
+        self.assertEqual(components, [self.cell_index.to_mask({GamePosition(2, 2)})])
+
+    def test_border_mask(self) -> None:
+        mask = self.cell_index.to_mask({GamePosition(0, 0), GamePosition(1, 0)})
+        self.assertEqual(
+            self.cell_index.to_positions(self.cell_index.border_mask(mask)),
+            {GamePosition(2, 0), GamePosition(0, 1), GamePosition(1, 1)},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+from pyramide.challenge import Challenge
+from pyramide.color import Color
+from pyramide.game_position import GamePosition
+from pyramide.placement_table import PlacementTable
+from scripts.iq_pyramide_helpers import (
+    get_challenges,
+    get_gameboard,
+    get_pieces,
+    get_placement_table,
+)
+
+
+class TestChallenge(unittest.TestCase):
+    def test_game(self) -> None:
+        challenge = get_challenges()[1]
+        game = challenge.game(get_placement_table())
+        self.assertEqual(len(game.board), 55 - 7)
+        self.assertEqual(len(game.state), 2)
+        solutions = set(game.solve())
+        self.assertEqual(len(solutions), 11)
+        for solution in solutions:
+            self.assertEqual(len(solution.gameboard), 12)
+
+    def test_placement_ids(self) -> None:
+        table = get_placement_table()
+        challenge = get_challenges()[1]
+        placement_ids = challenge.placement_ids(table)
+        self.assertEqual(
+            {table.piece_of(i).color: table.positions_of(i) for i in placement_ids},
+            challenge.placed,
+        )
+
+    def test_unknown_color(self) -> None:
+        pieces = [p for p in get_pieces() if p.color != Color.yellow]
+        table = PlacementTable(pieces, get_gameboard())
+        challenge = Challenge("x", {Color.yellow: {GamePosition(8, 0)}})
+        with self.assertRaises(ValueError):
+            challenge.game(table)
+
+    def test_piece_does_not_fit(self) -> None:
+        challenge = Challenge(
+            "x", {Color.white: {GamePosition(8, 0), GamePosition(8, 1)}}
+        )
+        with self.assertRaisesRegex(ValueError, "white does not fit its positions"):
+            challenge.game(get_placement_table())
+
+    def test_off_board(self) -> None:
+        challenge = Challenge(
+            "x",
+            {
+                Color.white: {
+                    GamePosition(0, 0),
+                    GamePosition(1, 0),
+                    GamePosition(0, 1),
+                }
+            },
+        )
+        with self.assertRaisesRegex(ValueError, "white is placed off the board"):
+            challenge.game(get_placement_table())
+
+    def test_overlap(self) -> None:
+        challenge = Challenge(
+            "x",
+            {
+                Color.white: {
+                    GamePosition(7, 1),
+                    GamePosition(8, 0),
+                    GamePosition(8, 1),
+                },
+                Color.violet: {GamePosition(8, y) for y in range(4)},
+            },
+        )
+        with self.assertRaises(ValueError):
+            challenge.game(get_placement_table())
+
+
+if __name__ == "__main__":
+    unittest.main()
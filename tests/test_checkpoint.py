@@ -0,0 +1,113 @@
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from pyramide.checkpoint import Checkpoint
+from pyramide.game import Game
+from pyramide.game_board import GameBoard
+from pyramide.game_position import GamePosition
+from pyramide.solved_game import SolvedGame
+from tests.fixtures import grid, l_pieces
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board = grid()
+        self.pieces = l_pieces()
+        self.expected = set(Game(self.pieces, self.board, {}).solve())
+        self.directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.path = self.directory / "checkpoint.json"
+
+    def logged(self, path: Path) -> list[SolvedGame]:
+        """The solutions in the log of the checkpoint at ``path``."""
+        table = Game(self.pieces, self.board, {}).placement_table
+        return [
+            SolvedGame(
+                frozenset(
+                    (table.piece_of(placement_id), table.positions_of(placement_id))
+                    for placement_id in placement_ids
+                )
+            )
+            for placement_ids in Checkpoint(path).solutions()
+        ]
+
+    def interrupted_solve(self, parallel: bool, count: int) -> Path:
+        """Stops a solve after ``count`` solutions, returns a copy of the files."""
+        game = Game(self.pieces, self.board, {})
+        checkpoint = Checkpoint(self.path, 0)
+        solutions = game.solve(parallel=parallel, split_depth=2, checkpoint=checkpoint)
+        yielded = [next(solutions) for _ in range(count)]
+        # the files as they were when the process was killed, without the
+        # final save
+        copy = self.directory / "killed.json"
+        shutil.copy(self.path, copy)
+        shutil.copy(checkpoint.solutions_path, Checkpoint(copy).solutions_path)
+        solutions.close()
+        self.assertLessEqual(set(yielded), set(self.logged(self.path)))
+        return copy
+
+    def assert_resumes(self, path: Path, parallel: bool) -> None:
+        before = self.logged(path)
+        game = Game(self.pieces, self.board, {})
+        solutions = list(game.solve(parallel=parallel, checkpoint=Checkpoint(path, 0)))
+        # finished tasks are skipped, not yielded again
+        self.assertTrue(set(before).isdisjoint(solutions))
+        self.assertEqual(len(before) + len(solutions), len(self.expected))
+        logged = self.logged(path)
+        self.assertEqual(len(logged), len(self.expected))
+        self.assertEqual(set(logged), self.expected)
+
+    def test_resume(self) -> None:
+        killed = self.interrupted_solve(parallel=False, count=10)
+        data = json.loads(self.path.read_text())
+        self.assertGreater(len(data["finished"]), 0)
+        self.assertLess(len(data["finished"]), data["task_count"])
+        self.assert_resumes(self.path, parallel=False)
+        self.assert_resumes(killed, parallel=False)
+        # a finished search yields nothing more
+        game = Game(self.pieces, self.board, {})
+        self.assertEqual(list(game.solve(checkpoint=Checkpoint(self.path))), [])
+
+    def test_resume_parallel(self) -> None:
+        killed = self.interrupted_solve(parallel=True, count=10)
+        self.assert_resumes(self.path, parallel=True)
+        self.assert_resumes(killed, parallel=False)
+
+    def test_checkpoint_of_other_search(self) -> None:
+        game = Game(self.pieces, self.board, {})
+        list(game.solve(split_depth=1, checkpoint=Checkpoint(self.path)))
+        board = GameBoard(self.board.position_set - {GamePosition(0, 0)})
+        game = Game(self.pieces[1:], board, {})
+        with self.assertRaises(ValueError):
+            next(game.solve(checkpoint=Checkpoint(self.path)))
+
+    def test_interval(self) -> None:
+        checkpoint = Checkpoint(self.path, interval=3600)
+        checkpoint.begin("key", 1, 3)
+        checkpoint.finish(0, [(1, 2)])
+        checkpoint.save()
+        checkpoint.finish(1, [(3, 4), (5, 6)])
+        self.assertEqual(json.loads(self.path.read_text())["finished"], [0])
+        # killed while logging the third task
+        with checkpoint.solutions_path.open("a") as log:
+            log.write("[2, [[7")
+        resumed = Checkpoint(self.path)
+        self.assertEqual(resumed.load("key"), 1)
+        # logged tasks count as finished even if the file was not saved since
+        self.assertEqual(resumed.finished, {0, 1})
+        self.assertEqual(list(resumed.solutions()), [(1, 2), (3, 4), (5, 6)])
+        resumed.finish(2, [(7, 8)])
+        self.assertEqual(list(resumed.solutions()), [(1, 2), (3, 4), (5, 6), (7, 8)])
+
+    def test_stale_log(self) -> None:
+        Checkpoint(self.path).solutions_path.write_text("[0, [[1, 2]]]\n")
+        checkpoint = Checkpoint(self.path)
+        self.assertIsNone(checkpoint.load("key"))
+        checkpoint.begin("key", 1, 2)
+        self.assertEqual(list(checkpoint.solutions()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import base64
+import unittest
+import zlib
+
+from pyramide.continuation import Continuation
+
+
+class TestContinuation(unittest.TestCase):
+    def test_token_round_trip(self) -> None:
+        continuation = Continuation(
+            "abc", 2, {0, 3, 4}, {1: 7}, {1: [(3, True), (0, False)]}
+        )
+        self.assertEqual(Continuation.from_token(continuation.to_token()), continuation)
+
+    def test_damaged_token(self) -> None:
+        token = Continuation("abc", 2).to_token()
+        for damaged in (token[:-4], "", "not a token"):
+            with self.subTest(token=damaged), self.assertRaises(ValueError):
+                Continuation.from_token(damaged)
+
+    def test_other_format_version(self) -> None:
+        token = base64.urlsafe_b64encode(zlib.compress(b'{"version": 0}')).decode()
+        with self.assertRaises(ValueError):
+            Continuation.from_token(token)
+
+
+if __name__ == "__main__":
+    unittest.main()
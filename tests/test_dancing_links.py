@@ -0,0 +1,50 @@
+import unittest
+
+from pyramide.dancing_links import DancingLinks
+
+
+class TestDancingLinks(unittest.TestCase):
+    def setUp(self) -> None:
+        # Knuth's example from "Dancing Links", columns A-G
+        self.rows = [
+            [2, 4, 5],
+            [0, 3, 6],
+            [1, 2, 5],
+            [0, 3],
+            [1, 6],
+            [3, 4, 6],
+        ]
+
+    def test_exact_cover(self) -> None:
+        dlx = DancingLinks(7, 0, self.rows)
+        solutions = [sorted(solution) for solution in dlx.solve()]
+        self.assertEqual(solutions, [[0, 3, 4]])
+
+    def test_no_cover(self) -> None:
+        dlx = DancingLinks(3, 0, [[0, 1], [1, 2]])
+        self.assertEqual(list(dlx.solve()), [])
+
+    def test_secondary_columns(self) -> None:
+        # column 2 may stay uncovered but not be covered twice
+        dlx = DancingLinks(2, 1, [[0, 2], [1, 2], [0], [1]])
+        solutions = {frozenset(solution) for solution in dlx.solve()}
+        self.assertEqual(
+            solutions, {frozenset({0, 3}), frozenset({1, 2}), frozenset({2, 3})}
+        )
+
+    def test_selected_rows(self) -> None:
+        dlx = DancingLinks(7, 0, self.rows)
+        self.assertEqual(list(dlx.solve([1])), [])
+        self.assertEqual(len(list(dlx.solve([3]))), 1)
+        # the links are restored after every search
+        self.assertEqual(len(list(dlx.solve())), 1)
+
+    def test_overlapping_selected_rows(self) -> None:
+        dlx = DancingLinks(7, 0, self.rows)
+        with self.assertRaises(ValueError):
+            list(dlx.solve([1, 3]))
+        self.assertEqual(len(list(dlx.solve())), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -48,6 +48,21 @@ class TestForm(unittest.TestCase):
         self.assertEqual(next(iter(results))[0], GameBoard({GamePosition(2, 2)}))
         self.assertEqual(next(iter(results))[1], form.position_set)
 
+    def test_canonical_is_interned(self) -> None:
+        form = Form.canonical([GamePosition(5, 5), GamePosition(6, 5)])
+        same = Form.canonical([GamePosition(0, 1), GamePosition(1, 1)])
+        self.assertIs(form, same)
+        self.assertEqual(form, Form({GamePosition(0, 0), GamePosition(1, 0)}))
+
+    def test_from_trusted_skips_checks(self) -> None:
+        positions = frozenset({GamePosition(0, 0), GamePosition(2, 2)})
+        form = Form.from_trusted(positions)
+        self.assertEqual(form.position_set, positions)
+
+    def test_hash_matches_game_board(self) -> None:
+        positions = {GamePosition(0, 0), GamePosition(1, 0), GamePosition(1, 1)}
+        self.assertEqual(hash(Form(positions)), hash(GameBoard(positions)))
+
 
 if __name__ == "__main__":
     unittest.main()
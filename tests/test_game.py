@@ -1,4 +1,8 @@
+import asyncio
+import contextlib
+import threading
 import unittest
+from unittest import mock
 
 from pyramide.color import Color
 from pyramide.form import Form
@@ -6,7 +10,20 @@ from pyramide.game import Game, NotValidProblemError
 from pyramide.game_board import GameBoard
 from pyramide.game_position import GamePosition
 from pyramide.piece import Piece
+from pyramide.placement_table import PlacementTable
+from pyramide.solve_budget import COMPLETE, MAX_SOLUTIONS, SolveBudget, SolveResult
 from pyramide.solved_game import SolvedGame
+from pyramide.solver_pool import SolverPool
+from pyramide.transposition_table import TranspositionTable
+from scripts.iq_pyramide_helpers import (
+    get_gameboard,
+    get_pieces,
+    get_placement_table,
+)
+from tests.fixtures import grid, l_pieces
+
+# rounds of `Game.solve_within` until a search has to be complete
+_MAX_ROUNDS = 200
 
 
 class TestGameValidity(unittest.TestCase):
@@ -106,6 +123,351 @@ class TestGame(unittest.TestCase):
         for r in result:
             self.assertIsInstance(r, SolvedGame)
 
+    def test_bitboard_engine_matches_object_engine(self) -> None:
+        game = Game(self.pieces, self.board, {})
+        expected = set(game.solve(engine="object"))
+        self.assertEqual(set(game.solve(engine="bitboard")), expected)
+        self.assertGreater(len(expected), 0)
+
+    def test_shared_placement_table(self) -> None:
+        table = PlacementTable.get(self.pieces, self.board)
+        board = GameBoard(self.board_positions - {GamePosition(0, 0)})
+        game = Game([self.piece1], board, {}, table)
+        self.assertIs(game.placement_table, table)
+        self.assertEqual(
+            set(game.solve(engine="bitboard")), set(game.solve(engine="object"))
+        )
+
+    def test_placement_table_not_covering_game(self) -> None:
+        table = PlacementTable.get([self.piece1], self.board)
+        with self.assertRaises(ValueError):
+            Game(self.pieces, self.board, {}, table)
+
+    def test_dlx_engine_matches_object_engine(self) -> None:
+        game = Game(self.pieces, self.board, {})
+        self.assertEqual(
+            set(game.solve(engine="dlx")), set(game.solve(engine="object"))
+        )
+
+    def test_split_depth_needs_bitboard_engine(self) -> None:
+        game = Game(self.pieces, self.board, {})
+        with self.assertRaises(ValueError):
+            next(game.solve(engine="dlx", split_depth=2))
+
+    def test_unknown_engine(self) -> None:
+        game = Game(self.pieces, self.board, {})
+        with self.assertRaises(ValueError):
+            next(game.solve(engine="unknown"))
+
+    def test_cancel(self) -> None:
+        game = Game(self.pieces, self.board, {})
+        cancel = threading.Event()
+        cancel.set()
+        with mock.patch("pyramide.search_core._INTERRUPT_INTERVAL", 1):
+            self.assertEqual(list(game.solve(cancel=cancel)), [])
+        with self.assertRaises(ValueError):
+            next(game.solve(engine="object", cancel=cancel))
+
+    def test_limit(self) -> None:
+        game = Game(self.pieces, self.board, {})
+        solution_count = len(set(game.solve()))
+        self.assertGreater(solution_count, 2)
+        for engine in ("bitboard", "object", "dlx"):
+            with self.subTest(engine=engine):
+                self.assertEqual(len(list(game.solve(engine=engine, limit=2))), 2)
+                self.assertEqual(game.count_solutions(engine=engine), solution_count)
+        self.assertEqual(game.count_solutions(break_symmetry=True), solution_count)
+
+    def test_has_unique_solution(self) -> None:
+        game = Game(self.pieces, self.board, {})
+        self.assertFalse(game.has_unique_solution())
+        board = GameBoard({GamePosition(0, 0), GamePosition(1, 0)})
+        self.assertTrue(Game([self.piece1], board, {}).has_unique_solution())
+
+
+class TestSolveWithin(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = Game(l_pieces(), grid(), {})
+        self.expected = set(self.game.solve())
+
+    def solve_in_parts(
+        self, budget: SolveBudget, **options: bool | int
+    ) -> tuple[list[SolvedGame], list[SolveResult]]:
+        solutions: list[SolvedGame] = []
+        results = []
+        continuation = None
+        for _ in range(_MAX_ROUNDS):
+            result = self.game.solve_within(budget, continuation, **options)
+            results.append(result)
+            solutions.extend(result.solutions)
+            if result.complete:
+                return solutions, results
+            continuation = result.continuation
+            self.assertIsNotNone(continuation)
+        raise self.failureException(f"not complete after {_MAX_ROUNDS} rounds")
+
+    def test_complete(self) -> None:
+        result = self.game.solve_within(SolveBudget())
+        self.assertEqual(result.status, COMPLETE)
+        self.assertIsNone(result.continuation)
+        self.assertEqual(set(result.solutions), self.expected)
+
+    def test_max_solutions(self) -> None:
+        for parallel in (False, True):
+            with self.subTest(parallel=parallel):
+                solutions, results = self.solve_in_parts(
+                    SolveBudget(max_solutions=5), parallel=parallel, split_depth=1
+                )
+                self.assertEqual(len(solutions), len(self.expected))
+                self.assertEqual(set(solutions), self.expected)
+                self.assertEqual(results[0].status, MAX_SOLUTIONS)
+                self.assertEqual(len(results[0].solutions), 5)
+
+    def test_max_nodes(self) -> None:
+        for parallel in (False, True):
+            with (
+                self.subTest(parallel=parallel),
+                mock.patch("pyramide.search_core._INTERRUPT_INTERVAL", 1),
+            ):
+                solutions, results = self.solve_in_parts(
+                    SolveBudget(max_nodes=20), parallel=parallel, split_depth=2
+                )
+                self.assertEqual(len(solutions), len(self.expected))
+                self.assertEqual(set(solutions), self.expected)
+                self.assertGreater(len(results), 1)
+
+    def test_max_nodes_within_a_task(self) -> None:
+        # the only task needs far more nodes than the budget
+        for parallel in (False, True):
+            with (
+                self.subTest(parallel=parallel),
+                mock.patch("pyramide.search_core._INTERRUPT_INTERVAL", 1),
+            ):
+                solutions, results = self.solve_in_parts(
+                    SolveBudget(max_nodes=20), parallel=parallel, split_depth=0
+                )
+                self.assertEqual(len(solutions), len(self.expected))
+                self.assertEqual(set(solutions), self.expected)
+                self.assertGreater(len(results), 1)
+
+    def test_max_solutions_then_max_nodes(self) -> None:
+        # a task stopped for max_solutions leaves its worker's position
+        # unknown, it goes on from the one before and skips what it returned
+        with mock.patch("pyramide.search_core._INTERRUPT_INTERVAL", 1):
+            result = self.game.solve_within(
+                SolveBudget(max_nodes=20), parallel=True, split_depth=0
+            )
+            solutions = list(result.solutions)
+            result = self.game.solve_within(
+                SolveBudget(max_solutions=3),
+                result.continuation,
+                parallel=True,
+            )
+            solutions.extend(result.solutions)
+            for _ in range(_MAX_ROUNDS):
+                if result.complete:
+                    break
+                result = self.game.solve_within(
+                    SolveBudget(max_nodes=20), result.continuation, parallel=True
+                )
+                solutions.extend(result.solutions)
+        self.assertTrue(result.complete)
+        self.assertEqual(len(solutions), len(self.expected))
+        self.assertEqual(set(solutions), self.expected)
+
+    def test_max_seconds(self) -> None:
+        solutions, _ = self.solve_in_parts(SolveBudget(max_seconds=1e-6))
+        self.assertEqual(len(solutions), len(self.expected))
+        self.assertEqual(set(solutions), self.expected)
+
+    def test_continuation_of_another_search(self) -> None:
+        result = self.game.solve_within(SolveBudget(max_solutions=1))
+        board = GameBoard(self.game.board.position_set - {GamePosition(0, 0)})
+        other = Game(self.game.pieces[:3], board, {})
+        with self.assertRaises(ValueError):
+            other.solve_within(SolveBudget(), result.continuation)
+        with self.assertRaises(ValueError):
+            self.game.solve_within(SolveBudget(), "not a token")
+
+
+class TestSolveAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.pieces = [piece for piece in l_pieces() if piece.color != Color.yellow]
+        self.board = grid(4, 3)
+        self.table = PlacementTable(self.pieces, self.board)
+        self.game = Game(self.pieces, self.board, {}, self.table)
+        self.expected = set(self.game.solve())
+
+    async def test_yields_all_solutions(self) -> None:
+        for parallel in (False, True):
+            with self.subTest(parallel=parallel):
+                solutions = {
+                    solution
+                    async for solution in self.game.solve_async(parallel, split_depth=1)
+                }
+                self.assertEqual(solutions, self.expected)
+
+    async def test_leaving_early_stops_the_workers(self) -> None:
+        with SolverPool(self.table, max_workers=2, max_queued=1) as pool:
+            solutions = self.game.solve_async(split_depth=1, pool=pool)
+            async with contextlib.aclosing(solutions):
+                async for _ in solutions:
+                    break
+            # the pool refuses a second run while the first one still runs
+            solutions = {
+                solution
+                async for solution in self.game.solve_async(split_depth=1, pool=pool)
+            }
+            self.assertEqual(solutions, self.expected)
+
+    async def test_cancel_task(self) -> None:
+        started = asyncio.Event()
+
+        async def consume() -> None:
+            async for _ in self.game.solve_async(split_depth=1):
+                started.set()
+                await asyncio.sleep(60)
+
+        task = asyncio.create_task(consume())
+        await started.wait()
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+    async def test_timeout(self) -> None:
+        with SolverPool(self.table, max_workers=2, max_queued=1) as pool:
+            with self.assertRaises(TimeoutError):
+                async for _ in self.game.solve_async(timeout=0, pool=pool):
+                    pass
+            solutions = {
+                solution async for solution in self.game.solve_async(pool=pool)
+            }
+            self.assertEqual(solutions, self.expected)
+
+    async def test_error(self) -> None:
+        pool = SolverPool(PlacementTable(self.pieces, self.board))
+        with self.assertRaises(ValueError):
+            async for _ in self.game.solve_async(pool=pool):
+                pass
+
+
+class TestEnginesOnChallenges(unittest.TestCase):
+    """The challenges of scripts/game1.py, game2.py and game3.py."""
+
+    challenges = (
+        (
+            (Color.creme_white, Color.pink),
+            [
+                (8, 0),
+                (8, 1),
+                (8, 2),
+                (8, 3),
+                (7, 1),
+                (6, 1),
+                (5, 1),
+                (7, 2),
+                (6, 2),
+                (7, 3),
+            ],
+            7,
+        ),
+        (
+            (Color.white, Color.orange),
+            [(8, 0), (8, 1), (7, 1), (8, 2), (7, 2), (6, 2), (6, 1)],
+            11,
+        ),
+        (
+            (Color.red, Color.bright_blue),
+            [
+                (8, 0),
+                (8, 1),
+                (8, 2),
+                (7, 2),
+                (6, 2),
+                # red
+                (5, 0),
+                (6, 0),
+                (7, 0),
+                (6, 1),
+                (7, 1),
+            ],
+            26,
+        ),
+    )
+
+    def test_dlx_matches_bitboard(self) -> None:
+        table = get_placement_table()
+        full_board = get_gameboard()
+        for colors, removed, solution_count in self.challenges:
+            with self.subTest(colors=colors):
+                pieces = [p for p in get_pieces() if p.color not in colors]
+                board = GameBoard(
+                    full_board.position_set - {GamePosition(x, y) for x, y in removed}
+                )
+                game = Game(pieces, board, {}, table)
+                game.sort_pieces()
+                solutions = set(game.solve(engine="dlx"))
+                self.assertEqual(len(solutions), solution_count)
+                self.assertEqual(set(game.solve(engine="bitboard")), solutions)
+                self.assertGreater(game.stats.nodes, 0)
+                self.assertGreater(game.stats.pruned_subset_sum, 0)
+
+    def test_parallel_split_depth(self) -> None:
+        colors, removed, solution_count = self.challenges[1]
+        pieces = [p for p in get_pieces() if p.color not in colors]
+        board = GameBoard(
+            get_gameboard().position_set - {GamePosition(x, y) for x, y in removed}
+        )
+        game = Game(pieces, board, {}, get_placement_table())
+        solutions = set(game.solve(engine="bitboard"))
+        self.assertEqual(len(solutions), solution_count)
+        for split_depth in (2, None):
+            with self.subTest(split_depth=split_depth):
+                game = Game(pieces, board, {}, get_placement_table())
+                self.assertEqual(
+                    set(game.solve(parallel=True, split_depth=split_depth)),
+                    solutions,
+                )
+                self.assertGreater(len(game.stats.worker_busy_time), 0)
+                self.assertGreater(sum(game.stats.worker_busy_time.values()), 0)
+                self.assertEqual(
+                    game.count_solutions(parallel=True, split_depth=split_depth),
+                    solution_count,
+                )
+                self.assertEqual(len(list(game.solve(parallel=True, limit=3))), 3)
+
+    def test_transposition_table(self) -> None:
+        colors, removed, solution_count = self.challenges[1]
+        pieces = [p for p in get_pieces() if p.color not in colors]
+        board = GameBoard(
+            get_gameboard().position_set - {GamePosition(x, y) for x, y in removed}
+        )
+        transposition_table = TranspositionTable()
+        game = Game(pieces, board, {}, get_placement_table(), transposition_table)
+        solutions = set(game.solve(engine="bitboard"))
+        self.assertEqual(len(solutions), solution_count)
+        self.assertGreater(transposition_table.hits, 0)
+        self.assertEqual(game.stats.pruned_transposition, transposition_table.hits)
+
+    def test_count_with_dead_only_table(self) -> None:
+        colors, removed, solution_count = self.challenges[1]
+        pieces = [p for p in get_pieces() if p.color not in colors]
+        board = GameBoard(
+            get_gameboard().position_set - {GamePosition(x, y) for x, y in removed}
+        )
+        counting = TranspositionTable(store_counts=True)
+        game = Game(pieces, board, {}, get_placement_table(), counting)
+        self.assertEqual(game.count_solutions(), solution_count)
+        dead_only = TranspositionTable()
+        game = Game(pieces, board, {}, get_placement_table(), dead_only)
+        self.assertEqual(game.count_solutions(), solution_count)
+        # solvable sub-problems are counted once, like with a counting table
+        self.assertGreater(dead_only.hits, 0)
+        self.assertEqual(
+            (dead_only.hits, dead_only.misses), (counting.hits, counting.misses)
+        )
+        self.assertFalse(dead_only.store_counts)
+
 
 if __name__ == "__main__":
     unittest.main()
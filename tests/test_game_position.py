@@ -0,0 +1,48 @@
+import pickle
+import unittest
+from dataclasses import FrozenInstanceError
+
+from pyramide.game_position import GamePosition
+
+
+class TestGamePosition(unittest.TestCase):
+    def test_interned(self) -> None:
+        self.assertIs(GamePosition(2, 3), GamePosition(2, 3))
+        self.assertIs(GamePosition(1, 1) + GamePosition(1, 2), GamePosition(2, 3))
+        self.assertIs(GamePosition(3, 3) - GamePosition(1, 0), GamePosition(2, 3))
+
+    def test_hash_and_equality(self) -> None:
+        self.assertEqual(hash(GamePosition(2, 3)), hash((2, 3)))
+        self.assertEqual(GamePosition(2, 3), GamePosition(2, 3))
+        self.assertNotEqual(GamePosition(2, 3), GamePosition(3, 2))
+        self.assertNotEqual(GamePosition(2, 3), (2, 3))
+
+    def test_frozen(self) -> None:
+        position = GamePosition(2, 3)
+        with self.assertRaises(FrozenInstanceError):
+            position.x = 5  # type: ignore[misc]
+        with self.assertRaises(AttributeError):
+            position.z = 5  # type: ignore[attr-defined]
+
+    def test_pickle_keeps_interning(self) -> None:
+        position = GamePosition(2, 3)
+        self.assertIs(pickle.loads(pickle.dumps(position)), position)
+
+    def test_neighbors(self) -> None:
+        self.assertEqual(
+            set(GamePosition(2, 3).neighbors),
+            {
+                GamePosition(1, 3),
+                GamePosition(3, 3),
+                GamePosition(2, 2),
+                GamePosition(2, 4),
+            },
+        )
+        self.assertIs(GamePosition(2, 3).neighbors, GamePosition(2, 3).neighbors)
+
+    def test_repr(self) -> None:
+        self.assertEqual(repr(GamePosition(2, 3)), "GamePosition(x=2, y=3)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from pyramide.__main__ import main
+from pyramide.puzzle_file import challenge_to_json
+from scripts.iq_pyramide_helpers import get_challenges
+
+
+class TestMain(unittest.TestCase):
+    def run_main(self, *arguments: str) -> tuple[int, list[dict]]:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "puzzles.json"
+            challenges = [challenge_to_json(get_challenges()[1])]
+            challenges.append({"name": "bad", "placed": {"white": [[8, 0]]}})
+            path.write_text(json.dumps(challenges))
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                status = main([*arguments, str(path)])
+        return status, [json.loads(line) for line in output.getvalue().splitlines()]
+
+    def test_solutions(self) -> None:
+        status, lines = self.run_main()
+        self.assertEqual(status, 1)
+        solutions = [line for line in lines if "solution" in line]
+        self.assertEqual(len(solutions), 11)
+        self.assertTrue(all(line["challenge"] == "game2" for line in solutions))
+        self.assertEqual(lines[-2], {"challenge": "game2", "solution_count": 11})
+        self.assertEqual(lines[-1]["challenge"], "bad")
+        self.assertIn("error", lines[-1])
+
+    def test_count_and_limit(self) -> None:
+        _, lines = self.run_main("--count")
+        self.assertEqual(lines[0], {"challenge": "game2", "solution_count": 11})
+        _, lines = self.run_main("--limit", "2")
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[2], {"challenge": "game2", "solution_count": 2})
+
+    def test_parallel(self) -> None:
+        _, lines = self.run_main("--parallel", "--count")
+        self.assertEqual(lines[0], {"challenge": "game2", "solution_count": 11})
@@ -147,6 +147,15 @@ class TestPiece(unittest.TestCase):
         expected = Form({GamePosition(0, 0), GamePosition(-1, 0), GamePosition(-1, 1)})
         self.assertEqual(mirrored.form.position_set, expected.position_set)
 
+    def test_all_transformations_cached(self) -> None:
+        transformations = self.piece.all_transformations()
+        self.assertEqual(len(transformations), 4)
+        self.assertIs(self.piece.all_transformations(), transformations)
+
+    def test_transformations_are_interned(self) -> None:
+        rotated = self.piece.rotate(90).form
+        self.assertIs(Piece(Color.green, self.form).rotate(90).form, rotated)
+
     def test_invalid_mirror_axis(self) -> None:
         with self.assertRaises(ValueError):
             self.piece.mirror("z")
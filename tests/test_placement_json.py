@@ -0,0 +1,36 @@
+import unittest
+
+from pyramide.game_position import GamePosition
+from pyramide.placement_json import (
+    placed_pieces_to_json,
+    placements_to_json,
+    positions_from_json,
+    positions_to_json,
+)
+from pyramide.placement_table import PlacementTable
+from tests.fixtures import grid, l_pieces
+
+
+class TestPlacementJson(unittest.TestCase):
+    def test_positions_round_trip(self) -> None:
+        positions = frozenset({GamePosition(2, 0), GamePosition(0, 1)})
+        self.assertEqual(positions_to_json(positions), [[0, 1], [2, 0]])
+        self.assertEqual(positions_from_json(positions_to_json(positions)), positions)
+
+    def test_placements_by_color(self) -> None:
+        pieces = l_pieces()
+        table = PlacementTable(pieces, grid())
+        red, green = pieces[0], pieces[3]
+        placement_ids = [table.placement_ids[green][0], table.placement_ids[red][0]]
+        placements = placements_to_json(table, placement_ids)
+        self.assertEqual([p["color"] for p in placements], ["green", "red"])
+        self.assertEqual(
+            placements,
+            placed_pieces_to_json(
+                (table.piece_of(i), table.positions_of(i)) for i in placement_ids
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from pyramide.cell_index import CellIndex
+from pyramide.color import Color
+from pyramide.form import Form
+from pyramide.game_board import GameBoard
+from pyramide.game_position import GamePosition
+from pyramide.piece import Piece
+from pyramide.placement_matrix import PlacementMatrix, np
+from pyramide.placement_table import PlacementTable
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestPlacementMatrix(unittest.TestCase):
+    def setUp(self) -> None:
+        # a staircase, so the board is no rectangle
+        self.board = GameBoard(
+            {GamePosition(x, y) for y in range(5) for x in range(y + 2)}
+        )
+        self.pieces = [
+            Piece(
+                Color.red,
+                Form({GamePosition(0, 0), GamePosition(1, 0), GamePosition(1, 1)}),
+            ),
+            Piece(
+                Color.blue,
+                Form(
+                    {
+                        GamePosition(0, 0),
+                        GamePosition(1, 0),
+                        GamePosition(2, 0),
+                        GamePosition(3, 0),
+                    }
+                ),
+            ),
+        ]
+
+    def test_same_placements_as_pure_python(self) -> None:
+        table = PlacementTable(self.pieces, self.board)
+        numpy_table = PlacementTable(self.pieces, self.board, use_numpy=True)
+        self.assertEqual(numpy_table.masks, table.masks)
+        self.assertEqual(numpy_table.piece_indexes, table.piece_indexes)
+        self.assertEqual(numpy_table.placement_ids, table.placement_ids)
+
+    def test_matrix_rows(self) -> None:
+        cell_index = CellIndex(self.board)
+        placement_matrix = PlacementMatrix(self.pieces, cell_index)
+        self.assertEqual(placement_matrix.matrix.shape, (len(placement_matrix), 20))
+        for row, mask in zip(
+            placement_matrix.matrix, placement_matrix.masks, strict=True
+        ):
+            self.assertEqual(
+                cell_index.to_mask(
+                    cell_index.positions[cell] for cell in np.nonzero(row)[0]
+                ),
+                mask,
+            )
+
+    def test_piece_larger_than_board(self) -> None:
+        board = GameBoard({GamePosition(0, 0), GamePosition(1, 0)})
+        placement_matrix = PlacementMatrix(self.pieces, CellIndex(board))
+        self.assertEqual(len(placement_matrix), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
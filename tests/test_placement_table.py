@@ -0,0 +1,77 @@
+import unittest
+
+from pyramide.color import Color
+from pyramide.form import Form
+from pyramide.game_board import GameBoard
+from pyramide.game_position import GamePosition
+from pyramide.piece import Piece
+from pyramide.placement_table import PlacementTable
+
+
+class TestPlacementTable(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board = GameBoard(
+            {GamePosition(x, y) for x in range(3) for y in range(3)}
+        )  # 3x3 grid
+        self.piece = Piece(
+            Color.green,
+            Form({GamePosition(0, 0), GamePosition(1, 0), GamePosition(1, 1)}),
+        )
+        self.bar = Piece(
+            Color.blue,
+            Form({GamePosition(0, 0), GamePosition(1, 0), GamePosition(2, 0)}),
+        )
+        self.table = PlacementTable([self.piece, self.bar], self.board)
+
+    def test_placements_match_delete_from_board(self) -> None:
+        for piece in (self.piece, self.bar):
+            expected = {
+                positions for _, positions in piece.delete_from_board(self.board)
+            }
+            placements = {
+                self.table.positions_of(placement_id)
+                for placement_id in self.table.placement_ids[piece]
+            }
+            self.assertEqual(placements, expected)
+            for placement_id in self.table.placement_ids[piece]:
+                self.assertEqual(self.table.piece_of(placement_id), piece)
+        self.assertEqual(len(self.table), 16 + 6)
+
+    def test_fitting_placement_ids(self) -> None:
+        free = self.table.cell_index.to_mask(
+            {GamePosition(0, 0), GamePosition(1, 0), GamePosition(2, 0)}
+        )
+        self.assertEqual(self.table.fitting_placement_ids(self.piece, free), [])
+        self.assertEqual(len(self.table.fitting_placement_ids(self.bar, free)), 1)
+
+    def test_cell_placement_ids(self) -> None:
+        for cell, placement_ids in enumerate(self.table.cell_placement_ids):
+            for placement_id in range(len(self.table)):
+                self.assertEqual(
+                    placement_id in placement_ids,
+                    bool(self.table.masks[placement_id] >> cell & 1),
+                )
+        # the center of the 3x3 grid
+        self.assertEqual(len(self.table.cell_placement_ids[4]), 12 + 2)
+
+    def test_covers(self) -> None:
+        self.assertTrue(self.table.covers([self.bar], GameBoard({GamePosition(0, 0)})))
+        self.assertFalse(self.table.covers([self.bar], GameBoard({GamePosition(3, 0)})))
+
+    def test_key(self) -> None:
+        same = PlacementTable([self.piece, self.bar], self.board)
+        self.assertEqual(same.key(), self.table.key())
+        swapped = PlacementTable([self.bar, self.piece], self.board)
+        self.assertNotEqual(swapped.key(), self.table.key())
+        smaller = GameBoard(self.board.position_set - {GamePosition(0, 0)})
+        self.assertNotEqual(
+            PlacementTable([self.piece, self.bar], smaller).key(), self.table.key()
+        )
+
+    def test_get_is_shared(self) -> None:
+        table = PlacementTable.get([self.piece, self.bar], self.board)
+        self.assertIs(PlacementTable.get([self.piece, self.bar], self.board), table)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import json
+import unittest
+
+from pyramide.challenge import Challenge
+from pyramide.color import Color
+from pyramide.game_position import GamePosition
+from pyramide.puzzle_file import (
+    challenge_from_json,
+    challenge_to_json,
+    parse_challenges,
+    solution_to_json,
+)
+from scripts.iq_pyramide_helpers import get_challenges, get_placement_table
+
+DRAWN = """
+challenge game2
+W = white
+O = orange
+---------
+.........
+.........
+.........
+.........
+.........
+.........
+......OOO
+......OWW
+........W
+---------
+
+challenge corner
+w = white
+ww
+.w
+"""
+
+
+class TestPuzzleFile(unittest.TestCase):
+    def test_drawn(self) -> None:
+        game2, corner = parse_challenges(DRAWN)
+        self.assertEqual(game2, get_challenges()[1])
+        self.assertEqual(
+            corner,
+            Challenge(
+                "corner",
+                {
+                    Color.white: {
+                        GamePosition(0, 1),
+                        GamePosition(1, 1),
+                        GamePosition(1, 0),
+                    }
+                },
+            ),
+        )
+
+    def test_drawn_with_spaces(self) -> None:
+        # leading spaces are cells left of the drawing, not indentation
+        (challenge,) = parse_challenges("challenge a\nW = white\n  WW  \n.....\n")
+        self.assertEqual(
+            challenge,
+            Challenge("a", {Color.white: {GamePosition(2, 1), GamePosition(3, 1)}}),
+        )
+
+    def test_json(self) -> None:
+        challenges = get_challenges()
+        text = json.dumps([challenge_to_json(c) for c in challenges])
+        self.assertEqual(parse_challenges(text), challenges)
+        one = json.dumps(challenge_to_json(challenges[0]))
+        self.assertEqual(parse_challenges(one), challenges[:1])
+
+    def test_malformed(self) -> None:
+        for text in (
+            "W = white\n..W",
+            "challenge x\nW = beige\n..W",
+            "challenge x\nW = white\n..X",
+            "challenge x\nW = white\nO = orange\n..W",
+            "challenge x\nWO = white\n..W",
+            "challenge\nW = white\n..W",
+            "[{",
+        ):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                parse_challenges(text)
+        for data in ({"name": "x"}, {"name": "x", "placed": {"beige": [[0, 0]]}}):
+            with self.subTest(data=data), self.assertRaises(ValueError):
+                challenge_from_json(data)
+
+    def test_solution_to_json(self) -> None:
+        game = get_challenges()[1].game(get_placement_table())
+        solution = next(game.solve())
+        placements = solution_to_json(solution)
+        self.assertEqual(len(placements), 12)
+        self.assertEqual(
+            [p["color"] for p in placements], sorted(c.name for c in Color)
+        )
+        self.assertIn({"color": "white", "cells": [[7, 1], [8, 0], [8, 1]]}, placements)
@@ -0,0 +1,32 @@
+import unittest
+
+from pyramide.region_pruner import RegionPruner
+
+
+class TestRegionPruner(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pruner = RegionPruner([3, 4, 4, 5])
+        self.all_pieces = 0b1111
+
+    def test_subset_sums(self) -> None:
+        sums = self.pruner.subset_sums(self.all_pieces)
+        achievable = {size for size in range(20) if sums >> size & 1}
+        self.assertEqual(achievable, {0, 3, 4, 5, 7, 8, 9, 11, 12, 13, 16})
+
+    def test_region_not_a_subset_sum(self) -> None:
+        self.assertFalse(self.pruner.can_fill([6, 10], self.all_pieces))
+        self.assertTrue(self.pruner.can_fill([7, 9], self.all_pieces))
+
+    def test_regions_not_a_partition(self) -> None:
+        # every region is a subset sum, but both 7s need the piece of size 3
+        pruner = RegionPruner([3, 4, 5, 6])
+        self.assertFalse(pruner.can_fill([4, 7, 7], 0b1111))
+        self.assertTrue(pruner.can_fill([3, 6, 9], 0b1111))
+
+    def test_single_region(self) -> None:
+        self.assertTrue(self.pruner.can_fill([16], self.all_pieces))
+        self.assertTrue(self.pruner.can_fill([5], 0b1000))
+
+
+if __name__ == "__main__":
+    unittest.main()
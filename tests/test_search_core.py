@@ -0,0 +1,211 @@
+import itertools
+import unittest
+from unittest import mock
+
+from pyramide.game_position import GamePosition
+from pyramide.placement_table import PlacementTable
+from pyramide.search_core import SearchCore
+from pyramide.transposition_table import TranspositionTable
+from tests.fixtures import grid, l_pieces
+
+
+class TestSearchCore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board = grid()
+        self.pieces = l_pieces()
+        self.table = PlacementTable(self.pieces, self.board)
+
+    def new_core(
+        self, transposition_table: TranspositionTable | None = None
+    ) -> SearchCore:
+        return SearchCore(
+            self.table,
+            self.table.cell_index.full_mask,
+            0b1111,
+            4,
+            transposition_table,
+        )
+
+    def state(self, core: SearchCore) -> tuple:
+        return core.free, core.unplaced, sorted(core.regions), list(core.placed)
+
+    def test_apply_and_undo(self) -> None:
+        core = self.new_core()
+        before = self.state(core)
+        placement_id = core.branch()[0]
+        self.assertTrue(core.apply(placement_id))
+        self.assertEqual(core.placed, [placement_id])
+        self.assertEqual(core.free, before[0] ^ self.table.masks[placement_id])
+        core.undo()
+        self.assertEqual(self.state(core), before)
+
+    def test_apply_rejects_small_region(self) -> None:
+        core = self.new_core()
+        before = self.state(core)
+        # an L under the two top left cells cuts them off
+        mask = self.table.cell_index.to_mask(
+            {
+                GamePosition(0, 1),
+                GamePosition(1, 1),
+                GamePosition(2, 1),
+                GamePosition(2, 0),
+            }
+        )
+        placement_id = self.table.masks.index(mask)
+        self.assertFalse(core.apply(placement_id))
+        self.assertEqual(self.state(core), before)
+        self.assertEqual(core.stats.pruned_min_region, 1)
+
+    def test_solutions(self) -> None:
+        core = self.new_core()
+        before = self.state(core)
+        solutions = list(core.solutions())
+        self.assertEqual(len(solutions), 48)
+        self.assertEqual(len(set(map(frozenset, solutions))), 48)
+        for solution in solutions:
+            mask = 0
+            for placement_id in solution:
+                self.assertFalse(mask & self.table.masks[placement_id])
+                mask |= self.table.masks[placement_id]
+            self.assertEqual(mask, self.table.cell_index.full_mask)
+        self.assertEqual(self.state(core), before)
+
+    def test_solutions_include_applied_placements(self) -> None:
+        core = self.new_core()
+        placement_id = core.branch()[0]
+        expected = [s for s in core.solutions() if placement_id in s]
+        core.apply(placement_id)
+        solutions = list(core.solutions())
+        self.assertEqual(len(solutions), len(expected))
+        for solution in solutions:
+            self.assertEqual(solution[0], placement_id)
+
+    def test_closing_solutions_restores_state(self) -> None:
+        core = self.new_core()
+        before = self.state(core)
+        solutions = core.solutions()
+        next(solutions)
+        self.assertNotEqual(self.state(core), before)
+        solutions.close()
+        self.assertEqual(self.state(core), before)
+
+    def test_interrupt(self) -> None:
+        core = self.new_core()
+        before = self.state(core)
+        checks = itertools.count()
+        core.interrupt = lambda: next(checks) >= 3
+        with mock.patch("pyramide.search_core._INTERRUPT_INTERVAL", 1):
+            solutions = list(core.solutions())
+        self.assertLess(len(solutions), 48)
+        self.assertTrue(core.interrupted)
+        self.assertEqual(self.state(core), before)
+
+    def test_resume_at_position(self) -> None:
+        expected = list(self.new_core().solutions())
+        core = self.new_core()
+        before = self.state(core)
+        solutions = []
+        position = None
+        while True:
+            found = core.solutions(position)
+            solution = next(found, None)
+            if solution is None:
+                break
+            solutions.append(solution)
+            position = core.position
+            found.close()
+            self.assertEqual(self.state(core), before)
+        self.assertEqual(solutions, expected)
+
+    def test_resume_after_interrupt(self) -> None:
+        expected = list(self.new_core().solutions())
+        solutions: list[tuple[int, ...]] = []
+        position = None
+        with mock.patch("pyramide.search_core._INTERRUPT_INTERVAL", 1):
+            while True:
+                core = self.new_core()
+                checks = itertools.count()
+                core.interrupt = lambda checks=checks: next(checks) >= 20
+                solutions.extend(core.solutions(position))
+                if not core.interrupted:
+                    break
+                position = core.position
+        self.assertEqual(solutions, expected)
+
+    def test_position_of_another_search(self) -> None:
+        with self.assertRaises(ValueError):
+            list(self.new_core().solutions([(1000, True)]))
+
+    def test_frontier_splits_solutions(self) -> None:
+        core = self.new_core()
+        before = self.state(core)
+        expected = set(core.solutions())
+        tasks = list(core.frontier(2))
+        self.assertEqual(self.state(core), before)
+        self.assertGreater(len(tasks), 1)
+        solutions = []
+        for task in tasks:
+            self.assertEqual(len(task), 2)
+            for placement_id in task:
+                self.assertTrue(core.apply(placement_id))
+            solutions.extend(core.solutions())
+            for _ in task:
+                core.undo()
+        self.assertEqual(len(solutions), len(expected))
+        self.assertEqual(set(solutions), expected)
+
+    def test_restrict(self) -> None:
+        core = self.new_core()
+        bar = self.table.placement_ids[self.pieces[3]]
+        core.restrict(3, bar[:1])
+        for solution in core.solutions():
+            self.assertIn(bar[0], solution)
+
+    def test_transposition_table(self) -> None:
+        transposition_table = TranspositionTable()
+        core = self.new_core(transposition_table)
+        self.assertEqual(len(list(core.solutions())), 48)
+        self.assertEqual(len(list(core.solutions())), 48)
+        self.assertGreater(transposition_table.hits, 0)
+
+    def test_count(self) -> None:
+        for transposition_table in (
+            None,
+            TranspositionTable(),
+            TranspositionTable(store_counts=True),
+            TranspositionTable(max_entries=4, store_counts=True),
+        ):
+            with self.subTest(transposition_table=transposition_table):
+                core = self.new_core(transposition_table)
+                before = self.state(core)
+                self.assertEqual(core.count(), 48)
+                self.assertEqual(core.count(), 48)
+                self.assertEqual(self.state(core), before)
+
+    def test_count_reuses_sub_problems(self) -> None:
+        transposition_table = TranspositionTable(store_counts=True)
+        core = self.new_core(transposition_table)
+        self.assertEqual(core.count(), 48)
+        nodes = core.stats.nodes
+        self.assertEqual(core.count(), 48)
+        self.assertEqual(core.stats.nodes, nodes)
+        self.assertGreater(transposition_table.hits, 0)
+
+    def test_count_below(self) -> None:
+        core = self.new_core()
+        tasks = list(core.frontier(2))
+        self.assertEqual(sum(core.count_below(task) for task in tasks), 48)
+
+    def test_interrupted_count_is_not_stored(self) -> None:
+        transposition_table = TranspositionTable(store_counts=True)
+        core = self.new_core(transposition_table)
+        checks = itertools.count()
+        core.interrupt = lambda: next(checks) >= 3
+        with mock.patch("pyramide.search_core._INTERRUPT_INTERVAL", 1):
+            self.assertLess(core.count(), 48)
+        self.assertTrue(core.interrupted)
+        self.assertEqual(self.new_core(transposition_table).count(), 48)
+
+
+if __name__ == "__main__":
+    unittest.main()
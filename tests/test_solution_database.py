@@ -0,0 +1,80 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from pyramide.challenge import Challenge
+from pyramide.color import Color
+from pyramide.game import NotValidProblemError
+from pyramide.game_position import GamePosition
+from pyramide.placement_table import PlacementTable
+from pyramide.solution_database import INDEX_NAME, SolutionDatabase
+from tests.fixtures import grid, l_pieces
+
+
+class TestSolutionDatabase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pieces = l_pieces()
+        self.board = grid()
+        self.table = PlacementTable(self.pieces, self.board)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.database = SolutionDatabase.build(self.directory, self.table)
+        self.addCleanup(self.database.close)
+
+    def expected_count(self, challenge: Challenge) -> int:
+        try:
+            return challenge.game(self.table).count_solutions()
+        except NotValidProblemError:
+            return 0
+
+    def test_empty_board(self) -> None:
+        self.assertEqual(len(self.database), 48)
+        challenge = Challenge("empty", {})
+        self.assertEqual(self.database.count(challenge), 48)
+        self.assertEqual(self.database.solution_indexes(challenge), list(range(48)))
+
+    def test_every_placement(self) -> None:
+        for placement_id in range(len(self.table)):
+            challenge = Challenge(
+                str(placement_id),
+                {
+                    self.table.piece_of(placement_id).color: self.table.positions_of(
+                        placement_id
+                    )
+                },
+            )
+            with self.subTest(placement_id=placement_id):
+                self.assertEqual(
+                    self.database.count(challenge), self.expected_count(challenge)
+                )
+
+    def test_solutions(self) -> None:
+        challenge = Challenge(
+            "x",
+            {
+                Color.green: {GamePosition(x, 0) for x in range(4)},
+                Color.yellow: {GamePosition(x, y) for x in range(2) for y in (1, 2)},
+            },
+        )
+        self.assertEqual(
+            set(self.database.solutions(challenge)),
+            set(challenge.game(self.table).solve()),
+        )
+        self.assertEqual(self.database.count(challenge), 2)
+
+    def test_invalid_challenge(self) -> None:
+        challenge = Challenge("x", {Color.green: {GamePosition(0, 0)}})
+        with self.assertRaises(ValueError):
+            self.database.solutions(challenge)
+
+    def test_other_table(self) -> None:
+        other_table = PlacementTable(self.pieces[:3], self.board)
+        with self.assertRaises(ValueError):
+            SolutionDatabase(self.directory, other_table)
+
+    def test_truncated_index(self) -> None:
+        path = self.directory / INDEX_NAME
+        path.write_bytes(path.read_bytes()[:-4])
+        with self.assertRaises(ValueError):
+            SolutionDatabase(self.directory, self.table)
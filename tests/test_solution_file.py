@@ -0,0 +1,58 @@
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from pyramide.game import Game
+from pyramide.placement_table import PlacementTable
+from pyramide.solution_file import SolutionFile, SolutionWriter
+from tests.fixtures import grid, l_pieces
+
+
+class TestSolutionFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pieces = l_pieces()
+        self.board = grid()
+        self.table = PlacementTable(self.pieces, self.board)
+        self.game = Game(self.pieces, self.board, {}, self.table)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "solutions.bin"
+
+    def test_round_trip(self) -> None:
+        with SolutionWriter(self.path, self.table) as writer:
+            self.assertEqual(writer.write_all(self.game.solve()), 48)
+        with SolutionFile(self.path, self.table) as solutions:
+            self.assertEqual(len(solutions), 48)
+            self.assertEqual(list(solutions), list(self.game.solve()))
+            self.assertEqual(solutions[-1], solutions[47])
+            self.assertEqual(len(solutions.placement_ids(3)), 4)
+            with self.assertRaises(IndexError):
+                solutions[48]
+        # one byte per placement id, four pieces per solution
+        self.assertEqual(self.path.stat().st_size, 24 + 48 * 4)
+
+    def test_placement_ids(self) -> None:
+        with SolutionWriter(self.path, self.table, pieces_per_solution=2) as writer:
+            writer.write_placements([5, 1])
+            with self.assertRaises(struct.error):
+                writer.write_placements([1])
+        with SolutionFile(self.path, self.table) as solutions:
+            self.assertEqual(solutions.placement_ids(0), (1, 5))
+
+    def test_incomplete_file_is_discarded(self) -> None:
+        with self.assertRaises(RuntimeError), SolutionWriter(self.path, self.table):
+            raise RuntimeError
+        self.assertEqual(list(self.path.parent.iterdir()), [])
+
+    def test_invalid_files(self) -> None:
+        with SolutionWriter(self.path, self.table) as writer:
+            writer.write_all(self.game.solve(limit=1))
+        other_table = PlacementTable(self.pieces[:3], self.board)
+        with self.assertRaises(ValueError):
+            SolutionFile(self.path, other_table)
+        data = self.path.read_bytes()
+        for damaged in (data[:-1], b"PNG" + data[3:], data[:10]):
+            self.path.write_bytes(damaged)
+            with self.subTest(damaged=damaged), self.assertRaises(ValueError):
+                SolutionFile(self.path, self.table)
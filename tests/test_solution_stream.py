@@ -0,0 +1,76 @@
+import threading
+import unittest
+from collections.abc import Generator
+
+from pyramide.solution_stream import SolutionStream
+
+
+def count_to(n: int) -> Generator[int, None, int]:
+    yield from range(n)
+    return n
+
+
+def count_forever(start: int) -> Generator[int]:
+    while True:
+        yield start
+        start += 1
+
+
+def fail(n: int) -> Generator[int]:
+    yield n
+    raise ValueError(n)
+
+
+class TestSolutionStream(unittest.TestCase):
+    def test_yields_all_items(self) -> None:
+        done: list[int] = []
+        items = list(
+            SolutionStream(max_workers=2).run(count_to, [3, 5, 0], done.append)
+        )
+        self.assertEqual(sorted(items), [0, 0, 1, 1, 2, 2, 3, 4])
+        self.assertEqual(sorted(done), [0, 3, 5])
+
+    def test_small_queue(self) -> None:
+        stream = SolutionStream(max_queued=1, max_workers=2)
+        self.assertEqual(len(list(stream.run(count_to, [200, 200]))), 400)
+
+    def test_stop_early(self) -> None:
+        stream = SolutionStream(max_queued=2, max_workers=2)
+        items = stream.run(count_forever, [0, 1000, 2000])
+        first = [next(items) for _ in range(10)]
+        items.close()
+        self.assertEqual(len(first), 10)
+
+    def test_cancel(self) -> None:
+        cancel = threading.Event()
+        with SolutionStream(max_queued=2, max_workers=2) as stream:
+            items = []
+            for item in stream.run(count_forever, [0, 1000], cancel=cancel):
+                items.append(item)
+                if len(items) == 5:
+                    cancel.set()
+            self.assertGreaterEqual(len(items), 5)
+            self.assertEqual(sorted(stream.run(count_to, [2])), [0, 1])
+
+    def test_reused_workers(self) -> None:
+        with SolutionStream(max_queued=2, max_workers=2) as stream:
+            items = stream.run(count_forever, [0, 1000])
+            next(items)
+            items.close()
+            self.assertEqual(sorted(stream.run(count_to, [2, 3])), [0, 0, 1, 1, 2])
+
+    def test_one_run_at_a_time(self) -> None:
+        with SolutionStream(max_workers=1) as stream:
+            items = stream.run(count_to, [3])
+            next(items)
+            with self.assertRaises(RuntimeError):
+                next(stream.run(count_to, [3]))
+            items.close()
+
+    def test_task_error(self) -> None:
+        with self.assertRaises(ValueError):
+            list(SolutionStream(max_workers=1).run(fail, [1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
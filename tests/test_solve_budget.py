@@ -0,0 +1,23 @@
+import unittest
+
+from pyramide.solve_budget import (
+    COMPLETE,
+    MAX_NODES,
+    SolveBudget,
+    SolveResult,
+)
+
+
+class TestSolveBudget(unittest.TestCase):
+    def test_limits_must_be_positive(self) -> None:
+        for limits in ({"max_nodes": 0}, {"max_seconds": -1}, {"max_solutions": 0}):
+            with self.subTest(limits=limits), self.assertRaises(ValueError):
+                SolveBudget(**limits)
+
+    def test_result_complete(self) -> None:
+        self.assertTrue(SolveResult([], COMPLETE, None).complete)
+        self.assertFalse(SolveResult([], MAX_NODES, "token").complete)
+
+
+if __name__ == "__main__":
+    unittest.main()
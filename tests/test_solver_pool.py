@@ -0,0 +1,90 @@
+import unittest
+
+from pyramide.color import Color
+from pyramide.game import Game
+from pyramide.game_board import GameBoard
+from pyramide.game_position import GamePosition
+from pyramide.placement_table import PlacementTable
+from pyramide.solver_pool import SolverPool, TaskResult
+from pyramide.transposition_table import TranspositionTable
+from tests.fixtures import grid, l_pieces
+
+
+class TestSolverPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board = grid()
+        self.pieces = [piece for piece in l_pieces() if piece.color != Color.yellow]
+        self.table = PlacementTable(self.pieces, self.board)
+
+    def game(self, removed: set[GamePosition]) -> Game:
+        board = GameBoard(self.board.position_set - removed)
+        return Game(self.pieces, board, {}, self.table)
+
+    def test_pool_serves_many_games(self) -> None:
+        games = [
+            self.game({GamePosition(x, 0) for x in range(4)}),
+            self.game({GamePosition(0, y) for y in range(4)}),
+            self.game({GamePosition(3, y) for y in range(4)}),
+        ]
+        with SolverPool(self.table, max_workers=2) as pool:
+            for game in games:
+                expected = set(game.solve())
+                self.assertGreater(len(expected), 0)
+                self.assertEqual(
+                    set(game.solve(parallel=True, split_depth=1, pool=pool)),
+                    expected,
+                )
+                self.assertGreater(len(game.stats.worker_busy_time), 0)
+
+    def test_counts(self) -> None:
+        game = self.game({GamePosition(x, 0) for x in range(4)})
+        setup = game.search_setup()
+        tasks = list(game.search_core().frontier(1))
+        with SolverPool(self.table, max_workers=2) as pool:
+            solutions = list(pool.solutions(setup, tasks))
+            self.assertEqual(sum(pool.counts(setup, tasks)), len(solutions))
+
+    def test_worker_keeps_transposition_table(self) -> None:
+        board = GameBoard(
+            self.board.position_set - {GamePosition(x, 0) for x in range(4)}
+        )
+        game = Game(
+            self.pieces, board, {}, self.table, TranspositionTable(store_counts=True)
+        )
+        task = next(game.search_core().frontier(1))
+        results: list[TaskResult | None] = []
+        with SolverPool(self.table, max_workers=1) as pool:
+            counts = list(
+                pool.counts(game.search_setup(), [task, task], results.append)
+            )
+        self.assertEqual(counts[0], counts[1])
+        # the second task finds the whole sub-problem in the worker's table
+        second = results[1]
+        assert second is not None and second[2] is not None
+        self.assertEqual((second[2].hits, second[2].misses), (1, 0))
+
+    def test_stopped_solve_does_not_leak_into_next(self) -> None:
+        game = self.game({GamePosition(x, 0) for x in range(4)})
+        expected = set(game.solve())
+        with SolverPool(self.table, max_workers=2, max_queued=1) as pool:
+            solutions = game.solve(parallel=True, split_depth=1, pool=pool)
+            next(solutions)
+            solutions.close()
+            self.assertEqual(
+                set(game.solve(parallel=True, split_depth=1, pool=pool)), expected
+            )
+
+    def test_pool_of_other_table(self) -> None:
+        game = self.game({GamePosition(x, 0) for x in range(4)})
+        pool = SolverPool(PlacementTable(self.pieces, self.board))
+        with self.assertRaises(ValueError):
+            next(game.solve(parallel=True, pool=pool))
+
+    def test_pool_needs_bitboard_engine(self) -> None:
+        game = self.game({GamePosition(x, 0) for x in range(4)})
+        with self.assertRaises(ValueError):
+            next(game.solve(parallel=True, engine="dlx", pool=SolverPool(self.table)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from pyramide.game import Game
+from pyramide.game_position import GamePosition
+from pyramide.placement_table import PlacementTable
+from pyramide.symmetry import BoardSymmetry
+from pyramide.transposition_table import TranspositionTable
+from tests.fixtures import grid, l_pieces
+
+
+class TestBoardSymmetry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board = grid()
+        self.pieces = l_pieces()
+        self.table = PlacementTable(self.pieces, self.board)
+
+    def test_square_has_eight_symmetries(self) -> None:
+        symmetry = BoardSymmetry(self.table, self.table.cell_index.full_mask, 0b1111)
+        self.assertEqual(len(symmetry), 8)
+
+    def test_rectangle_has_four_symmetries(self) -> None:
+        free = self.table.cell_index.to_mask(
+            {GamePosition(x, y) for x in range(4) for y in range(2)}
+        )
+        self.assertEqual(len(BoardSymmetry(self.table, free, 0b1111)), 4)
+
+    def test_canonical_placements(self) -> None:
+        symmetry = BoardSymmetry(self.table, self.table.cell_index.full_mask, 0b1111)
+        bar = self.pieces[3]
+        canonical = symmetry.canonical_placement_ids(self.table.placement_ids[bar])
+        # a border row and a middle row
+        self.assertEqual(len(canonical), 2)
+
+    def test_break_symmetry_finds_all_solutions(self) -> None:
+        game = Game(self.pieces, self.board, {})
+        expected = set(game.solve(engine="bitboard"))
+        nodes = game.stats.nodes
+
+        game = Game(self.pieces, self.board, {})
+        solutions = list(game.solve(engine="bitboard", break_symmetry=True))
+        self.assertEqual(len(solutions), len(expected))
+        self.assertEqual(set(solutions), expected)
+        self.assertLess(game.stats.nodes, nodes)
+
+    def test_one_solution_per_symmetry_group(self) -> None:
+        game = Game(self.pieces, self.board, {})
+        solutions = list(
+            game.solve(engine="bitboard", break_symmetry=True, expand_symmetry=False)
+        )
+        self.assertEqual(len(solutions), 48 // 8)
+
+    def test_break_symmetry_with_transposition_table(self) -> None:
+        transposition_table = TranspositionTable()
+        game = Game(self.pieces, self.board, {}, None, transposition_table)
+        restricted = set(game.solve(engine="bitboard", break_symmetry=True))
+        self.assertEqual(set(game.solve(engine="bitboard")), restricted)
+
+    def test_break_symmetry_needs_bitboard_engine(self) -> None:
+        game = Game(self.pieces, self.board, {})
+        with self.assertRaises(ValueError):
+            next(game.solve(engine="dlx", break_symmetry=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import pickle
+import unittest
+
+from pyramide.transposition_table import TranspositionTable
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def test_dead_sub_problems(self) -> None:
+        table = TranspositionTable()
+        self.assertIsNone(table.get(0b1010, 0b11))
+        table.store(0b1010, 0b11, 0)
+        table.store(0b1111, 0b11, 5)
+        self.assertEqual(table.get(0b1010, 0b11), 0)
+        self.assertIsNone(table.get(0b1111, 0b11))
+        self.assertEqual((table.hits, table.misses), (1, 2))
+
+    def test_store_counts(self) -> None:
+        table = TranspositionTable(store_counts=True)
+        table.store(0b1111, 0b11, 5)
+        self.assertEqual(table.get(0b1111, 0b11), 5)
+
+    def test_lru_eviction(self) -> None:
+        table = TranspositionTable(max_entries=2)
+        table.store(1, 0, 0)
+        table.store(2, 0, 0)
+        table.get(1, 0)
+        table.store(3, 0, 0)
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.evictions, 1)
+        self.assertIsNone(table.get(2, 0))
+        self.assertEqual(table.get(1, 0), 0)
+
+    def test_invalid_max_entries(self) -> None:
+        with self.assertRaises(ValueError):
+            TranspositionTable(max_entries=0)
+
+    def test_pickle_keeps_settings_only(self) -> None:
+        table = TranspositionTable(max_entries=7)
+        table.store(1, 0, 0)
+        copy = pickle.loads(pickle.dumps(table))
+        self.assertEqual(copy.max_entries, 7)
+        self.assertEqual(len(copy), 0)
+
+    def test_add_counters(self) -> None:
+        table = TranspositionTable()
+        other = TranspositionTable()
+        other.get(1, 0)
+        table.add_counters(other)
+        table.add_counters(other)
+        self.assertEqual(table.misses, 2)
+        table.reset_counters()
+        self.assertEqual(table.misses, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
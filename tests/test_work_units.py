@@ -0,0 +1,113 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from pyramide.game import Game
+from pyramide.game_board import GameBoard
+from pyramide.game_position import GamePosition
+from pyramide.work_units import (
+    export_work_units,
+    main,
+    merge_work_results,
+    problem_from_json,
+    problem_id,
+    problem_to_json,
+    solve_work_unit,
+)
+from tests.fixtures import grid, l_pieces
+
+
+class TestWorkUnits(unittest.TestCase):
+    def setUp(self) -> None:
+        board = grid()
+        pieces = l_pieces()
+        bar = frozenset(GamePosition(x, 0) for x in range(4))
+        self.game = Game(pieces, GameBoard(board.position_set - bar), {pieces[3]: bar})
+        self.directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+
+    def solve_all(self, manifest_path: Path) -> list[Path]:
+        result_paths = []
+        for unit_name in json.loads(manifest_path.read_text())["units"]:
+            result_path = self.directory / f"result-{unit_name}"
+            solve_work_unit(self.directory / unit_name, result_path)
+            result_paths.append(result_path)
+        return result_paths
+
+    def test_problem_round_trip(self) -> None:
+        problem = problem_to_json(self.game)
+        game = problem_from_json(json.loads(json.dumps(problem)))
+        self.assertEqual(problem_to_json(game), problem)
+        self.assertEqual(problem_id(problem_to_json(game)), problem_id(problem))
+        self.assertEqual(set(game.solve()), set(self.game.solve()))
+
+    def test_export_solve_merge(self) -> None:
+        expected = set(self.game.solve())
+        manifest_path = export_work_units(self.game, 2, self.directory)
+        result_paths = self.solve_all(manifest_path)
+        self.assertGreater(len(result_paths), 1)
+        output_path = self.directory / "solutions.jsonl"
+        solution_count = merge_work_results(manifest_path, result_paths, output_path)
+        self.assertEqual(solution_count, len(expected))
+        lines = output_path.read_text().splitlines()
+        self.assertEqual(len(lines), len(expected))
+        for line in lines:
+            self.assertEqual(len(json.loads(line)), 4)
+
+    def test_missing_result(self) -> None:
+        manifest_path = export_work_units(self.game, 2, self.directory)
+        result_paths = self.solve_all(manifest_path)
+        with self.assertRaisesRegex(ValueError, "without result"):
+            merge_work_results(
+                manifest_path, result_paths[1:], self.directory / "out.jsonl"
+            )
+
+    def test_duplicate_result(self) -> None:
+        manifest_path = export_work_units(self.game, 2, self.directory)
+        result_paths = self.solve_all(manifest_path)
+        with self.assertRaisesRegex(ValueError, "more than one"):
+            merge_work_results(
+                manifest_path,
+                [*result_paths, result_paths[0]],
+                self.directory / "out.jsonl",
+            )
+
+    def test_result_of_other_problem(self) -> None:
+        manifest_path = export_work_units(self.game, 2, self.directory / "a")
+        other = Game(self.game.pieces, self.game.placement_table.board, {})
+        other_manifest_path = export_work_units(other, 1, self.directory / "b")
+        unit_name = json.loads(other_manifest_path.read_text())["units"][0]
+        result_path = self.directory / "other.json"
+        solve_work_unit(self.directory / "b" / unit_name, result_path)
+        with self.assertRaisesRegex(ValueError, "another problem"):
+            merge_work_results(
+                manifest_path, [result_path], self.directory / "out.jsonl"
+            )
+
+    def test_command(self) -> None:
+        problem_path = self.directory / "problem.json"
+        problem_path.write_text(json.dumps(problem_to_json(self.game)))
+        units = self.directory / "units"
+        main(["export", str(problem_path), str(units), "--depth", "1"])
+        manifest = json.loads((units / "manifest.json").read_text())
+        results = []
+        for unit_name in manifest["units"]:
+            results.append(str(self.directory / "results" / unit_name))
+            main(["solve", str(units / unit_name), results[-1]])
+        output_path = self.directory / "merged" / "out.jsonl"
+        main(
+            [
+                "merge",
+                str(units / "manifest.json"),
+                *results,
+                "--output",
+                str(output_path),
+            ]
+        )
+        self.assertEqual(
+            len(output_path.read_text().splitlines()), len(set(self.game.solve()))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()